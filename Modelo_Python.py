@@ -1,85 +1,13 @@
-import numpy as np
 import pandas as pd
 
-np.random.seed(123)
-
-n = 800
-
-# -------------------------
-# VARIABLES PSICOLÓGICAS
-# -------------------------
-stress = np.random.randint(1, 6, n)
-burnout = np.random.randint(1, 6, n)
-anxiety = np.random.randint(1, 6, n)
-depression = np.random.randint(1, 6, n)
-support_supervisor = np.random.randint(1, 6, n)
-support_coworkers = np.random.randint(1, 6, n)
-leave_difficulty = np.random.randint(1, 6, n)
-
-# -------------------------
-# VARIABLES HRIS
-# -------------------------
-age = np.random.randint(20, 60, n)
-tenure = np.random.randint(0, 15, n)
-absenteeism = np.random.randint(0, 80, n)
-performance = np.random.randint(50, 100, n)
-promotion = np.random.choice([0,1], n, p=[0.8, 0.2])
-
-departments = ["Operaciones", "Ventas", "IT", "RRHH", "Finanzas"]
-department = np.random.choice(departments, n)
-
-# -------------------------
-# VARIABLES OPERATIVAS
-# -------------------------
-workload = np.random.randint(60, 150, n)
-task_completion = np.random.randint(50, 100, n)
-error_rate = np.random.randint(0, 20, n)
-
-# -------------------------
-# RIESGO REALISTA + RUIDO CONTROLADO
-# -------------------------
-base_risk = (
-    0.35 * (burnout/5) +
-    0.25 * (stress/5) +
-    0.20 * (workload/150) +
-    0.10 * (absenteeism/80) +
-    0.10 * (anxiety/5)
-)
-
-# Ruido controlado para evitar perfección
-noise = np.random.normal(0, 0.05, n)
-
-risk_score = np.clip(base_risk + noise, 0, 1)
-
-risk_level = pd.cut(
-    risk_score,
-    bins=[0, 0.33, 0.66, 1],
-    labels=["Bajo", "Medio", "Alto"]
-)
+from core.data import generate_extended_employees
+from core.histograms import BinnedHistogram
 
 # -------------------------
-# DATAFRAME FINAL
+# DATASET: VARIABLES PSICOLÓGICAS, HRIS Y OPERATIVAS
+# (generador compartido en core/data.py)
 # -------------------------
-df = pd.DataFrame({
-    "stress": stress,
-    "burnout": burnout,
-    "anxiety": anxiety,
-    "depression": depression,
-    "support_supervisor": support_supervisor,
-    "support_coworkers": support_coworkers,
-    "leave_difficulty": leave_difficulty,
-    "age": age,
-    "tenure": tenure,
-    "absenteeism": absenteeism,
-    "performance": performance,
-    "promotion": promotion,
-    "department": department,
-    "workload": workload,
-    "task_completion": task_completion,
-    "error_rate": error_rate,
-    "risk_score": risk_score,
-    "risk_level": risk_level
-})
+df = generate_extended_employees(n=800, seed=123)
 
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import OneHotEncoder
@@ -143,7 +71,7 @@ st.plotly_chart(fig_dep, use_container_width=True)
 # ===================== DISTRIBUCIÓN DE RIESGO =====================
 st.header("Distribución del Riesgo")
 
-fig_hist = px.histogram(df, x="risk_score", nbins=20)
+fig_hist = BinnedHistogram.from_data(df, "risk_score", bins=20).figure(by_level=False)
 st.plotly_chart(fig_hist, use_container_width=True)
 
 # ===================== IMPORTANCIA DE VARIABLES =====================
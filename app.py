@@ -1,1456 +1,100 @@
+import json
+import os
+import time
+
+_import_start = time.perf_counter()
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from sklearn.model_selection import train_test_split
-from sklearn.compose import ColumnTransformer
-from sklearn.ensemble import RandomForestClassifier
-import base64
-from pathlib import Path
 from textwrap import dedent
 
-# ============================================
-# CONFIGURACIÓN GENERAL
-# ============================================
-
-st.set_page_config(page_title="Impulso — Bienestar y Riesgo", layout="wide")
-
-# ============================================
-# CONFIG DE GRÁFICOS (VISIBILIDAD DE TEXTO)
-# ============================================
-
-def apply_plotly_style(fig, font_color="#16337b", grid_color="#e6e6e6"):
-    fig.update_layout(
-        template="plotly_white",
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=font_color, size=14),
-        legend=dict(font=dict(color=font_color), title_font=dict(color=font_color)),
-        transition=dict(duration=500, easing="cubic-in-out"),
-    )
-    fig.update_xaxes(
-        title_font=dict(color=font_color),
-        tickfont=dict(color=font_color),
-        showgrid=True,
-        gridcolor=grid_color,
-        zeroline=False,
-    )
-    fig.update_yaxes(
-        title_font=dict(color=font_color),
-        tickfont=dict(color=font_color),
-        showgrid=True,
-        gridcolor=grid_color,
-        zeroline=False,
-    )
-    return fig
-
-
-def render_dash_card(title, value, sub, delta, icon_text="I", icon_bg="#e8f4fb", accent="#25b5e8"):
-    st.markdown(
-        f"""
-<div class='dash-card'>
-    <div class='dash-delta' style='color:{accent};'>{delta}</div>
-    <div class='dash-icon' style='background:{icon_bg}; color:{accent};'>{icon_text}</div>
-    <div class='dash-title'>{title}</div>
-    <div class='dash-value'>{value}</div>
-    <div class='dash-sub'>{sub}</div>
-</div>
-        """,
-        unsafe_allow_html=True
-    )
+from core.aggregates import level_distribution
+from core.alerts import format_elapsed
+from core.absenteeism import ABSENTEEISM_PATH
+from core.data import RISK_LEVELS, employee_filter_mask, file_version
+from core.database import SQL_BACKEND
+from core.export import EXPORT_BACKGROUND_ROWS, build_dashboard_html, export_report, iter_export_chunks, new_export_dir
+from core.resources import (
+    get_alert_engine,
+    get_dashboard_kpis,
+    get_department_metrics,
+    get_drift_report,
+    get_employee_db,
+    get_employee_store,
+    get_export_executor,
+    get_fast_scorer,
+    get_kpi_store,
+    get_model_server,
+    get_quality_report,
+    get_risk_ranking,
+    get_scatter_index,
+    get_segment_silhouettes,
+    get_segments,
+    get_simulator,
+    load_employees,
+    read_employees,
+)
+from core.quality import profile_table
+from core.segmentation import SEGMENT_FEATURE_NAMES, SILHOUETTE_SAMPLE, summarize_segments
+from core.styling import (
+    TAB_NAMES,
+    apply_global_styles,
+    apply_plotly_style,
+    load_logo_base64,
+    render_dash_card,
+    render_top_bar,
+)
+from core.startup import startup_report
+from core.survey import SURVEY_PATH
 
+startup_report.record("imports", time.perf_counter() - _import_start)
 
 # ============================================
-# LOGO
+# CONFIGURACIÓN GENERAL
 # ============================================
 
-APP_DIR = Path(__file__).resolve().parent
-
-
-def load_logo_base64():
-    candidates = [
-        "Herramienta.png",
-        "herramienta.png",
-        "Herramienta.PNG",
-        "herramienta.PNG",
-    ]
-    for name in candidates:
-        path = APP_DIR / name
-        if path.exists():
-            return base64.b64encode(path.read_bytes()).decode("utf-8")
-
-    for path in APP_DIR.iterdir():
-        if path.is_file() and path.stem.lower() == "herramienta" and path.suffix.lower() in {".png", ".jpg", ".jpeg", ".svg"}:
-            return base64.b64encode(path.read_bytes()).decode("utf-8")
-    return ""
-
+st.set_page_config(page_title="Impulso — Bienestar y Riesgo", layout="wide")
 
 logo_b64 = load_logo_base64()
 
-# ============================================
-# ESTILOS GLOBALES IMPULSO
-# ============================================
-
-st.markdown("""
-<style>
-
-    /* FONDO TRANSPARENTE (LIMPIO) */
-    html, body, .stApp {
-        background: transparent !important;
-        font-family: 'Montserrat', sans-serif;
-    }
-
-    .stAppViewContainer, .main, .block-container {
-        background: transparent !important;
-    }
-
-    /* SUAVE GRADIENTE MUY SUTIL (casi invisible) */
-    .stApp::before {
-        content: "";
-        position: fixed;
-        inset: 0;
-        background: radial-gradient(1200px 600px at 10% 0%, rgba(37,181,232,0.06), transparent 60%),
-                    radial-gradient(900px 500px at 90% 10%, rgba(22,51,123,0.05), transparent 60%);
-        pointer-events: none;
-        z-index: 0;
-    }
-
-    .block-container { position: relative; z-index: 1; }
-
-    /* ELIMINAR TODA LA SEPARACIÓN SUPERIOR */
-    header[data-testid="stHeader"] {
-        display: none !important;
-    }
-
-    .stAppViewContainer {
-        padding-top: 0 !important;
-        margin-top: 0 !important;
-    }
-
-    .main {
-        padding-top: 0 !important;
-        margin-top: 0 !important;
-    }
-
-    .block-container {
-        padding-top: 0 !important;
-        margin-top: 0 !important;
-    }
-
-    /* FONDO GENERAL */
-
-    /* TOP BAR FULL WIDTH */
-    .top-nav {
-        background-color: #16337b;
-        padding: 24px 40px;
-        color: white;
-        font-size: 34px;
-        font-weight: 700;
-        border-radius: 0 0 16px 16px;
-        margin-bottom: 25px;
-
-        width: 100vw !important;
-        margin-left: calc(-50vw + 50%) !important;
-
-        display: flex;
-        justify-content: flex-start;
-        align-items: center;
-        gap: 14px;
-
-        box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-    }
-
-    .top-nav-right {
-        font-size: 16px;
-        font-weight: 400;
-        opacity: 0.9;
-    }
-
-    .logo-mark {
-        height: 44px;
-        width: auto;
-        display: block;
-    }
-
-    /* TABS */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        background-color: transparent;
-        padding-left: 0;
-    }
-
-    .stTabs [data-baseweb="tab"] {
-        background-color: #16337b !important;
-        color: white !important;
-        padding: 10px 18px !important;
-        border-radius: 10px 10px 0 0 !important;
-        font-weight: 600 !important;
-        border: none !important;
-        transition: all 0.25s ease-in-out;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.12);
-    }
-
-    .stTabs [data-baseweb="tab"]:hover {
-        background-color: #1d449c !important;
-    }
-
-    .stTabs [aria-selected="true"] {
-        background-color: white !important;
-        color: #16337b !important;
-        border-bottom: 3px solid #16337b !important;
-    }
-
-    /* KPI CARDS */
-    .kpi-card {
-        background: white;
-        padding: 18px 20px;
-        border-radius: 14px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-        border-top: 4px solid #25b5e8;
-        height: 130px;
-        transition: transform 0.25s ease, box-shadow 0.25s ease;
-    }
-
-    .kpi-card:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 8px 20px rgba(0,0,0,0.15);
-    }
-
-    /* ENTRADA ANIMADA EN CARDS */
-    .kpi-card, .rec-card, .rec-summary-box, .alert-box, .dash-card, .alert-strip {
-        animation: floatIn 0.6s ease both;
-    }
-
-    .kpi-title {
-        font-size: 13px;
-        color: #555;
-        font-weight: 600;
-    }
-
-    .kpi-value {
-        font-size: 30px;
-        font-weight: 700;
-        color: #16337b;
-        margin-top: 6px;
-    }
-
-    .kpi-sub {
-        font-size: 13px;
-        color: #25b5e8;
-        font-weight: 600;
-        margin-top: 2px;
-    }
-
-    /* DASHBOARD CARDS */
-    .dash-card {
-        background: white;
-        padding: 16px 18px;
-        border-radius: 14px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-        border: 1px solid #e9edf3;
-        min-height: 120px;
-        position: relative;
-        overflow: hidden;
-    }
-
-    .dash-icon {
-        width: 30px;
-        height: 30px;
-        border-radius: 9px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: 700;
-        font-size: 12px;
-        margin-bottom: 8px;
-    }
-
-    .dash-title {
-        font-size: 12px;
-        color: #555;
-        font-weight: 600;
-        margin-bottom: 6px;
-    }
-
-    .dash-value {
-        font-size: 22px;
-        font-weight: 700;
-        color: #16337b;
-    }
-
-    .dash-sub {
-        font-size: 12px;
-        color: #7a8aa0;
-        margin-top: 2px;
-    }
-
-    .dash-delta {
-        position: absolute;
-        top: 12px;
-        right: 14px;
-        font-size: 11px;
-        font-weight: 700;
-    }
-
-    /* STATUS CARDS (EMPLEADOS) */
-    .status-card {
-        background: white;
-        padding: 16px 18px;
-        border-radius: 14px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-        border: 1px solid #e9edf3;
-        min-height: 110px;
-    }
-
-    .status-title {
-        font-size: 12px;
-        color: #7a8aa0;
-        font-weight: 700;
-        letter-spacing: 0.04em;
-        text-transform: uppercase;
-    }
-
-    .status-pill {
-        display: inline-flex;
-        align-items: center;
-        gap: 8px;
-        font-size: 13px;
-        font-weight: 700;
-        color: #16337b;
-    }
-
-    .status-dot {
-        width: 10px;
-        height: 10px;
-        border-radius: 50%;
-        background: #2ecc71;
-        box-shadow: 0 0 0 4px rgba(46, 204, 113, 0.16);
-        display: inline-block;
-    }
-
-    .status-dot.inactive {
-        background: #b5b5b5;
-        box-shadow: 0 0 0 4px rgba(181, 181, 181, 0.18);
-    }
-
-    .status-value {
-        font-size: 28px;
-        font-weight: 700;
-        color: #16337b;
-        margin-top: 6px;
-    }
-
-    .status-sub {
-        font-size: 12px;
-        color: #7a8aa0;
-        margin-top: 2px;
-    }
-
-    /* EMPLEADOS */
-    .employee-card {
-        background: white;
-        padding: 12px 14px;
-        border-radius: 12px;
-        border: 1px solid #e9edf3;
-        box-shadow: 0 4px 10px rgba(0,0,0,0.06);
-        margin-bottom: 10px;
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        gap: 10px;
-    }
-
-    .employee-card.selected {
-        border-color: #25b5e8;
-        box-shadow: 0 6px 14px rgba(37,181,232,0.18);
-    }
-
-    .employee-left {
-        display: flex;
-        align-items: center;
-        gap: 10px;
-        min-width: 0;
-    }
-
-    .employee-avatar {
-        width: 38px;
-        height: 38px;
-        border-radius: 50%;
-        background: #edf3ff;
-        color: #16337b;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: 700;
-        font-size: 13px;
-        flex: 0 0 auto;
-        position: relative;
-    }
-
-    .presence-dot {
-        position: absolute;
-        right: -2px;
-        bottom: -2px;
-        width: 10px;
-        height: 10px;
-        border-radius: 50%;
-        background: #2ecc71;
-        border: 2px solid white;
-        box-shadow: 0 0 0 2px rgba(46, 204, 113, 0.18);
-    }
-
-    .presence-dot.inactive {
-        background: #b5b5b5;
-        box-shadow: 0 0 0 2px rgba(181, 181, 181, 0.2);
-    }
-
-    .employee-name {
-        font-size: 13px;
-        font-weight: 700;
-        color: #16337b;
-        white-space: nowrap;
-        overflow: hidden;
-        text-overflow: ellipsis;
-        max-width: 220px;
-    }
-
-    .employee-role {
-        font-size: 12px;
-        color: #7a8aa0;
-    }
-
-    .employee-list-scroll {
-        max-height: 520px;
-        overflow-y: auto;
-        padding-right: 6px;
-    }
-
-    .employee-list-scroll::-webkit-scrollbar {
-        width: 6px;
-    }
-
-    .employee-list-scroll::-webkit-scrollbar-thumb {
-        background: #cbd6e6;
-        border-radius: 999px;
-    }
-
-    .employee-list-scroll::-webkit-scrollbar-track {
-        background: transparent;
-    }
-
-    .risk-pill {
-        font-size: 11px;
-        padding: 3px 8px;
-        border-radius: 999px;
-        font-weight: 700;
-        display: inline-block;
-    }
-
-    .risk-low {
-        background: #e8f7f1;
-        color: #1f7a5c;
-    }
-
-    .risk-mid {
-        background: #fff4e8;
-        color: #8b6a00;
-    }
-
-    .risk-high {
-        background: #ffe9ee;
-        color: #a63545;
-    }
-
-    .profile-card {
-        background: white;
-        padding: 16px 18px;
-        border-radius: 14px;
-        border: 1px solid #e9edf3;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-        margin-bottom: 12px;
-    }
-
-    .profile-title {
-        font-size: 18px;
-        font-weight: 700;
-        color: #16337b;
-    }
-
-    .profile-sub {
-        font-size: 12px;
-        color: #7a8aa0;
-        margin-top: 2px;
-        margin-bottom: 8px;
-    }
-
-    /* FORM INPUTS */
-    .stTextInput label, .stSelectbox label, .stSlider label {
-        color: #16337b !important;
-        font-weight: 600 !important;
-    }
-
-    .stTextInput input {
-        color: #16337b !important;
-        background: #f5f7fb !important;
-        border: 1px solid #dbe3eb !important;
-    }
-
-    .stTextInput input::placeholder {
-        color: #7a8aa0 !important;
-        opacity: 1 !important;
-    }
-
-    .stSelectbox [data-baseweb="select"] > div {
-        background: #f5f7fb !important;
-        border-color: #dbe3eb !important;
-        color: #16337b !important;
-    }
-
-    .stSelectbox [data-baseweb="select"] span,
-    .stSelectbox [data-baseweb="select"] input {
-        color: #16337b !important;
-    }
-
-    /* MULTISELECT (SEGMENTACIÓN) */
-    .stMultiSelect label {
-        color: #16337b !important;
-        font-weight: 600 !important;
-    }
-
-    .stMultiSelect [data-baseweb="select"] > div {
-        background: #f5f7fb !important;
-        border-color: #dbe3eb !important;
-        color: #16337b !important;
-    }
-
-    .stMultiSelect [data-baseweb="select"] span,
-    .stMultiSelect [data-baseweb="select"] input {
-        color: #16337b !important;
-    }
-
-    .stMultiSelect [data-baseweb="tag"] {
-        background: #eaf0f6 !important;
-        color: #16337b !important;
-        border: 1px solid #d6e2ef !important;
-        box-shadow: none !important;
-    }
-
-    .stMultiSelect [data-baseweb="tag"] span,
-    .stMultiSelect [data-baseweb="tag"] svg {
-        color: #16337b !important;
-    }
-
-    /* ALERTAS */
-    .alert-box {
-        background-color: #dbe3eb;
-        padding: 12px 14px;
-        border-radius: 10px;
-        margin-bottom: 8px;
-        border-left: 6px solid #16337b;
-        font-size: 13px;
-        color: #16337b;
-        transition: transform 0.25s ease;
-    }
-
-    .alert-box:hover {
-        transform: translateX(6px);
-    }
-
-    .alert-strip {
-        border-radius: 10px;
-        padding: 10px 14px;
-        margin-bottom: 10px;
-        font-size: 13px;
-        border: 1px solid transparent;
-    }
-
-    .alert-danger {
-        background: #fff3f4;
-        border-color: #ff6b81;
-        color: #a63545;
-    }
-
-    .alert-warning {
-        background: #fff9e8;
-        border-color: #f2c94c;
-        color: #8b6a00;
-    }
-
-    .alert-info {
-        background: #f0f6ff;
-        border-color: #6aa6ff;
-        color: #1f4b8f;
-    }
-
-    /* TITULOS */
-    .section-title {
-        font-size: 22px;
-        font-weight: 700;
-        color: #16337b;
-        margin-top: 25px;
-        margin-bottom: 10px;
-    }
-
-    /* RECOMENDACIONES */
-    .rec-summary-box {
-        background: white;
-        padding: 18px;
-        border-radius: 14px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-        text-align: center;
-    }
-
-    .rec-summary-value {
-        font-size: 28px;
-        font-weight: 700;
-        color: #16337b;
-    }
-
-    .rec-summary-label {
-        font-size: 13px;
-        color: #777;
-        margin-top: -6px;
-    }
-
-    .rec-card {
-        background: white;
-        padding: 20px;
-        border-radius: 14px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-        margin-bottom: 15px;
-        border-left: 6px solid #25b5e8;
-        transition: transform 0.25s ease, box-shadow 0.25s ease;
-    }
-
-    .rec-card:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 8px 20px rgba(0,0,0,0.15);
-    }
-
-    .rec-title {
-        font-size: 18px;
-        font-weight: 700;
-        color: #16337b;
-        margin-bottom: 6px;
-    }
-
-    .rec-meta {
-        font-size: 13px;
-        color: #555;
-        margin-bottom: 10px;
-    }
-
-    .rec-description {
-        font-size: 14px;
-        color: #333;
-        margin-bottom: 12px;
-    }
-
-    .rec-tag {
-        display: inline-block;
-        background-color: #dbe3eb;
-        padding: 4px 10px;
-        border-radius: 8px;
-        font-size: 12px;
-        margin-right: 6px;
-        color: #16337b;
-        font-weight: 600;
-    }
-
-    /* SEGMENTACIÓN */
-    .seg-hero-card {
-        background: white;
-        border: 1px solid #e9edf3;
-        border-radius: 14px;
-        padding: 14px 16px;
-        min-height: 110px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.06);
-    }
-
-    .seg-hero-label {
-        font-size: 11px;
-        font-weight: 700;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-
-    .seg-hero-title {
-        font-size: 18px;
-        font-weight: 700;
-        margin-top: 6px;
-    }
-
-    .seg-hero-sub {
-        font-size: 12px;
-        color: #6f7f96;
-        margin-top: 2px;
-    }
-
-    .seg-hero-card.seg-risk {
-        background: #fff3f4;
-        border-color: #ffd3da;
-    }
-
-    .seg-hero-card.seg-risk .seg-hero-label,
-    .seg-hero-card.seg-risk .seg-hero-title {
-        color: #a63545;
-    }
-
-    .seg-hero-card.seg-sat {
-        background: #f1fbf5;
-        border-color: #cfeedd;
-    }
-
-    .seg-hero-card.seg-sat .seg-hero-label,
-    .seg-hero-card.seg-sat .seg-hero-title {
-        color: #1f7a5c;
-    }
-
-    .seg-hero-card.seg-cap {
-        background: #fff8e7;
-        border-color: #f5e0a6;
-    }
-
-    .seg-hero-card.seg-cap .seg-hero-label,
-    .seg-hero-card.seg-cap .seg-hero-title {
-        color: #8b6a00;
-    }
-
-    .seg-card {
-        background: white;
-        border: 1px solid #e9edf3;
-        border-radius: 14px;
-        padding: 14px 16px;
-        position: relative;
-        min-height: 175px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.06);
-    }
-
-    .seg-card-top {
-        display: flex;
-        align-items: center;
-        gap: 10px;
-    }
-
-    .seg-card-icon {
-        width: 34px;
-        height: 34px;
-        border-radius: 10px;
-        background: #edf3ff;
-        color: #16337b;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: 700;
-        font-size: 14px;
-    }
-
-    .seg-card-title {
-        font-size: 14px;
-        font-weight: 700;
-        color: #16337b;
-    }
-
-    .seg-card-sub {
-        font-size: 12px;
-        color: #7a8aa0;
-    }
-
-    .seg-risk-badge {
-        position: absolute;
-        top: 14px;
-        right: 16px;
-        width: 42px;
-        height: 42px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: 700;
-        font-size: 12px;
-        color: white;
-    }
-
-    .seg-risk-high {
-        background: #ff6b81;
-    }
-
-    .seg-risk-mid {
-        background: #f2c94c;
-        color: #714f00;
-    }
-
-    .seg-risk-low {
-        background: #2ecc71;
-    }
-
-    .seg-metrics {
-        display: grid;
-        grid-template-columns: repeat(2, minmax(0, 1fr));
-        gap: 8px 12px;
-        margin-top: 12px;
-        font-size: 12px;
-        color: #5d6c80;
-    }
-
-    .seg-metrics b {
-        display: block;
-        font-size: 13px;
-        color: #16337b;
-    }
-
-    .seg-sub-card {
-        background: white;
-        border: 1px solid #e9edf3;
-        border-radius: 12px;
-        padding: 14px 16px;
-    }
-
-    .seg-sub-title {
-        font-size: 13px;
-        font-weight: 700;
-        color: #16337b;
-        margin-bottom: 6px;
-    }
-
-    .seg-sub-row {
-        display: flex;
-        justify-content: space-between;
-        font-size: 12px;
-        color: #5d6c80;
-        margin-bottom: 4px;
-    }
-
-    .seg-progress {
-        height: 6px;
-        background: #e9edf3;
-        border-radius: 999px;
-        overflow: hidden;
-        margin-top: 8px;
-    }
-
-    .seg-progress-bar {
-        height: 100%;
-        background: #25b5e8;
-        border-radius: 999px;
-    }
-
-    .seg-capacity-high {
-        color: #a63545;
-        font-weight: 700;
-    }
-
-    .seg-capacity-ok {
-        color: #1f7a5c;
-        font-weight: 700;
-    }
-
-    /* FACTORES DE RIESGO */
-    .fr-summary {
-        background: #eef4ff;
-        border: 1px solid #d7e3ff;
-        border-radius: 14px;
-        padding: 14px 16px;
-        margin-bottom: 14px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.06);
-    }
-
-    .fr-summary-title {
-        font-size: 14px;
-        font-weight: 700;
-        color: #16337b;
-        margin-bottom: 4px;
-    }
-
-    .fr-summary-text {
-        font-size: 12px;
-        color: #5d6c80;
-        margin-bottom: 12px;
-    }
-
-    .fr-summary-grid {
-        display: grid;
-        grid-template-columns: repeat(4, minmax(0, 1fr));
-        gap: 8px;
-    }
-
-    .fr-summary-item {
-        background: white;
-        border: 1px solid #e9edf3;
-        border-radius: 12px;
-        padding: 10px 12px;
-        text-align: center;
-    }
-
-    .fr-summary-value {
-        font-size: 18px;
-        font-weight: 700;
-        color: #16337b;
-    }
-
-    .fr-summary-label {
-        font-size: 11px;
-        color: #7a8aa0;
-    }
-
-    .fr-factor-card {
-        border-radius: 14px;
-        padding: 14px 16px;
-        border: 1px solid #e9edf3;
-        min-height: 120px;
-        position: relative;
-    }
-
-    .fr-factor-top {
-        display: flex;
-        align-items: center;
-        gap: 10px;
-        margin-bottom: 6px;
-    }
-
-    .fr-icon {
-        width: 30px;
-        height: 30px;
-        border-radius: 10px;
-        background: white;
-        border: 1px solid #e9edf3;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 12px;
-        font-weight: 700;
-    }
-
-    .fr-factor-title {
-        font-size: 13px;
-        font-weight: 700;
-        color: #16337b;
-    }
-
-    .fr-factor-desc {
-        font-size: 12px;
-        color: #6f7f96;
-    }
-
-    .fr-factor-pct {
-        position: absolute;
-        right: 16px;
-        top: 14px;
-        font-weight: 700;
-        font-size: 16px;
-    }
-
-    .fr-detail-card {
-        border: 1px solid #e9edf3;
-        border-radius: 14px;
-        overflow: hidden;
-        margin-bottom: 12px;
-        background: white;
-    }
-
-    .fr-detail-header {
-        padding: 12px 16px;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        border-left: 4px solid transparent;
-    }
-
-    .fr-detail-title {
-        font-size: 14px;
-        font-weight: 700;
-        color: #16337b;
-    }
-
-    .fr-detail-sub {
-        font-size: 12px;
-        color: #6f7f96;
-    }
-
-    .fr-detail-pct {
-        font-size: 18px;
-        font-weight: 700;
-    }
-
-    .fr-metrics {
-        display: grid;
-        grid-template-columns: repeat(3, minmax(0, 1fr));
-        gap: 10px;
-        padding: 10px 16px 8px 16px;
-    }
-
-    .fr-metric-chip {
-        background: #f7f9fc;
-        border: 1px solid #e6edf5;
-        border-radius: 10px;
-        padding: 8px 10px;
-        font-size: 12px;
-        color: #5d6c80;
-    }
-
-    .fr-progress {
-        padding: 0 16px 12px 16px;
-    }
-
-    .fr-progress-track {
-        height: 8px;
-        background: #e9edf3;
-        border-radius: 999px;
-        overflow: hidden;
-        position: relative;
-    }
-
-    .fr-progress-bar {
-        height: 100%;
-        border-radius: 999px;
-    }
-
-    .fr-progress-label {
-        font-size: 11px;
-        color: #7a8aa0;
-        margin-top: 6px;
-        display: flex;
-        justify-content: space-between;
-    }
-
-    /* ANÁLISIS DE RIESGO */
-    .risk-card {
-        background: white;
-        border: 1px solid #e9edf3;
-        border-radius: 14px;
-        padding: 14px 16px;
-        min-height: 120px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.06);
-    }
-
-    .risk-card-top {
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        margin-bottom: 10px;
-    }
-
-    .risk-icon {
-        width: 34px;
-        height: 34px;
-        border-radius: 10px;
-        background: #edf3ff;
-        color: #16337b;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: 700;
-        font-size: 14px;
-    }
-
-    .risk-tag {
-        padding: 4px 10px;
-        border-radius: 999px;
-        font-size: 11px;
-        font-weight: 700;
-    }
-
-    .risk-tag.high {
-        background: #ffe9ee;
-        color: #a63545;
-    }
-
-    .risk-tag.med {
-        background: #fff4e8;
-        color: #8b6a00;
-    }
-
-    .risk-tag.low {
-        background: #e8f7f1;
-        color: #1f7a5c;
-    }
-
-    .risk-card-value {
-        font-size: 22px;
-        font-weight: 700;
-        color: #16337b;
-    }
-
-    .risk-card-label {
-        font-size: 12px;
-        color: #5d6c80;
-        margin-top: 4px;
-    }
-
-    .risk-card-sub {
-        font-size: 11px;
-        color: #7a8aa0;
-        margin-top: 2px;
-    }
-
-    .risk-panel {
-        background: white;
-        border: 1px solid #e9edf3;
-        border-radius: 14px;
-        padding: 14px 16px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.06);
-        margin-bottom: 16px;
-    }
-
-    .risk-panel-title {
-        font-size: 14px;
-        font-weight: 700;
-        color: #16337b;
-        margin-bottom: 10px;
-    }
-
-    .risk-table {
-        width: 100%;
-        border-collapse: separate;
-        border-spacing: 0 8px;
-    }
-
-    .risk-table th {
-        text-align: left;
-        font-size: 11px;
-        color: #7a8aa0;
-        font-weight: 700;
-        padding: 4px 10px;
-    }
-
-    .risk-table td {
-        background: #f7f9fc;
-        border: 1px solid #e6edf5;
-        padding: 10px 12px;
-        border-radius: 10px;
-        font-size: 12px;
-        color: #16337b;
-    }
-
-    .risk-chip {
-        padding: 3px 8px;
-        border-radius: 999px;
-        font-size: 11px;
-        font-weight: 700;
-        display: inline-block;
-    }
-
-    .risk-chip.high {
-        background: #ffe9ee;
-        color: #a63545;
-    }
-
-    .risk-chip.med {
-        background: #fff4e8;
-        color: #8b6a00;
-    }
-
-    .risk-chip.low {
-        background: #e8f7f1;
-        color: #1f7a5c;
-    }
-
-    .risk-anim {
-        animation: riseIn 0.65s ease both;
-    }
-
-    .risk-delay-1 { animation-delay: 0.05s; }
-    .risk-delay-2 { animation-delay: 0.12s; }
-    .risk-delay-3 { animation-delay: 0.18s; }
-    .risk-delay-4 { animation-delay: 0.24s; }
-
-    @keyframes riseIn {
-        from { opacity: 0; transform: translateY(10px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-
-    /* RECOMENDACIONES (ACORDEON) */
-    details.rec-accordion {
-        background: white;
-        border-radius: 14px;
-        border: 1px solid #e9edf3;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-        margin-bottom: 12px;
-        overflow: hidden;
-    }
-
-    details.rec-accordion[open] {
-        box-shadow: 0 8px 18px rgba(0,0,0,0.12);
-    }
-
-    details.rec-accordion > summary {
-        list-style: none;
-        cursor: pointer;
-        padding: 14px 18px;
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        gap: 14px;
-        font-weight: 700;
-        color: #16337b;
-    }
-
-    details.rec-accordion > summary::-webkit-details-marker {
-        display: none;
-    }
-
-    .rec-summary-left {
-        display: flex;
-        flex-direction: column;
-        gap: 4px;
-        min-width: 0;
-    }
-
-    .rec-summary-meta {
-        font-size: 12px;
-        color: #7a8aa0;
-        font-weight: 600;
-    }
-
-    .rec-priority {
-        padding: 4px 10px;
-        border-radius: 999px;
-        font-size: 11px;
-        font-weight: 700;
-        white-space: nowrap;
-    }
-
-    .priority-high {
-        background: #ffe9ee;
-        color: #a63545;
-    }
-
-    .priority-medium {
-        background: #fff4e8;
-        color: #8b6a00;
-    }
-
-    .priority-low {
-        background: #e8f7f1;
-        color: #1f7a5c;
-    }
-
-    .rec-details {
-        padding: 0 18px 16px 18px;
-        border-top: 1px solid #eef2f7;
-    }
-
-    .rec-details .rec-description {
-        margin: 10px 0 12px 0;
-        color: #333;
-        font-size: 14px;
-    }
-
-    .rec-tags {
-        margin-top: 10px;
-        margin-bottom: 6px;
-    }
-
-    .rec-meta-grid {
-        display: grid;
-        grid-template-columns: repeat(2, minmax(0, 1fr));
-        gap: 8px 18px;
-        font-size: 13px;
-        color: #555;
-    }
-
-    .rec-meta-grid b {
-        color: #16337b;
-    }
-
-    .owner-status {
-        display: inline-flex;
-        align-items: center;
-        gap: 6px;
-        font-weight: 600;
-        color: #16337b;
-    }
-
-    .owner-dot {
-        width: 10px;
-        height: 10px;
-        border-radius: 50%;
-        background: #2ecc71;
-        box-shadow: 0 0 0 3px rgba(46, 204, 113, 0.16);
-        display: inline-block;
-    }
-
-    .owner-dot.inactive {
-        background: #b5b5b5;
-        box-shadow: 0 0 0 3px rgba(181, 181, 181, 0.18);
-    }
-
-    /* TABLA EMPLEADOS */
-    .stDataFrame {
-        background-color: white !important;
-        border-radius: 14px !important;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.08) !important;
-        padding: 10px !important;
-    }
-
-    /* BOTONES */
-    .stButton>button {
-        background-color: #25b5e8;
-        color: white;
-        border-radius: 20px;
-        border: none;
-        padding: 6px 16px;
-        font-weight: 600;
-    }
-
-    /* ANIMACIÓN */
-    .fade-in {
-        animation: fadeIn 0.8s ease-in-out;
-    }
-
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(10px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-
-    @keyframes floatIn {
-        from { opacity: 0; transform: translateY(12px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-
-    /* ANIMACIÓN ENTRADA GRÁFICOS */
-    .stPlotlyChart {
-        animation: chartIn 0.7s ease both;
-    }
-
-    @keyframes chartIn {
-        from { opacity: 0; transform: translateY(12px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-
-    /* GRAFICOS TRANSPARENTES */
-    .js-plotly-plot .plotly .main-svg {
-        background: transparent !important;
-    }
-
-</style>
-""", unsafe_allow_html=True)
+apply_global_styles()
 
 # ============================================
-# 1. GENERAR DATASET
+# 1. DATASET
 # ============================================
 
-np.random.seed(123)
-n = 800
-
-stress = np.random.randint(1, 6, n)
-burnout = np.random.randint(1, 6, n)
-workload = np.random.randint(60, 150, n)
-absenteeism = np.random.randint(0, 80, n)
-anxiety = np.random.randint(1, 6, n)
-
-risk_score = (
-    0.35 * (burnout/5) +
-    0.25 * (stress/5) +
-    0.20 * (workload/150) +
-    0.10 * (absenteeism/80) +
-    0.10 * (anxiety/5) +
-    np.random.normal(0, 0.05, n)
-)
-
-risk_score = np.clip(risk_score, 0, 1)
-
-risk_level = pd.cut(
-    risk_score,
-    bins=[0, 0.33, 0.66, 1],
-    labels=["Bajo", "Medio", "Alto"]
-)
-
-departments = np.random.choice(
-    ["Operaciones", "Ventas", "IT", "RRHH", "Finanzas"],
-    size=n,
-    p=[0.3, 0.25, 0.2, 0.15, 0.1]
-)
-
-performance = np.random.normal(80, 8, n)
-performance = np.clip(performance, 40, 100)
-
-df = pd.DataFrame({
-    "department": departments,
-    "stress": stress,
-    "burnout": burnout,
-    "workload": workload,
-    "absenteeism": absenteeism,
-    "anxiety": anxiety,
-    "risk_score": risk_score,
-    "risk_level": risk_level,
-    "performance": performance
-})
-
-# Metadatos simulados de empleados
-first_names = [
-    "Ana", "Luis", "Carlos", "María", "Jorge", "Sofía", "Diego", "Lucía", "Pedro", "Valeria",
-    "Miguel", "Carmen", "Fernando", "Paula", "Raúl", "Elena", "Javier", "Gabriela", "Andrés", "Natalia"
-]
-last_names = [
-    "García", "Martínez", "López", "Hernández", "González", "Pérez", "Sánchez", "Romero", "Torres", "Vega",
-    "Ruiz", "Flores", "Castro", "Ríos", "Mendoza", "Ortega", "Núñez", "Navarro", "Silva", "Morales"
-]
-roles_by_dept = {
-    "Operaciones": ["Supervisor de Producción", "Coordinador de Operaciones", "Analista de Procesos"],
-    "Ventas": ["Ejecutivo de Ventas", "Consultor Comercial", "Key Account"],
-    "IT": ["Desarrollador Senior", "Analista de Datos", "Ingeniero de Sistemas"],
-    "RRHH": ["Analista de RRHH", "Business Partner", "Especialista en Bienestar"],
-    "Finanzas": ["Analista Financiero", "Controller", "Planeación Financiera"],
-}
-
-name_rng = np.random.default_rng(321)
-first = name_rng.choice(first_names, n)
-last = name_rng.choice(last_names, n)
-df["employee_name"] = [f"{f} {l}" for f, l in zip(first, last)]
-df["employee_role"] = [name_rng.choice(roles_by_dept[d]) for d in df["department"]]
-df["employee_id"] = np.arange(1, n + 1)
-status_rng = np.random.default_rng(2026)
-df["active_status"] = status_rng.choice(["Activo", "Inactivo"], size=n, p=[0.86, 0.14])
+with startup_report.phase("datos"):
+    df, data_version = load_employees()
 
 # ============================================
-# 2. ENTRENAR MODELO
+# 2. MODELO
 # ============================================
 
-X = df[["stress", "burnout", "workload", "absenteeism", "anxiety"]]
-y = df["risk_level"]
-
-preprocess = ColumnTransformer([
-    ("num", "passthrough", X.columns)
-])
-
-X_processed = preprocess.fit_transform(X)
-
-X_train, X_test, y_train, y_test = train_test_split(
-    X_processed, y, test_size=0.3, random_state=123, stratify=y
-)
-
-rf = RandomForestClassifier(n_estimators=600, random_state=123)
-rf.fit(X_train, y_train)
+with startup_report.phase("modelo"):
+    model_server = get_model_server(df, data_version)
+    # Instantánea fija para todo el rerun aunque un reentrenamiento la reemplace:
+    # la clave de caché sale de la misma lectura que el modelo
+    (preprocess, X_processed, rf), model_generation = model_server.snapshot()
+startup_report.log_once()
+
+model_version = f"{data_version}-{model_generation}"
+alert_engine = get_alert_engine(df, data_version)
+# Con IMPULSO_SQL_BACKEND=1 la pestaña Empleados consulta SQLite en lugar del frame
+employee_db = get_employee_db(df, data_version) if SQL_BACKEND else None
+employee_store = get_employee_store(df, data_version) if employee_db is None else None
+risk_ranking = get_risk_ranking(df, data_version) if employee_db is None else None
+departments = employee_db.departments() if employee_db is not None else sorted(df["department"].unique())
 
 # ============================================
 # 3. TOP BAR
 # ============================================
 
-if logo_b64:
-    header_html = f"""
-<div class='top-nav'>
-    <img src="data:image/png;base64,{logo_b64}" class="logo-mark" alt="Impulso" />
-</div>
-"""
-else:
-    header_html = """
-<div class='top-nav'>
-    <div>Impulso</div>
-</div>
-"""
-
-st.markdown(header_html, unsafe_allow_html=True)
+render_top_bar(logo_b64)
 
-tabs = st.tabs([
-    "Dashboard",
-    "Empleados",
-    "Análisis de Riesgo",
-    "Factores de Riesgo",
-    "Segmentación",
-    "Recomendaciones"
-])
+tabs = st.tabs(TAB_NAMES)
 
 # ============================================
 # 4. DASHBOARD
@@ -1465,7 +109,7 @@ with tabs[0]:
     with h_right:
         a1, a2 = st.columns([1, 1])
         with a1:
-            st.button("Exportar Reporte", key="dash_export")
+            export_clicked = st.button("Exportar Reporte", key="dash_export")
         with a2:
             st.selectbox(
                 "Periodo",
@@ -1474,60 +118,84 @@ with tabs[0]:
                 key="dash_period"
             )
 
-    perf_avg = float(df["performance"].mean())
-    high_risk_pct = float((df["risk_level"] == "Alto").mean() * 100)
-    avg_risk = float(df["risk_score"].mean())
-    workload_avg = float(df["workload"].mean())
-    rotation = float(df["absenteeism"].mean() / 80 * 20)
-    productivity = float(np.clip(perf_avg + 6, 0, 100))
-    compliance = float((df["performance"] >= 85).mean() * 100)
-    overload_index = float(workload_avg / 150 * 100)
-    tasks_done = int((perf_avg / 100) * 3000)
-    efficiency = float(np.clip(100 - df["stress"].mean() * 8, 0, 100))
-
-    if avg_risk < 0.33:
-        risk_label = "BAJO"
-        risk_color = "#25b5e8"
-    elif avg_risk < 0.66:
-        risk_label = "MEDIO"
-        risk_color = "#16337b"
-    else:
-        risk_label = "ALTO"
-        risk_color = "#E74C3C"
+    export_slot = st.container()
+
+    kpis = get_dashboard_kpis(df, data_version)
 
     r1 = st.columns(4)
     with r1[0]:
-        render_dash_card("Score de Desempeño", f"{perf_avg:.1f}/100", "Promedio general", "+5.2%", "D", "#e8f4ff", "#25b5e8")
+        render_dash_card("Score de Desempeño", f"{kpis.perf_avg:.1f}/100", "Promedio general", "+5.2%", "D", "#e8f4ff", "#25b5e8")
     with r1[1]:
-        render_dash_card("Nivel de Riesgo", risk_label, f"{high_risk_pct:.1f}% empleados", "+1.2%", "R", "#ffe9ee", risk_color)
+        render_dash_card("Nivel de Riesgo", kpis.risk_label, f"{kpis.high_risk_pct:.1f}% empleados", "+1.2%", "R", "#ffe9ee", kpis.risk_color)
     with r1[2]:
-        render_dash_card("Tasa de Rotación", f"{rotation:.1f}%", "Anual", "+2.3%", "T", "#fff4e8", "#f2994a")
+        render_dash_card("Tasa de Rotación", f"{kpis.rotation:.1f}%", "Anual", "+2.3%", "T", "#fff4e8", "#f2994a")
     with r1[3]:
-        render_dash_card("Productividad", f"{productivity:.0f}%", "Promedio", "+1.8%", "P", "#e9fbf7", "#1f9d8f")
+        render_dash_card("Productividad", f"{kpis.productivity:.0f}%", "Promedio", "+1.8%", "P", "#e9fbf7", "#1f9d8f")
 
     r2 = st.columns(4)
     with r2[0]:
-        render_dash_card("Cumplimiento Objetivos", f"{compliance:.0f}%", "En meta", "+4.0%", "C", "#edf0ff", "#6c7cff")
+        render_dash_card("Cumplimiento Objetivos", f"{kpis.compliance:.0f}%", "En meta", "+4.0%", "C", "#edf0ff", "#6c7cff")
     with r2[1]:
-        render_dash_card("Índice de Sobrecarga", f"{overload_index:.0f}/100", "Carga de trabajo", "+1.2%", "S", "#ffecec", "#ff6b81")
+        render_dash_card("Índice de Sobrecarga", f"{kpis.overload_index:.0f}/100", "Carga de trabajo", "+1.2%", "S", "#ffecec", "#ff6b81")
     with r2[2]:
-        render_dash_card("Tareas Completadas", f"{tasks_done:,}", "Este mes", "+324", "K", "#e8f8ff", "#25b5e8")
+        render_dash_card("Tareas Completadas", f"{kpis.tasks_done:,}", "Este mes", "+324", "K", "#e8f8ff", "#25b5e8")
     with r2[3]:
-        render_dash_card("Eficiencia Operativa", f"{efficiency:.0f}%", "Operativa", "+3.1%", "E", "#eaf9f1", "#2ecc71")
+        render_dash_card("Eficiencia Operativa", f"{kpis.efficiency:.0f}%", "Operativa", "+3.1%", "E", "#eaf9f1", "#2ecc71")
 
     st.markdown("<div class='section-title'>Alertas</div>", unsafe_allow_html=True)
-    st.markdown(
-        f"<div class='alert-strip alert-danger'>{(df['risk_level']=='Alto').sum()} empleados con alto riesgo de burnout en Operaciones<br><span style='font-size:11px; opacity:0.7;'>Hace 15 min</span></div>",
-        unsafe_allow_html=True
-    )
-    st.markdown(
-        f"<div class='alert-strip alert-warning'>{(df['workload']>130).sum()} empleados con carga de trabajo superior al 130%<br><span style='font-size:11px; opacity:0.7;'>Hace 1 hora</span></div>",
-        unsafe_allow_html=True
-    )
-    st.markdown(
-        f"<div class='alert-strip alert-info'>{(df['performance']>95).sum()} empleados cumplieron 100% de objetivos este mes<br><span style='font-size:11px; opacity:0.7;'>Hace 2 horas</span></div>",
-        unsafe_allow_html=True
-    )
+    active_alerts = alert_engine.active_alerts()
+    if not active_alerts:
+        st.markdown("<div class='alert-strip alert-info'>Sin alertas activas</div>", unsafe_allow_html=True)
+    for alert in active_alerts:
+        st.markdown(
+            f"<div class='alert-strip alert-{alert['level']}'>{alert['message']}<br><span style='font-size:11px; opacity:0.7;'>{format_elapsed(alert['changed_at'])}</span></div>",
+            unsafe_allow_html=True
+        )
+
+    # Deriva de los últimos datos leídos del origen frente a la referencia
+    # guardada al entrenar el modelo servido
+    st.markdown("<div class='section-title'>Deriva de Datos</div>", unsafe_allow_html=True)
+    incoming, incoming_version = model_server.latest_data or (df, data_version)
+    drift = get_drift_report(incoming, incoming_version, model_server.version)
+    drift_flags = drift[drift["status"] != "Estable"]
+    if drift_flags.empty:
+        st.markdown("<div class='alert-strip alert-info'>Sin deriva respecto a los datos de entrenamiento</div>", unsafe_allow_html=True)
+    for row in drift_flags.itertuples(index=False):
+        level = "danger" if row.status == "Deriva" else "warning"
+        scope = "toda la organización" if row.scope == "Global" else row.scope
+        st.markdown(
+            f"<div class='alert-strip alert-{level}'>{row.status} en {SEGMENT_FEATURE_NAMES[row.feature]} ({scope})"
+            f"<br><span style='font-size:11px; opacity:0.7;'>PSI {row.psi:.2f} · KS {row.ks:.2f}</span></div>",
+            unsafe_allow_html=True
+        )
+
+    # Calidad de los archivos de origen antes de usarlos en el modelo
+    st.markdown("<div class='section-title'>Calidad de Datos</div>", unsafe_allow_html=True)
+    q_cols = st.columns(2)
+    for col, source in zip(q_cols, [SURVEY_PATH, ABSENTEEISM_PATH]):
+        with col:
+            quality = get_quality_report(str(source), file_version(source))
+            st.markdown(f"**{quality['file']}** · {quality['rows']:,} filas · {len(quality['columns'])} columnas")
+            if not quality["issues"]:
+                st.markdown("<div class='alert-strip alert-info'>Sin problemas detectados</div>", unsafe_allow_html=True)
+            for issue in quality["issues"]:
+                st.markdown(f"<div class='alert-strip alert-warning'>{issue}</div>", unsafe_allow_html=True)
+            with st.expander("Detalle por columna"):
+                st.dataframe(
+                    profile_table(quality).rename(columns={
+                        "column": "Columna", "type": "Tipo", "null_rate": "% Faltantes", "distinct": "Distintos",
+                        "out_of_range": "Fuera de rango", "type_mismatches": "Tipo incorrecto", "min": "Mín", "max": "Máx",
+                    }),
+                    hide_index=True,
+                    use_container_width=True,
+                )
+            st.download_button(
+                "Reporte JSON",
+                json.dumps(quality, ensure_ascii=False, indent=2),
+                file_name=f"calidad_{source.stem}.json",
+                mime="application/json",
+                key=f"dash_quality_{source.stem}",
+            )
 
     st.markdown("<div class='section-title'>Tendencia y Comparativa</div>", unsafe_allow_html=True)
 
@@ -1550,8 +218,8 @@ with tabs[0]:
 
         trend_df = pd.DataFrame({
             "Mes": month_labels,
-            "Rendimiento": make_trend(perf_avg),
-            "Riesgo": make_trend(avg_risk * 100),
+            "Rendimiento": make_trend(kpis.perf_avg),
+            "Riesgo": make_trend(kpis.avg_risk * 100),
         })
 
         trend_long = trend_df.melt("Mes", var_name="Indicador", value_name="Indice")
@@ -1587,18 +255,7 @@ with tabs[0]:
 
     st.markdown("<div class='section-title'>Comparación por Área</div>", unsafe_allow_html=True)
 
-    dept_metrics = (
-        df.groupby("department", as_index=False)
-        .agg(
-            performance=("performance", "mean"),
-            risk=("risk_score", "mean"),
-            workload=("workload", "mean"),
-            absenteeism=("absenteeism", "mean"),
-        )
-    )
-    dept_metrics["risk_idx"] = dept_metrics["risk"] * 100
-    dept_metrics["workload_idx"] = dept_metrics["workload"] / 150 * 100
-    dept_metrics["abs_idx"] = dept_metrics["absenteeism"] / 80 * 100
+    dept_metrics = get_department_metrics(df, data_version)
 
     c_left, c_right = st.columns(2)
 
@@ -1658,6 +315,65 @@ with tabs[0]:
         apply_plotly_style(fig_comp)
         st.plotly_chart(fig_comp, use_container_width=True)
 
+    with export_slot:
+        if export_clicked:
+            # El reporte exporta la lista con los filtros activos de la pestaña Empleados
+            export_filters = (
+                st.session_state.get("emp_dept", "Todos"),
+                st.session_state.get("emp_risk", "Todos"),
+                st.session_state.get("emp_search", ""),
+            )
+            if employee_db is not None:
+                export_rows = employee_db.count(*export_filters)
+                export_chunks = employee_db.iter_export_chunks(*export_filters)
+            else:
+                positions = np.flatnonzero(employee_filter_mask(df, *export_filters))
+                export_rows = len(positions)
+                export_chunks = iter_export_chunks(df, positions)
+            summary_html = build_dashboard_html(
+                [
+                    ("Score de Desempeño", f"{kpis.perf_avg:.1f}/100"),
+                    ("Nivel de Riesgo", f"{kpis.risk_label} · {kpis.high_risk_pct:.1f}% empleados"),
+                    ("Tasa de Rotación", f"{kpis.rotation:.1f}%"),
+                    ("Productividad", f"{kpis.productivity:.0f}%"),
+                    ("Cumplimiento Objetivos", f"{kpis.compliance:.0f}%"),
+                    ("Índice de Sobrecarga", f"{kpis.overload_index:.0f}/100"),
+                    ("Tareas Completadas", f"{kpis.tasks_done:,}"),
+                    ("Eficiencia Operativa", f"{kpis.efficiency:.0f}%"),
+                ],
+                active_alerts,
+                {
+                    "Tendencia": fig_trend,
+                    "Rendimiento por Departamento": fig_dept,
+                    "Rendimiento vs Carga": fig_bubble,
+                    "Comparación por Área": fig_comp,
+                },
+                data_version,
+            )
+            out_dir = new_export_dir()
+            job = get_export_executor().submit(export_report, export_chunks, out_dir, summary_html)
+            st.session_state.export_job = job
+            if export_rows <= EXPORT_BACKGROUND_ROWS:
+                with st.spinner("Generando reporte..."):
+                    job.exception()
+
+        job = st.session_state.get("export_job")
+        if job is not None:
+            if not job.done():
+                st.info("Generando reporte en segundo plano...")
+                st.button("Actualizar estado", key="dash_export_refresh")
+            elif job.exception() is not None:
+                st.error(f"No se pudo generar el reporte: {job.exception()}")
+            elif not all(path.exists() for path in job.result().values()):
+                # Los reportes viejos se borran al generar uno nuevo (EXPORT_MAX_AGE)
+                st.info("El reporte expiró; vuelve a exportarlo.")
+            else:
+                files = job.result()
+                dl_cols = st.columns(len(files))
+                for col, (label, path) in zip(dl_cols, files.items()):
+                    # El archivo se lee solo al hacer clic, no en cada rerun
+                    col.download_button(label, path.read_bytes, file_name=path.name, key=f"dash_dl_{path.name}")
+
     st.markdown("</div>", unsafe_allow_html=True)
 
 # ============================================
@@ -1668,9 +384,12 @@ with tabs[1]:
     st.markdown("<div class='fade-in'>", unsafe_allow_html=True)
     st.markdown("<div class='section-title'>Empleados</div>", unsafe_allow_html=True)
 
-    total_employees = int(df.shape[0])
-    active_count = int((df["active_status"] == "Activo").sum())
-    inactive_count = int((df["active_status"] == "Inactivo").sum())
+    if employee_db is not None:
+        total_employees, active_count, inactive_count = employee_db.status_counts()
+    else:
+        total_employees = int(df.shape[0])
+        active_count = int((df["active_status"] == "Activo").sum())
+        inactive_count = int((df["active_status"] == "Inactivo").sum())
     active_pct = (active_count / total_employees * 100) if total_employees else 0
     inactive_pct = (inactive_count / total_employees * 100) if total_employees else 0
 
@@ -1708,40 +427,44 @@ with tabs[1]:
 
     f1, f2, f3 = st.columns([2, 1, 1])
     search_query = f1.text_input("Buscar empleado", placeholder="Buscar empleado...", key="emp_search")
-    dept_options = ["Todos"] + sorted(df["department"].unique())
+    dept_options = ["Todos"] + departments
     selected_dept = f2.selectbox("Departamento", dept_options, index=0, key="emp_dept")
     risk_options = ["Todos", "Bajo", "Medio", "Alto"]
     selected_risk = f3.selectbox("Nivel de riesgo", risk_options, index=0, key="emp_risk")
 
-    df_emp = df.copy()
-    if selected_dept != "Todos":
-        df_emp = df_emp[df_emp["department"] == selected_dept]
-    if selected_risk != "Todos":
-        df_emp = df_emp[df_emp["risk_level"] == selected_risk]
-    if search_query:
-        q = search_query.strip().lower()
-        df_emp = df_emp[
-            df_emp["employee_name"].str.lower().str.contains(q) |
-            df_emp["employee_role"].str.lower().str.contains(q)
-        ]
+    if employee_db is not None:
+        # Filtros resueltos en SQLite: solo vuelven las 50 filas de la lista y un perfil
+        emp_filters = (selected_dept, selected_risk, search_query)
+        first_emp_id = employee_db.first_id(*emp_filters)
+        list_df = employee_db.top_k(50, *emp_filters)
+        emp_in_filter = lambda emp_id: employee_db.contains(emp_id, *emp_filters)
+        emp_profile = employee_db.profile
+    else:
+        emp_mask = employee_filter_mask(df, selected_dept, selected_risk, search_query)
+        # Primer empleado en orden original: perfil por defecto del panel derecho
+        first_emp_id = int(df["employee_id"].iat[int(emp_mask.argmax())]) if emp_mask.any() else None
+        # Top 50 por riesgo desde el ranking presorteado por departamento
+        list_df = df.iloc[risk_ranking.top_k(
+            50, emp_mask, None if selected_dept == "Todos" else [selected_dept]
+        )]
+        emp_in_filter = lambda emp_id: employee_store.contains(emp_id, emp_mask)
+        emp_profile = employee_store.profile
 
     left, right = st.columns([1, 2])
 
     with left:
         st.markdown("<div class='section-title'>Lista de Empleados</div>", unsafe_allow_html=True)
-        list_df = df_emp.sort_values(["risk_score", "performance"], ascending=[False, False])
-
         if list_df.empty:
             st.info("No hay empleados con los filtros seleccionados.")
         else:
-            if "selected_emp_id" not in st.session_state or st.session_state.selected_emp_id not in list_df["employee_id"].values:
+            if "selected_emp_id" not in st.session_state or not emp_in_filter(st.session_state.selected_emp_id):
                 st.session_state.selected_emp_id = int(list_df.iloc[0]["employee_id"])
 
             selected_emp_id = int(st.session_state.selected_emp_id)
 
             list_container = st.container(height=520)
             with list_container:
-                for row in list_df.head(50).itertuples(index=False):
+                for row in list_df.itertuples(index=False):
                     name_parts = row.employee_name.split()
                     initials = name_parts[0][0] + (name_parts[-1][0] if len(name_parts) > 1 else "")
                     presence_class = "inactive" if row.active_status == "Inactivo" else ""
@@ -1766,15 +489,16 @@ with tabs[1]:
                         st.session_state.selected_emp_id = int(row.employee_id)
 
     with right:
-        if df_emp.empty:
+        if first_emp_id is None:
             st.info("Selecciona un empleado para ver su perfil detallado.")
         else:
-            selected_id = st.session_state.get("selected_emp_id", int(df_emp.iloc[0]["employee_id"]))
-            if selected_id not in df_emp["employee_id"].values:
-                selected_id = int(df_emp.iloc[0]["employee_id"])
+            selected_id = st.session_state.get("selected_emp_id", first_emp_id)
+            if not emp_in_filter(selected_id):
+                selected_id = first_emp_id
                 st.session_state.selected_emp_id = selected_id
 
-            emp = df_emp[df_emp["employee_id"] == selected_id].iloc[0]
+            profile = emp_profile(selected_id)
+            emp = profile["employee"]
             risk_class = "risk-low" if emp["risk_level"] == "Bajo" else "risk-mid" if emp["risk_level"] == "Medio" else "risk-high"
             emp_status_class = "inactive" if emp["active_status"] == "Inactivo" else ""
 
@@ -1796,28 +520,28 @@ with tabs[1]:
             m1.markdown(f"""
 <div class='kpi-card'>
     <div class='kpi-title'>Score de Riesgo</div>
-    <div class='kpi-value'>{emp['risk_score']*100:.1f}/100</div>
+    <div class='kpi-value'>{profile['kpis']['risk']:.1f}/100</div>
     <div class='kpi-sub'>Individual</div>
 </div>
             """, unsafe_allow_html=True)
             m2.markdown(f"""
 <div class='kpi-card'>
     <div class='kpi-title'>Desempeño</div>
-    <div class='kpi-value'>{emp['performance']:.1f}/100</div>
+    <div class='kpi-value'>{profile['kpis']['performance']:.1f}/100</div>
     <div class='kpi-sub'>Productividad</div>
 </div>
             """, unsafe_allow_html=True)
             m3.markdown(f"""
 <div class='kpi-card'>
     <div class='kpi-title'>Sobrecarga</div>
-    <div class='kpi-value'>{emp['workload']/150*100:.1f}%</div>
+    <div class='kpi-value'>{profile['kpis']['workload']:.1f}%</div>
     <div class='kpi-sub'>Carga actual</div>
 </div>
             """, unsafe_allow_html=True)
             m4.markdown(f"""
 <div class='kpi-card'>
     <div class='kpi-title'>Ausentismo</div>
-    <div class='kpi-value'>{emp['absenteeism']/80*100:.1f}%</div>
+    <div class='kpi-value'>{profile['kpis']['absenteeism']:.1f}%</div>
     <div class='kpi-sub'>Índice estimado</div>
 </div>
             """, unsafe_allow_html=True)
@@ -1827,14 +551,8 @@ with tabs[1]:
 
             with c_left:
                 factor_df = pd.DataFrame({
-                    "Factor": ["Estrés", "Burnout", "Sobrecarga", "Ausentismo", "Ansiedad"],
-                    "Indice": [
-                        emp["stress"] / 5 * 100,
-                        emp["burnout"] / 5 * 100,
-                        emp["workload"] / 150 * 100,
-                        emp["absenteeism"] / 80 * 100,
-                        emp["anxiety"] / 5 * 100,
-                    ],
+                    "Factor": list(profile["radar"]),
+                    "Indice": list(profile["radar"].values()),
                 })
                 fig_radar = px.line_polar(factor_df, r="Indice", theta="Factor", line_close=True)
                 fig_radar.update_traces(fill="toself", line_color="#25b5e8", fillcolor="rgba(37,181,232,0.2)")
@@ -1848,19 +566,9 @@ with tabs[1]:
 
             with c_right:
                 compare_df = pd.DataFrame({
-                    "Métrica": ["Desempeño", "Riesgo", "Sobrecarga", "Ausentismo"],
-                    "Empleado": [
-                        emp["performance"],
-                        emp["risk_score"] * 100,
-                        emp["workload"] / 150 * 100,
-                        emp["absenteeism"] / 80 * 100,
-                    ],
-                    "Promedio": [
-                        df_emp["performance"].mean(),
-                        df_emp["risk_score"].mean() * 100,
-                        df_emp["workload"].mean() / 150 * 100,
-                        df_emp["absenteeism"].mean() / 80 * 100,
-                    ],
+                    "Métrica": list(profile["comparison"]),
+                    "Empleado": [emp_val for emp_val, _ in profile["comparison"].values()],
+                    "Promedio Depto.": [dept_val for _, dept_val in profile["comparison"].values()],
                 })
                 compare_long = compare_df.melt("Métrica", var_name="Grupo", value_name="Indice")
                 fig_compare = px.bar(
@@ -1869,7 +577,7 @@ with tabs[1]:
                     y="Indice",
                     color="Grupo",
                     barmode="group",
-                    color_discrete_map={"Empleado": "#16337b", "Promedio": "#dbe3eb"},
+                    color_discrete_map={"Empleado": "#16337b", "Promedio Depto.": "#dbe3eb"},
                 )
                 fig_compare.update_layout(
                     height=320,
@@ -1889,25 +597,23 @@ with tabs[2]:
     st.markdown("<div class='section-title'>Análisis de Riesgo</div>", unsafe_allow_html=True)
 
     f1, f2, f3 = st.columns(3)
-    dept_options = ["Todos"] + sorted(df["department"].unique())
+    dept_options = ["Todos"] + departments
     selected_dept = f1.selectbox("Departamento", dept_options, index=0, key="risk_dept_ana")
     risk_options = ["Todos", "Bajo", "Medio", "Alto"]
     selected_risk = f2.selectbox("Nivel de riesgo", risk_options, index=0, key="risk_level_ana")
     period_options = ["Últimos 6 meses", "Últimos 12 meses"]
     selected_period = f3.selectbox("Periodo", period_options, index=0, key="risk_period_ana")
 
-    df_risk = df.copy()
-    if selected_dept != "Todos":
-        df_risk = df_risk[df_risk["department"] == selected_dept]
-    if selected_risk != "Todos":
-        df_risk = df_risk[df_risk["risk_level"] == selected_risk]
-
-    risk_score = float(df_risk["risk_score"].mean() * 100) if not df_risk.empty else 0
-    prob_burnout = float(df_risk["burnout"].mean() / 5 * 100) if not df_risk.empty else 0
-    high_risk_pct = float((df_risk["risk_level"] == "Alto").mean() * 100) if not df_risk.empty else 0
-    high_risk_count = int((df_risk["risk_level"] == "Alto").sum()) if not df_risk.empty else 0
-    workload_avg = float(df_risk["workload"].mean()) if not df_risk.empty else 0
-    abs_rate = float(df_risk["absenteeism"].mean() / 80 * 100) if not df_risk.empty else 0
+    risk_metrics = get_kpi_store(df, data_version).metrics(
+        None if selected_dept == "Todos" else [selected_dept],
+        None if selected_risk == "Todos" else [selected_risk],
+    )
+    risk_score = risk_metrics.avg_risk * 100
+    prob_burnout = risk_metrics.burnout_avg / 5 * 100
+    high_risk_pct = risk_metrics.high_risk_pct
+    high_risk_count = risk_metrics.high_risk_count
+    workload_avg = risk_metrics.workload_avg
+    abs_rate = risk_metrics.absenteeism_avg / 80 * 100
 
     def risk_tag(score):
         if score >= 66:
@@ -1997,9 +703,9 @@ with tabs[2]:
     trend_df = pd.DataFrame({
         "Mes": month_labels,
         "Riesgo general": make_trend(risk_score),
-        "Estrés": make_trend(df_risk["stress"].mean() / 5 * 100 if not df_risk.empty else 0),
-        "Burnout": make_trend(df_risk["burnout"].mean() / 5 * 100 if not df_risk.empty else 0),
-        "Sobrecarga": make_trend(df_risk["workload"].mean() / 150 * 100 if not df_risk.empty else 0),
+        "Estrés": make_trend(risk_metrics.stress_avg / 5 * 100),
+        "Burnout": make_trend(prob_burnout),
+        "Sobrecarga": make_trend(risk_metrics.overload_index),
     })
 
     trend_long = trend_df.melt("Mes", var_name="Indicador", value_name="Indice")
@@ -2027,15 +733,7 @@ with tabs[2]:
     c_left, c_right = st.columns(2)
 
     with c_left:
-        risk_dist = (
-            df_risk["risk_level"]
-            .value_counts(normalize=True)
-            .reindex(["Bajo", "Medio", "Alto"])
-            .fillna(0)
-            .reset_index()
-        )
-        risk_dist.columns = ["Nivel", "Porcentaje"]
-        risk_dist["Porcentaje"] = risk_dist["Porcentaje"] * 100
+        risk_dist = level_distribution(risk_metrics)
         fig_donut = px.pie(
             risk_dist,
             names="Nivel",
@@ -2074,6 +772,44 @@ with tabs[2]:
         apply_plotly_style(fig_cat)
         st.plotly_chart(fig_cat, use_container_width=True)
 
+    # Un punto por empleado (WebGL). Por encima del presupuesto de puntos se
+    # envía densidad + muestra; seleccionar un recuadro acerca la vista.
+    st.markdown("<div class='section-title'>Explorador de Empleados</div>", unsafe_allow_html=True)
+    scatter_index = get_scatter_index(df, data_version)
+    scatter_state = st.session_state.setdefault("scatter_view", {"x": None, "y": None, "gen": 0})
+    sc_info, sc_reset = st.columns([4, 1])
+    if sc_reset.button("Restablecer vista", key="scatter_reset"):
+        scatter_state.update(x=None, y=None, gen=scatter_state["gen"] + 1)
+    scatter_view = scatter_index.view(
+        scatter_state["x"],
+        scatter_state["y"],
+        None if selected_dept == "Todos" else [selected_dept],
+        None if selected_risk == "Todos" else [selected_risk],
+    )
+    shown = len(scatter_view["points"])
+    sc_info.caption(
+        f"{scatter_view['total']:,} empleados en la vista · "
+        + (f"densidad + muestra de {shown:,} puntos; selecciona un recuadro para acercar"
+           if scatter_view["density"] is not None else f"{shown:,} puntos")
+    )
+    fig_scatter = scatter_index.figure(
+        scatter_view, {"workload": "Carga de trabajo", "risk_score": "Score de riesgo", "performance": "Desempeño"}
+    )
+    fig_scatter.update_layout(height=420)
+    apply_plotly_style(fig_scatter)
+    scatter_event = st.plotly_chart(
+        fig_scatter,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="box",
+        key=f"scatter_explorer_{scatter_state['gen']}",
+    )
+    scatter_boxes = scatter_event.selection.get("box", []) if scatter_event else []
+    if scatter_boxes:
+        box = scatter_boxes[0]
+        scatter_state.update(x=tuple(sorted(box["x"])), y=tuple(sorted(box["y"])), gen=scatter_state["gen"] + 1)
+        st.rerun()
+
     st.markdown("<div class='section-title'>Análisis de Horas Extra</div>", unsafe_allow_html=True)
 
     overtime_rows = [
@@ -2129,18 +865,14 @@ with tabs[3]:
 
     f1, f2 = st.columns(2)
     with f1:
-        dept_options = ["Todos"] + sorted(df["department"].unique())
+        dept_options = ["Todos"] + departments
         selected_dept = st.selectbox("Departamento", dept_options, index=0, key="risk_dept")
     with f2:
         period_options = ["Últimos 6 meses", "Últimos 12 meses"]
         selected_period = st.selectbox("Periodo", period_options, index=0, key="risk_period")
 
-    df_f = df if selected_dept == "Todos" else df[df["department"] == selected_dept]
-
-    score_general = df_f["risk_score"].mean() * 100
-    prob_burnout = df_f["burnout"].mean() / 5 * 100
-    high_risk = (df_f["risk_level"] == "Alto").sum()
-    abs_rate = df_f["absenteeism"].mean() / 80 * 100
+    factor_metrics = get_kpi_store(df, data_version).metrics(None if selected_dept == "Todos" else [selected_dept])
+    score_general = factor_metrics.avg_risk * 100
 
     risk_factors = [
         {
@@ -2199,7 +931,8 @@ with tabs[3]:
 
     coverage = sum(item["percent"] for item in risk_factors)
     impacted_pct = (
-        df_f["risk_level"].isin(["Medio", "Alto"]).mean() * 100 if not df_f.empty else 0
+        (factor_metrics.level_counts["Medio"] + factor_metrics.level_counts["Alto"])
+        / max(factor_metrics.employees, 1) * 100
     )
     urgency = "Alto" if impacted_pct >= 60 else "Medio" if impacted_pct >= 40 else "Bajo"
 
@@ -2280,9 +1013,9 @@ with tabs[3]:
     trend_df = pd.DataFrame({
         "Mes": month_labels,
         "Riesgo general": make_trend(score_general),
-        "Estrés": make_trend(df_f["stress"].mean() / 5 * 100),
-        "Burnout": make_trend(df_f["burnout"].mean() / 5 * 100),
-        "Sobrecarga": make_trend(df_f["workload"].mean() / 150 * 100),
+        "Estrés": make_trend(factor_metrics.stress_avg / 5 * 100),
+        "Burnout": make_trend(factor_metrics.burnout_avg / 5 * 100),
+        "Sobrecarga": make_trend(factor_metrics.overload_index),
     })
 
     trend_long = trend_df.melt("Mes", var_name="Indicador", value_name="Indice")
@@ -2312,15 +1045,7 @@ with tabs[3]:
     c_left, c_right = st.columns(2)
 
     with c_left:
-        risk_dist = (
-            df_f["risk_level"]
-            .value_counts(normalize=True)
-            .reindex(["Bajo", "Medio", "Alto"])
-            .fillna(0)
-            .reset_index()
-        )
-        risk_dist.columns = ["Nivel", "Porcentaje"]
-        risk_dist["Porcentaje"] = risk_dist["Porcentaje"] * 100
+        risk_dist = level_distribution(factor_metrics)
 
         fig_donut = px.pie(
             risk_dist,
@@ -2342,11 +1067,11 @@ with tabs[3]:
         factor_scores = pd.DataFrame({
             "Factor": ["Estrés", "Burnout", "Sobrecarga", "Ausentismo", "Ansiedad"],
             "Indice": [
-                df_f["stress"].mean() / 5 * 100,
-                df_f["burnout"].mean() / 5 * 100,
-                df_f["workload"].mean() / 150 * 100,
-                df_f["absenteeism"].mean() / 80 * 100,
-                df_f["anxiety"].mean() / 5 * 100,
+                factor_metrics.stress_avg / 5 * 100,
+                factor_metrics.burnout_avg / 5 * 100,
+                factor_metrics.overload_index,
+                factor_metrics.absenteeism_avg / 80 * 100,
+                factor_metrics.anxiety_avg / 5 * 100,
             ]
         }).round(1).sort_values("Indice", ascending=True)
 
@@ -2381,26 +1106,22 @@ with tabs[4]:
 
     st.markdown("<div class='section-title'>Segmentación por Áreas</div>", unsafe_allow_html=True)
 
-    segment_depts = [
-        {"name": "Operaciones", "employees": 285, "satisfaction": 5.2, "overtime": 12.5, "burnout": 38, "risk": 45},
-        {"name": "Ventas", "employees": 220, "satisfaction": 6.8, "overtime": 8.2, "burnout": 25, "risk": 30},
-        {"name": "IT", "employees": 195, "satisfaction": 7.5, "overtime": 6.5, "burnout": 18, "risk": 22},
-        {"name": "RRHH", "employees": 85, "satisfaction": 8.2, "overtime": 3.8, "burnout": 10, "risk": 12},
-        {"name": "Finanzas", "employees": 140, "satisfaction": 8.5, "overtime": 2.5, "burnout": 6, "risk": 8},
-        {"name": "Marketing", "employees": 120, "satisfaction": 7.8, "overtime": 5.2, "burnout": 12, "risk": 15},
-    ]
+    silhouettes = get_segment_silhouettes(df, data_version)
+    best_k = max(silhouettes, key=silhouettes.get)
 
-    subdivisions = [
-        {"name": "Norte", "employees": 380, "capacity": 130, "risk": 42},
-        {"name": "Sur", "employees": 285, "capacity": 75, "risk": 18},
-        {"name": "Este", "employees": 320, "capacity": 95, "risk": 28},
-        {"name": "Oeste", "employees": 260, "capacity": 85, "risk": 22},
-    ]
+    f_k, f_dept, f_sub = st.columns([2.4, 1.2, 1.2])
+    with f_k:
+        seg_k = st.slider("Número de segmentos", 2, 8, best_k, key="seg_k")
+        st.caption(
+            f"Silueta estimada: {silhouettes[seg_k]:.2f} "
+            f"(mejor k = {best_k}, muestra de {min(SILHOUETTE_SAMPLE, len(df)):,} empleados)"
+        )
 
-    dept_names = [d["name"] for d in segment_depts]
-    sub_names = [s["name"] for s in subdivisions]
+    segments = get_segments(df, data_version, seg_k)
+    seg_base = segments["base"]
+    dept_names = sorted(seg_base["department"].unique())
+    sub_names = segments["names"]
 
-    spacer, f_dept, f_sub = st.columns([2.4, 1.2, 1.2])
     with f_dept:
         selected_dept = st.selectbox(
             "Departamento",
@@ -2410,56 +1131,59 @@ with tabs[4]:
         )
     with f_sub:
         selected_sub = st.selectbox(
-            "Subdivisión",
-            ["Todas las Subdivisiones"] + sub_names,
+            "Segmento",
+            ["Todos los Segmentos"] + sub_names,
             index=0,
             key="seg_sub_v2"
         )
 
-    dept_filtered = (
-        segment_depts if selected_dept == "Todos los Departamentos"
-        else [d for d in segment_depts if d["name"] == selected_dept]
-    )
-    sub_filtered = (
-        subdivisions if selected_sub == "Todas las Subdivisiones"
-        else [s for s in subdivisions if s["name"] == selected_sub]
-    )
+    dept_scope = None if selected_dept == "Todos los Departamentos" else selected_dept
+    sub_scope = None if selected_sub == "Todos los Segmentos" else selected_sub
 
-    risk_top = max(segment_depts, key=lambda d: d["risk"])
-    sat_top = max(segment_depts, key=lambda d: d["satisfaction"])
-    cap_top = max(subdivisions, key=lambda s: s["capacity"])
+    segment_depts = summarize_segments(seg_base, "department", segment=sub_scope).to_dict("records")
+    subdivisions = summarize_segments(seg_base, "segment", department=dept_scope).to_dict("records")
 
-    h1, h2, h3 = st.columns(3)
-    h1.markdown(
-        f"""
+    dept_filtered = [d for d in segment_depts if dept_scope is None or d["name"] == dept_scope]
+    sub_filtered = [s for s in subdivisions if sub_scope is None or s["name"] == sub_scope]
+
+    if not segment_depts or not subdivisions:
+        st.info("No hay empleados con los filtros seleccionados.")
+    else:
+        risk_top = max(segment_depts, key=lambda d: d["risk"])
+        calm_top = min(segment_depts, key=lambda d: d["stress_idx"])
+        cap_top = max(subdivisions, key=lambda s: s["workload"])
+
+        h1, h2, h3 = st.columns(3)
+        h1.markdown(
+            f"""
 <div class='seg-hero-card seg-risk'>
     <div class='seg-hero-label'>Mayor Riesgo</div>
     <div class='seg-hero-title'>{risk_top['name']}</div>
-    <div class='seg-hero-sub'>{risk_top['risk']}% de riesgo con {risk_top['employees']} empleados afectados</div>
+    <div class='seg-hero-sub'>{risk_top['risk']}% en riesgo alto de {risk_top['employees']} empleados</div>
 </div>
-        """,
-        unsafe_allow_html=True
-    )
-    h2.markdown(
-        f"""
+            """,
+            unsafe_allow_html=True
+        )
+        h2.markdown(
+            f"""
 <div class='seg-hero-card seg-sat'>
-    <div class='seg-hero-label'>Mayor Satisfacción</div>
-    <div class='seg-hero-title'>{sat_top['name']}</div>
-    <div class='seg-hero-sub'>{sat_top['satisfaction']}/10 de satisfacción promedio</div>
+    <div class='seg-hero-label'>Menor Estrés</div>
+    <div class='seg-hero-title'>{calm_top['name']}</div>
+    <div class='seg-hero-sub'>{calm_top['stress_idx']}/100 de estrés promedio</div>
 </div>
-        """,
-        unsafe_allow_html=True
-    )
-    h3.markdown(
-        f"""
+            """,
+            unsafe_allow_html=True
+        )
+        h3.markdown(
+            f"""
 <div class='seg-hero-card seg-cap'>
     <div class='seg-hero-label'>Sobrecapacidad</div>
-    <div class='seg-hero-title'>Subdivisión {cap_top['name']}</div>
-    <div class='seg-hero-sub'>{cap_top['capacity']}% de capacidad · requiere balanceo</div>
+    <div class='seg-hero-title'>{cap_top['name']}</div>
+    <div class='seg-hero-sub'>{cap_top['workload']:.0f}% de carga promedio · {segments['descriptors'][cap_top['name']]}</div>
 </div>
-        """,
-        unsafe_allow_html=True
-    )
+            """,
+            unsafe_allow_html=True
+        )
 
     st.markdown("<div class='section-title'>Departamentos Clave</div>", unsafe_allow_html=True)
 
@@ -2491,8 +1215,8 @@ with tabs[4]:
     </div>
     <div class='seg-risk-badge {badge_class}'>{dept['risk']}%</div>
     <div class='seg-metrics'>
-        <div><span>Satisfacción</span><b>{dept['satisfaction']}/10</b></div>
-        <div><span>Horas Extra</span><b>{dept['overtime']}h</b></div>
+        <div><span>Estrés</span><b>{dept['stress_idx']}/100</b></div>
+        <div><span>Carga Laboral</span><b>{dept['workload']:.0f}%</b></div>
         <div><span>Burnout</span><b>{dept['burnout']}%</b></div>
         <div><span>Riesgo</span><b>{dept['risk']}%</b></div>
     </div>
@@ -2500,34 +1224,34 @@ with tabs[4]:
             """
             cols[idx].markdown(card_html, unsafe_allow_html=True)
 
-    st.markdown("<div class='section-title'>Distribución por Subdivisión</div>", unsafe_allow_html=True)
+    st.markdown("<div class='section-title'>Distribución por Segmento</div>", unsafe_allow_html=True)
 
-    sub_cols = st.columns(4)
-    for idx, sub in enumerate(sub_filtered):
-        cap_class = "seg-capacity-high" if sub["capacity"] >= 110 else "seg-capacity-ok"
-        bar_class = risk_class(sub["risk"])
-        bar_color = "#ff6b81" if bar_class == "seg-risk-high" else "#f2c94c" if bar_class == "seg-risk-mid" else "#25b5e8"
-        card_html = f"""
+    for i in range(0, len(sub_filtered), 4):
+        sub_cols = st.columns(4)
+        for idx, sub in enumerate(sub_filtered[i:i + 4]):
+            cap_class = "seg-capacity-high" if sub["workload"] >= 110 else "seg-capacity-ok"
+            bar_class = risk_class(sub["risk"])
+            bar_color = "#ff6b81" if bar_class == "seg-risk-high" else "#f2c94c" if bar_class == "seg-risk-mid" else "#25b5e8"
+            card_html = f"""
 <div class='seg-sub-card'>
     <div class='seg-sub-title'>{sub['name']}</div>
+    <div class='seg-sub-row'><span>Perfil:</span><b>{segments['descriptors'][sub['name']]}</b></div>
     <div class='seg-sub-row'><span>Empleados:</span><b>{sub['employees']}</b></div>
-    <div class='seg-sub-row'><span>Capacidad:</span><span class='{cap_class}'>{sub['capacity']}%</span></div>
+    <div class='seg-sub-row'><span>Capacidad:</span><span class='{cap_class}'>{sub['workload']:.0f}%</span></div>
     <div class='seg-sub-row'><span>Riesgo:</span><b>{sub['risk']}%</b></div>
     <div class='seg-progress'>
         <div class='seg-progress-bar' style='width:{sub['risk']}%; background:{bar_color};'></div>
     </div>
 </div>
-        """
-        sub_cols[idx % 4].markdown(card_html, unsafe_allow_html=True)
+            """
+            sub_cols[idx].markdown(card_html, unsafe_allow_html=True)
 
     st.markdown("<div class='section-title'>Comparación de Riesgo por Departamento</div>", unsafe_allow_html=True)
 
     chart_left, chart_right = st.columns(2)
 
     with chart_left:
-        bar_df = pd.DataFrame(segment_depts)
-        if selected_dept != "Todos los Departamentos":
-            bar_df = bar_df[bar_df["name"] == selected_dept]
+        bar_df = pd.DataFrame(dept_filtered, columns=["name", "risk"])
         fig_compare = px.bar(
             bar_df,
             x="name",
@@ -2538,32 +1262,24 @@ with tabs[4]:
         fig_compare.update_layout(
             height=360,
             xaxis=dict(title="Departamento", showgrid=False),
-            yaxis=dict(title="Riesgo (%)", range=[0, 60]),
+            yaxis=dict(title="Riesgo Alto (%)", range=[0, max([60] + [d["risk"] + 5 for d in dept_filtered])]),
             showlegend=False
         )
         apply_plotly_style(fig_compare)
         st.plotly_chart(fig_compare, use_container_width=True)
 
     with chart_right:
-        radar_categories = ["Carga Laboral", "Estrés", "Satisfacción", "Balance Vida-Trabajo", "Apoyo Gerencial"]
-        radar_values = {
-            "Operaciones": [78, 72, 48, 40, 55],
-            "IT": [58, 50, 72, 68, 70],
-            "RRHH": [45, 38, 80, 75, 78],
-        }
-        radar_colors = {
-            "Operaciones": "#ff6b81",
-            "IT": "#25b5e8",
-            "RRHH": "#16337b",
-        }
+        radar_categories = ["Carga Laboral", "Estrés", "Burnout", "Ansiedad", "Ausentismo"]
+        radar_depts = sorted(dept_filtered, key=lambda d: d["risk"], reverse=True)[:3]
+        radar_palette = ["#ff6b81", "#25b5e8", "#16337b"]
         fig_radar = go.Figure()
-        for dept, values in radar_values.items():
+        for dept, color in zip(radar_depts, radar_palette):
             fig_radar.add_trace(go.Scatterpolar(
-                r=values,
+                r=[dept["workload"] / 150 * 100, dept["stress_idx"], dept["burnout_idx"], dept["anxiety_idx"], dept["abs_idx"]],
                 theta=radar_categories,
                 fill="toself",
-                name=dept,
-                line=dict(color=radar_colors.get(dept, "#16337b")),
+                name=dept["name"],
+                line=dict(color=color),
                 opacity=0.55
             ))
         fig_radar.update_layout(
@@ -2816,4 +1532,93 @@ with tabs[5]:
             """
             st.markdown(rec_html, unsafe_allow_html=True)
 
+    st.markdown("<div class='section-title'>Simulador de Intervenciones</div>", unsafe_allow_html=True)
+
+    s1, s2, s3, s4 = st.columns(4)
+    sim_dept = s1.selectbox("Departamento", ["Todos"] + departments, index=0, key="sim_dept")
+    sim_workload_min = s2.slider("Carga laboral mayor a", 60, 150, 130, step=5, key="sim_workload_min")
+    sim_workload_pct = s3.slider("Reducción de carga (%)", 0, 50, 20, step=5, key="sim_workload_pct")
+    sim_stress_delta = s4.selectbox("Reducción de estrés (puntos)", [0, 1, 2], index=1, key="sim_stress_delta")
+
+    model_status = model_server.status()
+    m1, m2 = st.columns([4, 1])
+    if model_status["running"]:
+        m1.caption(f"Modelo v{model_generation} · reentrenamiento en curso")
+    elif model_status["last"] and "candidate_acc" in model_status["last"]:
+        last = model_status["last"]
+        outcome = "aplicado" if last["accepted"] else f"descartado: {last['reason']}" if "reason" in last else "descartado"
+        m1.caption(
+            f"Modelo v{model_generation} · último reentrenamiento: exactitud holdout "
+            f"{last['current_acc']:.3f} → {last['candidate_acc']:.3f} ({outcome})"
+        )
+    elif model_status["last"] and "reason" in model_status["last"]:
+        m1.caption(f"Modelo v{model_generation} · último reentrenamiento omitido: {model_status['last']['reason']}")
+    else:
+        m1.caption(f"Modelo v{model_generation}")
+    if m2.button("Reentrenar modelo", key="sim_retrain", disabled=model_status["running"]):
+        model_server.retrain(*read_employees())
+
+    # Puntuación rápida: árbol destilado del bosque para respuestas interactivas
+    sim_mode = st.radio("Puntuación", ["Completa", "Rápida"], index=0, horizontal=True, key="sim_mode")
+    if sim_mode == "Rápida":
+        fast_scorer, fidelity = get_fast_scorer(rf, X_processed, model_version)
+        st.caption(
+            f"Puntuador rápido: {fidelity['agreement']:.1%} de concordancia con el modelo completo · "
+            f"{fidelity['speedup']:.0f}x más rápido"
+        )
+        simulator = get_simulator(fast_scorer, X_processed, df["department"].to_numpy(), f"{model_version}-rapida")
+    else:
+        simulator = get_simulator(rf, X_processed, df["department"].to_numpy(), model_version)
+
+    sim = simulator.simulate(sim_dept, sim_workload_min, sim_workload_pct, sim_stress_delta)
+    alto_before = sim["before"]["Alto"]
+    alto_after = sim["after"]["Alto"]
+    alto_change = (sim["alto_shift"] / alto_before * 100) if alto_before else 0
+
+    k1, k2, k3, k4 = st.columns(4)
+    sim_cards = [
+        (k1, f"{sim['employees']:,}", "Empleados en el segmento"),
+        (k2, f"{alto_before:,}", "Riesgo Alto actual"),
+        (k3, f"{alto_after:,}", "Riesgo Alto proyectado"),
+        (k4, f"{alto_change:+.1f}%", "Variación en Riesgo Alto"),
+    ]
+    for col, value, label in sim_cards:
+        col.markdown(
+            "<div class='rec-summary-box'>"
+            f"<div class='rec-summary-value'>{value}</div>"
+            f"<div class='rec-summary-label'>{label}</div>"
+            "</div>",
+            unsafe_allow_html=True
+        )
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    if sim["employees"] == 0:
+        st.info("No hay empleados en el segmento seleccionado.")
+    else:
+        sim_df = pd.DataFrame({
+            "Nivel": RISK_LEVELS * 2,
+            "Escenario": ["Actual"] * 3 + ["Con intervención"] * 3,
+            "Empleados": [sim["before"][lvl] for lvl in RISK_LEVELS] + [sim["after"][lvl] for lvl in RISK_LEVELS],
+        })
+        fig_sim = px.bar(
+            sim_df,
+            x="Nivel",
+            y="Empleados",
+            color="Escenario",
+            barmode="group",
+            color_discrete_map={"Actual": "#dbe3eb", "Con intervención": "#16337b"},
+        )
+        fig_sim.update_layout(
+            height=320,
+            xaxis=dict(title="Nivel de riesgo"),
+            yaxis=dict(title="Empleados"),
+        )
+        apply_plotly_style(fig_sim)
+        st.plotly_chart(fig_sim, use_container_width=True)
+
     st.markdown("</div>", unsafe_allow_html=True)
+
+# Desglose del arranque en frío (imports / datos / modelo) para diagnóstico
+if os.environ.get("IMPULSO_STARTUP_REPORT"):
+    st.caption(startup_report.summary())
@@ -1,10 +1,9 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
 import plotly.express as px
-from sklearn.model_selection import train_test_split
-from sklearn.compose import ColumnTransformer
-from sklearn.ensemble import RandomForestClassifier
+
+from core.resources import get_alert_engine, get_dashboard_kpis, get_model_server, get_risk_histogram, load_employees
+from core.styling import TAB_NAMES, apply_global_styles
 
 # ============================================
 # CONFIGURACIÓN GENERAL
@@ -13,276 +12,22 @@ from sklearn.ensemble import RandomForestClassifier
 st.set_page_config(page_title="Impulso — Bienestar y Riesgo", layout="wide")
 
 # ============================================
-# ESTILOS GLOBALES IMPULSO (VERSIÓN CORREGIDA)
+# ESTILOS GLOBALES IMPULSO
 # ============================================
 
-st.markdown("""
-    <style>
-        /* Eliminar padding superior del header invisible de Streamlit */
-        header[data-testid="stHeader"] {
-            height: 0px !important;
-            padding: 0px !important;
-            margin: 0px !important;
-        }
-
-
-            /* ======== TOP BAR FULL WIDTH ======== */
-        .top-nav {
-            background-color: #16337b;
-            padding: 18px 30px;
-            color: white;
-            font-size: 22px;
-            font-weight: 600;
-            border-radius: 0 0 16px 16px;
-            margin-bottom: 0px;
-            width: 100vw;              /* Fuerza ancho completo */
-            margin-left: calc(-50vw + 50%); /* Centra el contenedor */
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-
-        /* ======== TABS ESTILO IMPULSO ======== */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 8px;
-            background-color: transparent;
-            padding-left: 0;
-        }
-
-        .stTabs [data-baseweb="tab"] {
-            background-color: #16337b !important;   /* Color base */
-            color: white !important;                /* Texto blanco */
-            padding: 10px 18px !important;
-            border-radius: 10px 10px 0 0 !important;
-            font-weight: 600 !important;
-            border: none !important;
-        }
-
-        /* ======== TAB SELECCIONADO ======== */
-        .stTabs [aria-selected="true"] {
-            background-color: white !important;     /* Fondo blanco */
-            color: #16337b !important;              /* Texto azul */
-            border-bottom: 3px solid #16337b !important;
-        }
-
-        /* ======== FIX GLOBAL PARA FONDO ======== */
-        html, body, .stApp {
-            background-color: #f0f0f0 !important;
-            font-family: 'Montserrat', sans-serif;
-        }
-
-        /* ======== TOP BAR ======== */
-        .top-nav {
-            background-color: #16337b;
-            padding: 18px 30px;
-            color: white;
-            font-size: 22px;
-            font-weight: 600;
-            border-radius: 0 0 16px 16px;
-            margin-bottom: 25px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-
-        .top-nav-right {
-            font-size: 14px;
-            font-weight: 400;
-            opacity: 0.9;
-        }
-
-        /* ======== KPI CARDS ======== */
-        .kpi-card {
-            background: white;
-            padding: 18px 20px;
-            border-radius: 14px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.06);
-            border-top: 4px solid #25b5e8;
-            height: 130px;
-        }
-
-        .kpi-title {
-            font-size: 13px;
-            color: #555;
-            font-weight: 600;
-        }
-
-        .kpi-value {
-            font-size: 30px;
-            font-weight: 700;
-            color: #16337b;
-            margin-top: 6px;
-        }
-
-        .kpi-sub {
-            font-size: 13px;
-            color: #25b5e8;
-            font-weight: 600;
-            margin-top: 2px;
-        }
-
-        /* ======== ALERTAS ======== */
-        .alert-box {
-            background-color: #dbe3eb;
-            padding: 12px 14px;
-            border-radius: 10px;
-            margin-bottom: 8px;
-            border-left: 6px solid #16337b;
-            font-size: 13px;
-            color: #16337b;
-        }
-
-        /* ======== TITULOS ======== */
-        .section-title {
-            font-size: 20px;
-            font-weight: 700;
-            color: #16337b;
-            margin-top: 25px;
-            margin-bottom: 10px;
-        }
-
-        /* ======== RECOMENDACIONES ======== */
-        .rec-summary-box {
-            background: white;
-            padding: 18px;
-            border-radius: 14px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.06);
-            text-align: center;
-        }
-
-        .rec-summary-value {
-            font-size: 28px;
-            font-weight: 700;
-            color: #16337b;
-        }
-
-        .rec-summary-label {
-            font-size: 13px;
-            color: #777;
-            margin-top: -6px;
-        }
-
-        .rec-card {
-            background: white;
-            padding: 20px;
-            border-radius: 14px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.06);
-            margin-bottom: 15px;
-            border-left: 6px solid #25b5e8;
-        }
-
-        .rec-title {
-            font-size: 18px;
-            font-weight: 700;
-            color: #16337b;
-            margin-bottom: 6px;
-        }
-
-        .rec-meta {
-            font-size: 13px;
-            color: #555;
-            margin-bottom: 10px;
-        }
-
-        .rec-description {
-            font-size: 14px;
-            color: #333;
-            margin-bottom: 12px;
-        }
-
-        .rec-tag {
-            display: inline-block;
-            background-color: #dbe3eb;
-            padding: 4px 10px;
-            border-radius: 8px;
-            font-size: 12px;
-            margin-right: 6px;
-            color: #16337b;
-            font-weight: 600;
-        }
-
-        .stButton>button {
-            background-color: #25b5e8;
-            color: white;
-            border-radius: 20px;
-            border: none;
-            padding: 6px 16px;
-            font-weight: 600;
-        }
-
-    </style>
-""", unsafe_allow_html=True)
+apply_global_styles()
 
 # ============================================
-# 1. GENERAR DATASET SINTÉTICO
+# 1. DATASET (COMPARTIDO CON app.py)
 # ============================================
 
-np.random.seed(123)
-n = 800
-
-stress = np.random.randint(1, 6, n)
-burnout = np.random.randint(1, 6, n)
-workload = np.random.randint(60, 150, n)
-absenteeism = np.random.randint(0, 80, n)
-anxiety = np.random.randint(1, 6, n)
-
-risk_score = (
-    0.35 * (burnout/5) +
-    0.25 * (stress/5) +
-    0.20 * (workload/150) +
-    0.10 * (absenteeism/80) +
-    0.10 * (anxiety/5) +
-    np.random.normal(0, 0.05, n)
-)
-
-risk_score = np.clip(risk_score, 0, 1)
-
-risk_level = pd.cut(
-    risk_score,
-    bins=[0, 0.33, 0.66, 1],
-    labels=["Bajo", "Medio", "Alto"]
-)
-
-departments = np.random.choice(
-    ["Operaciones", "Ventas", "IT", "RRHH", "Finanzas"],
-    size=n,
-    p=[0.3, 0.25, 0.2, 0.15, 0.1]
-)
-
-performance = np.random.normal(80, 8, n)
-performance = np.clip(performance, 40, 100)
-
-df = pd.DataFrame({
-    "department": departments,
-    "stress": stress,
-    "burnout": burnout,
-    "workload": workload,
-    "absenteeism": absenteeism,
-    "anxiety": anxiety,
-    "risk_score": risk_score,
-    "risk_level": risk_level,
-    "performance": performance
-})
+df, data_version = load_employees()
 
 # ============================================
-# 2. ENTRENAR MODELO
+# 2. MODELO (COMPARTIDO CON app.py)
 # ============================================
 
-X = df[["stress", "burnout", "workload", "absenteeism", "anxiety"]]
-y = df["risk_level"]
-
-preprocess = ColumnTransformer([
-    ("num", "passthrough", X.columns)
-])
-
-X_processed = preprocess.fit_transform(X)
-
-X_train, X_test, y_train, y_test = train_test_split(
-    X_processed, y, test_size=0.3, random_state=123, stratify=y
-)
-
-rf = RandomForestClassifier(n_estimators=600, random_state=123)
-rf.fit(X_train, y_train)
+preprocess, X_processed, rf = get_model_server(df, data_version).current()
 
 # ============================================
 # 3. TOP BAR + NAVEGACIÓN
@@ -295,26 +40,27 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-tabs = st.tabs(["Dashboard", "Empleados", "Análisis de Riesgo", "Factores de Riesgo", "Segmentación", "Recomendaciones"])
+tabs = st.tabs(TAB_NAMES)
 
 # ============================================
 # 4. TAB: DASHBOARD
 # ============================================
 
 with tabs[0]:
+    kpis = get_dashboard_kpis(df, data_version)
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         st.markdown(f"""
             <div class='kpi-card'>
                 <div class='kpi-title'>Score de Desempeño</div>
-                <div class='kpi-value'>{df['performance'].mean():.1f}/100</div>
+                <div class='kpi-value'>{kpis.perf_avg:.1f}/100</div>
                 <div class='kpi-sub'>+5.2%</div>
             </div>
         """, unsafe_allow_html=True)
 
     with col2:
-        high_risk_pct = (df["risk_level"] == "Alto").mean() * 100
+        high_risk_pct = kpis.high_risk_pct
         st.markdown(f"""
             <div class='kpi-card'>
                 <div class='kpi-title'>Nivel de Riesgo</div>
@@ -327,7 +73,7 @@ with tabs[0]:
         st.markdown(f"""
             <div class='kpi-card'>
                 <div class='kpi-title'>Índice de Sobrecarga</div>
-                <div class='kpi-value'>{df['workload'].mean():.1f}/150</div>
+                <div class='kpi-value'>{kpis.workload_avg:.1f}/150</div>
                 <div class='kpi-sub'>Riesgo Alto</div>
             </div>
         """, unsafe_allow_html=True)
@@ -342,9 +88,8 @@ with tabs[0]:
         """, unsafe_allow_html=True)
 
     st.markdown("<div class='section-title'>Alertas</div>", unsafe_allow_html=True)
-    st.markdown(f"<div class='alert-box'>{(df['risk_level']=='Alto').sum()} empleados con alto riesgo de burnout en Operaciones</div>", unsafe_allow_html=True)
-    st.markdown(f"<div class='alert-box'>{(df['workload']>130).sum()} empleados con carga de trabajo superior al 130%</div>", unsafe_allow_html=True)
-    st.markdown(f"<div class='alert-box'>{(df['performance']>95).sum()} empleados cumplieron 100% de objetivos este mes</div>", unsafe_allow_html=True)
+    for alert in get_alert_engine(df, data_version).active_alerts():
+        st.markdown(f"<div class='alert-box'>{alert['message']}</div>", unsafe_allow_html=True)
 
 # ============================================
 # 5. TAB: EMPLEADOS
@@ -360,7 +105,10 @@ with tabs[1]:
 
 with tabs[2]:
     st.markdown("<div class='section-title'>Distribución del Riesgo</div>", unsafe_allow_html=True)
-    fig_hist = px.histogram(df, x="risk_score", nbins=20, color="risk_level")
+    # Conteos precalculados por nivel y departamento: la figura lleva 20 barras por nivel, no las filas
+    risk_hist = get_risk_histogram(df, data_version)
+    hist_dept = st.selectbox("Departamento", ["Todos"] + risk_hist.departments, key="hist_dept")
+    fig_hist = risk_hist.figure(None if hist_dept == "Todos" else [hist_dept])
     st.plotly_chart(fig_hist, use_container_width=True)
 
 # ============================================
@@ -0,0 +1,235 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from core.data import RISK_LEVELS
+
+# ============================================
+# AGREGADOS DEL DASHBOARD
+# ============================================
+
+
+# Las métricas se declaran una vez: cada medida es una columna (valor o
+# indicador 0/1) que se suma agrupada por (nivel de riesgo, departamento) al
+# cargar los datos. Todos los KPIs de una vista, con cualquier combinación de
+# filtros, salen de sumar unas pocas filas de esa tabla de totales.
+KPI_MEASURES = [
+    {"name": "performance", "column": "performance"},
+    {"name": "workload", "column": "workload"},
+    {"name": "risk_score", "column": "risk_score"},
+    {"name": "absenteeism", "column": "absenteeism"},
+    {"name": "stress", "column": "stress"},
+    {"name": "burnout", "column": "burnout"},
+    {"name": "anxiety", "column": "anxiety"},
+    {"name": "low_risk", "column": "risk_level", "equals": "Bajo"},
+    {"name": "medium_risk", "column": "risk_level", "equals": "Medio"},
+    {"name": "high_risk", "column": "risk_level", "equals": "Alto"},
+    {"name": "compliant", "column": "performance", "min": 85},
+]
+
+
+@dataclass(frozen=True)
+class DashboardMetrics:
+    employees: int
+    perf_avg: float
+    workload_avg: float
+    avg_risk: float
+    absenteeism_avg: float
+    stress_avg: float
+    burnout_avg: float
+    anxiety_avg: float
+    level_counts: dict
+    high_risk_count: int
+    high_risk_pct: float
+    compliance: float
+    rotation: float
+    productivity: float
+    overload_index: float
+    tasks_done: int
+    efficiency: float
+    risk_label: str
+    risk_color: str
+
+
+class KpiStore:
+    def __init__(self, totals, levels, departments):
+        # totals: (niveles + 1, departamentos, medidas + 1); el último nivel
+        # guarda filas sin nivel y la última medida es el conteo de filas
+        self.totals = np.asarray(totals, dtype=float)
+        self.levels = list(levels)
+        self.departments = list(departments)
+
+    @classmethod
+    def from_data(cls, data, measures=KPI_MEASURES, levels=RISK_LEVELS):
+        level_lookup = {level: i for i, level in enumerate(levels)}
+        factorized = {"risk_level": pd.factorize(data["risk_level"])}
+        level_codes, level_uniques = factorized["risk_level"]
+        level_of_code = np.array([level_lookup.get(u, len(levels)) for u in level_uniques] + [len(levels)], dtype=np.int64)
+        dept_codes, departments = pd.factorize(data["department"], sort=True)
+        groups = level_of_code[level_codes] * len(departments) + dept_codes
+        keep = dept_codes >= 0
+        groups = groups[keep]
+
+        # Un bincount ponderado por medida sobre los mismos códigos de grupo:
+        # sin ordenar ni copiar filas, cada columna se lee una sola vez
+        n_groups = (len(levels) + 1) * len(departments)
+        columns = []
+        for measure in measures:
+            if "equals" in measure:
+                # Sobre códigos enteros: comparar strings fila a fila es lo lento
+                column = measure["column"]
+                if column not in factorized:
+                    factorized[column] = pd.factorize(data[column])
+                codes, uniques = factorized[column]
+                target = list(uniques).index(measure["equals"]) if measure["equals"] in uniques else -2
+                values = codes == target
+            elif "min" in measure:
+                values = data[measure["column"]].to_numpy() >= measure["min"]
+            else:
+                values = data[measure["column"]].to_numpy(dtype=float)
+            columns.append(np.bincount(groups, weights=values[keep], minlength=n_groups))
+        columns.append(np.bincount(groups, minlength=n_groups))
+        totals = np.column_stack(columns)
+        return cls(totals.reshape(len(levels) + 1, len(departments), -1), levels, departments)
+
+    def sums(self, departments=None, levels=None, measures=KPI_MEASURES):
+        totals = self.totals
+        if levels is not None:
+            totals = totals[[self.levels.index(level) for level in levels if level in self.levels]]
+        if departments is not None:
+            totals = totals[:, [self.departments.index(d) for d in departments if d in self.departments]]
+        summed = totals.sum(axis=(0, 1))
+        return dict(zip([m["name"] for m in measures] + ["n"], summed))
+
+    def metrics(self, departments=None, levels=None):
+        return metrics_from_totals(self.sums(departments, levels))
+
+
+def dashboard_kpis(data):
+    return KpiStore.from_data(data).metrics()
+
+
+def metrics_from_totals(totals):
+    # Sumas por medida + conteo "n": las calcula KpiStore o la base SQL
+    n = int(totals["n"])
+    means = {name: (value / n if n else 0.0) for name, value in totals.items()}
+    perf_avg, workload_avg, avg_risk = means["performance"], means["workload"], means["risk_score"]
+    if avg_risk < 0.33:
+        risk_label = "BAJO"
+        risk_color = "#25b5e8"
+    elif avg_risk < 0.66:
+        risk_label = "MEDIO"
+        risk_color = "#16337b"
+    else:
+        risk_label = "ALTO"
+        risk_color = "#E74C3C"
+
+    return DashboardMetrics(
+        employees=n,
+        perf_avg=perf_avg,
+        workload_avg=workload_avg,
+        avg_risk=avg_risk,
+        absenteeism_avg=means["absenteeism"],
+        stress_avg=means["stress"],
+        burnout_avg=means["burnout"],
+        anxiety_avg=means["anxiety"],
+        level_counts={
+            level: int(round(totals[name]))
+            for level, name in zip(RISK_LEVELS, ["low_risk", "medium_risk", "high_risk"])
+        },
+        high_risk_count=int(round(totals["high_risk"])),
+        high_risk_pct=means["high_risk"] * 100,
+        compliance=means["compliant"] * 100,
+        rotation=means["absenteeism"] / 80 * 20,
+        productivity=float(np.clip(perf_avg + 6, 0, 100)),
+        overload_index=workload_avg / 150 * 100,
+        tasks_done=int((perf_avg / 100) * 3000),
+        efficiency=float(np.clip(100 - means["stress"] * 8, 0, 100)),
+        risk_label=risk_label,
+        risk_color=risk_color,
+    )
+
+
+def level_distribution(metrics):
+    # Porcentaje por nivel de riesgo (dona de las pestañas de riesgo)
+    total = sum(metrics.level_counts.values())
+    return pd.DataFrame({
+        "Nivel": list(metrics.level_counts),
+        "Porcentaje": [count / total * 100 if total else 0.0 for count in metrics.level_counts.values()],
+    })
+
+
+def department_metrics(data):
+    dept_metrics = (
+        data.groupby("department", as_index=False)
+        .agg(
+            performance=("performance", "mean"),
+            risk=("risk_score", "mean"),
+            workload=("workload", "mean"),
+            absenteeism=("absenteeism", "mean"),
+        )
+    )
+    return department_indices(dept_metrics)
+
+
+def department_indices(dept_metrics):
+    dept_metrics["risk_idx"] = dept_metrics["risk"] * 100
+    dept_metrics["workload_idx"] = dept_metrics["workload"] / 150 * 100
+    dept_metrics["abs_idx"] = dept_metrics["absenteeism"] / 80 * 100
+    return dept_metrics
+
+
+if __name__ == "__main__":
+    # python -m core.aggregates [millones]: una reducción de pandas por KPI
+    # (patrón anterior) frente a la pasada única de KpiStore, sin filtros y
+    # con los filtros de la pestaña Análisis de Riesgo
+    import sys
+    import time
+
+    from core.data import employee_filter_mask, generate_employees
+
+    def separate_reductions(data):
+        return {
+            "perf_avg": float(data["performance"].mean()),
+            "workload_avg": float(data["workload"].mean()),
+            "avg_risk": float(data["risk_score"].mean()),
+            "high_risk_pct": float((data["risk_level"] == "Alto").mean() * 100),
+            "high_risk_count": int((data["risk_level"] == "Alto").sum()),
+            "absenteeism_avg": float(data["absenteeism"].mean()),
+            "compliance": float((data["performance"] >= 85).mean() * 100),
+            "stress_avg": float(data["stress"].mean()),
+            "burnout_avg": float(data["burnout"].mean()),
+            "anxiety_avg": float(data["anxiety"].mean()),
+        }
+
+    def best_ms(fn, repeat=5):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn()
+            times.append(time.perf_counter() - start)
+        return min(times) * 1000, result
+
+    n = int(float(sys.argv[1]) * 1_000_000) if len(sys.argv) > 1 else 1_000_000
+    df = generate_employees(n)
+    build_ms, store = best_ms(lambda: KpiStore.from_data(df))
+    print(f"{n:,} empleados · KpiStore construido en {build_ms:.0f} ms")
+
+    cases = [("Dashboard (sin filtros)", None, None), ("IT", ["IT"], None), ("Operaciones / Alto", ["Operaciones"], ["Alto"])]
+    for label, departments, levels in cases:
+        def filtered():
+            subset = df
+            if departments:
+                subset = subset[subset["department"].isin(departments)]
+            if levels:
+                subset = subset[subset["risk_level"].isin(levels)]
+            return separate_reductions(subset)
+
+        pandas_ms, expected = best_ms(filtered)
+        store_ms, metrics = best_ms(lambda: store.metrics(departments, levels))
+        assert all(np.isclose(getattr(metrics, k), v) for k, v in expected.items())
+        subset = df[employee_filter_mask(df, departments[0] if departments else "Todos", levels[0] if levels else "Todos")]
+        shares = subset["risk_level"].value_counts(normalize=True).reindex(RISK_LEVELS).fillna(0) * 100
+        assert np.allclose(level_distribution(metrics)["Porcentaje"], shares)
+        print(f"  {label:26s} reducciones separadas {pandas_ms:6.1f} ms · KpiStore {store_ms:.3f} ms")
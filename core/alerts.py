@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+
+# ============================================
+# MOTOR DE ALERTAS
+# ============================================
+
+# Reglas declarativas: umbral sobre una columna, alcance opcional por
+# departamento y, con "change", condición sobre la variación del valor
+# respecto a la versión anterior de cada registro.
+ALERT_RULES = [
+    {
+        "id": "alto_operaciones",
+        "level": "danger",
+        "column": "risk_level",
+        "op": "==",
+        "value": "Alto",
+        "department": "Operaciones",
+        "message": "{count} empleados con alto riesgo de burnout en Operaciones",
+    },
+    {
+        "id": "sobrecarga",
+        "level": "warning",
+        "column": "workload",
+        "op": ">",
+        "value": 130,
+        "message": "{count} empleados con carga de trabajo superior al 130%",
+    },
+    {
+        "id": "objetivos",
+        "level": "info",
+        "column": "performance",
+        "op": ">",
+        "value": 95,
+        "message": "{count} empleados cumplieron 100% de objetivos este mes",
+    },
+    {
+        "id": "riesgo_en_aumento",
+        "level": "danger",
+        "column": "risk_score",
+        "op": ">=",
+        "value": 0.10,
+        "change": True,
+        "message": "{count} empleados aumentaron su score de riesgo 10 puntos o más",
+    },
+]
+
+ALERT_OPS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+    "in": np.isin,
+}
+
+
+class AlertEngine:
+    # Compila las reglas a máscaras vectorizadas y las evalúa en una sola
+    # pasada sobre las columnas necesarias. Las columnas de texto se guardan
+    # como códigos enteros para comparar sin strings. Los conteos se mantienen
+    # de forma incremental cuando se actualizan registros.
+
+    def __init__(self, data, rules):
+        self.rules = rules
+        columns = {r["column"] for r in rules} | {"department"}
+        self.categories = {}
+        self.current = {}
+        for col in columns:
+            values = data[col].to_numpy()
+            if values.dtype == object or isinstance(data[col].dtype, pd.CategoricalDtype):
+                codes, uniques = pd.factorize(data[col].astype(str))
+                self.categories[col] = list(uniques)
+                self.current[col] = codes
+            else:
+                self.current[col] = values.astype(float)
+        self.previous = {col: values.copy() for col, values in self.current.items()}
+        self._compiled = [self._compile(rule) for rule in rules]
+
+        now = pd.Timestamp.now()
+        self.masks = np.vstack([fn(self.current, self.previous, slice(None)) for fn in self._compiled])
+        self.counts = self.masks.sum(axis=1)
+        self.changed_at = [now] * len(rules)
+
+    def _code(self, col, value):
+        cats = self.categories[col]
+        if value not in cats:
+            cats.append(value)
+        return cats.index(value)
+
+    def _compile(self, rule):
+        col = rule["column"]
+        op = ALERT_OPS[rule["op"]]
+        value = rule["value"]
+        if col in self.categories:
+            value = [self._code(col, v) for v in value] if rule["op"] == "in" else self._code(col, value)
+        dept_code = self._code("department", rule["department"]) if rule.get("department") else None
+
+        def evaluate(current, previous, rows):
+            x = current[col][rows]
+            if rule.get("change"):
+                x = x - previous[col][rows]
+            mask = op(x, value)
+            if dept_code is not None:
+                mask &= current["department"][rows] == dept_code
+            return mask
+
+        return evaluate
+
+    def update(self, rows, changes):
+        # rows: posiciones de los registros modificados; changes: columna -> nuevos valores
+        rows = np.asarray(rows)
+        touched = set(changes)
+        for col, values in changes.items():
+            if col not in self.current:
+                continue
+            if col in self.categories:
+                values = np.array([self._code(col, str(v)) for v in values])
+            self.previous[col][rows] = self.current[col][rows]
+            self.current[col][rows] = values
+
+        now = pd.Timestamp.now()
+        for i, (rule, fn) in enumerate(zip(self.rules, self._compiled)):
+            if rule["column"] not in touched and not (rule.get("department") and "department" in touched):
+                continue
+            new_mask = fn(self.current, self.previous, rows)
+            delta = int(new_mask.sum()) - int(self.masks[i, rows].sum())
+            self.masks[i, rows] = new_mask
+            if delta:
+                self.counts[i] += delta
+                self.changed_at[i] = now
+
+    def active_alerts(self):
+        return [
+            {
+                "id": rule["id"],
+                "level": rule["level"],
+                "count": int(count),
+                "message": rule["message"].format(count=int(count)),
+                "changed_at": changed_at,
+            }
+            for rule, count, changed_at in zip(self.rules, self.counts, self.changed_at)
+            if count > 0
+        ]
+
+
+def format_elapsed(since):
+    minutes = int((pd.Timestamp.now() - since).total_seconds() // 60)
+    if minutes < 1:
+        return "Hace unos segundos"
+    if minutes < 60:
+        return f"Hace {minutes} min"
+    hours = minutes // 60
+    return f"Hace {hours} hora" if hours == 1 else f"Hace {hours} horas"
@@ -0,0 +1,192 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# DATASET SINTÉTICO DE EMPLEADOS
+# ============================================
+
+DEPARTMENTS = ["Operaciones", "Ventas", "IT", "RRHH", "Finanzas"]
+RISK_LEVELS = ["Bajo", "Medio", "Alto"]
+
+FIRST_NAMES = [
+    "Ana", "Luis", "Carlos", "María", "Jorge", "Sofía", "Diego", "Lucía", "Pedro", "Valeria",
+    "Miguel", "Carmen", "Fernando", "Paula", "Raúl", "Elena", "Javier", "Gabriela", "Andrés", "Natalia"
+]
+LAST_NAMES = [
+    "García", "Martínez", "López", "Hernández", "González", "Pérez", "Sánchez", "Romero", "Torres", "Vega",
+    "Ruiz", "Flores", "Castro", "Ríos", "Mendoza", "Ortega", "Núñez", "Navarro", "Silva", "Morales"
+]
+ROLES_BY_DEPT = {
+    "Operaciones": ["Supervisor de Producción", "Coordinador de Operaciones", "Analista de Procesos"],
+    "Ventas": ["Ejecutivo de Ventas", "Consultor Comercial", "Key Account"],
+    "IT": ["Desarrollador Senior", "Analista de Datos", "Ingeniero de Sistemas"],
+    "RRHH": ["Analista de RRHH", "Business Partner", "Especialista en Bienestar"],
+    "Finanzas": ["Analista Financiero", "Controller", "Planeación Financiera"],
+}
+
+
+def risk_level_from_score(risk_score):
+    return pd.cut(
+        risk_score,
+        bins=[0, 0.33, 0.66, 1],
+        labels=RISK_LEVELS
+    )
+
+
+def generate_employees(n=800, seed=123):
+    # RandomState local: misma secuencia que np.random.seed(seed) sin tocar el estado global
+    rs = np.random.RandomState(seed)
+
+    stress = rs.randint(1, 6, n)
+    burnout = rs.randint(1, 6, n)
+    workload = rs.randint(60, 150, n)
+    absenteeism = rs.randint(0, 80, n)
+    anxiety = rs.randint(1, 6, n)
+
+    risk_score = (
+        0.35 * (burnout/5) +
+        0.25 * (stress/5) +
+        0.20 * (workload/150) +
+        0.10 * (absenteeism/80) +
+        0.10 * (anxiety/5) +
+        rs.normal(0, 0.05, n)
+    )
+
+    risk_score = np.clip(risk_score, 0, 1)
+
+    departments = rs.choice(
+        DEPARTMENTS,
+        size=n,
+        p=[0.3, 0.25, 0.2, 0.15, 0.1]
+    )
+
+    performance = rs.normal(80, 8, n)
+    performance = np.clip(performance, 40, 100)
+
+    df = pd.DataFrame({
+        "department": departments,
+        "stress": stress,
+        "burnout": burnout,
+        "workload": workload,
+        "absenteeism": absenteeism,
+        "anxiety": anxiety,
+        "risk_score": risk_score,
+        "risk_level": risk_level_from_score(risk_score),
+        "performance": performance
+    })
+
+    # Metadatos simulados de empleados
+    name_rng = np.random.default_rng(321)
+    first = name_rng.choice(FIRST_NAMES, n)
+    last = name_rng.choice(LAST_NAMES, n)
+    df["employee_name"] = [f"{f} {l}" for f, l in zip(first, last)]
+    df["employee_role"] = [name_rng.choice(ROLES_BY_DEPT[d]) for d in df["department"]]
+    df["employee_id"] = np.arange(1, n + 1)
+    status_rng = np.random.default_rng(2026)
+    df["active_status"] = status_rng.choice(["Activo", "Inactivo"], size=n, p=[0.86, 0.14])
+    return df
+
+
+def generate_extended_employees(n=800, seed=123):
+    # Variante de Modelo_Python.py con variables psicológicas, HRIS y operativas
+    rs = np.random.RandomState(seed)
+
+    stress = rs.randint(1, 6, n)
+    burnout = rs.randint(1, 6, n)
+    anxiety = rs.randint(1, 6, n)
+    depression = rs.randint(1, 6, n)
+    support_supervisor = rs.randint(1, 6, n)
+    support_coworkers = rs.randint(1, 6, n)
+    leave_difficulty = rs.randint(1, 6, n)
+
+    age = rs.randint(20, 60, n)
+    tenure = rs.randint(0, 15, n)
+    absenteeism = rs.randint(0, 80, n)
+    performance = rs.randint(50, 100, n)
+    promotion = rs.choice([0, 1], n, p=[0.8, 0.2])
+
+    department = rs.choice(DEPARTMENTS, n)
+
+    workload = rs.randint(60, 150, n)
+    task_completion = rs.randint(50, 100, n)
+    error_rate = rs.randint(0, 20, n)
+
+    base_risk = (
+        0.35 * (burnout/5) +
+        0.25 * (stress/5) +
+        0.20 * (workload/150) +
+        0.10 * (absenteeism/80) +
+        0.10 * (anxiety/5)
+    )
+
+    # Ruido controlado para evitar perfección
+    noise = rs.normal(0, 0.05, n)
+
+    risk_score = np.clip(base_risk + noise, 0, 1)
+
+    return pd.DataFrame({
+        "stress": stress,
+        "burnout": burnout,
+        "anxiety": anxiety,
+        "depression": depression,
+        "support_supervisor": support_supervisor,
+        "support_coworkers": support_coworkers,
+        "leave_difficulty": leave_difficulty,
+        "age": age,
+        "tenure": tenure,
+        "absenteeism": absenteeism,
+        "performance": performance,
+        "promotion": promotion,
+        "department": department,
+        "workload": workload,
+        "task_completion": task_completion,
+        "error_rate": error_rate,
+        "risk_score": risk_score,
+        "risk_level": risk_level_from_score(risk_score)
+    })
+
+
+def data_version(data):
+    # Huella del contenido: las estructuras cacheadas se reconstruyen solo si cambia
+    return str(pd.util.hash_pandas_object(data, index=False).sum())
+
+
+def file_version(path, block_size=1 << 20):
+    # Huella de un archivo de origen (CSV): sha256 por bloques, sin cargarlo
+    # entero. Se recuerda por (ruta, mtime, tamaño): un rerun no relee el archivo
+    stat = os.stat(path)
+    return _file_digest(os.path.abspath(path), stat.st_mtime_ns, stat.st_size, block_size)
+
+
+@lru_cache(maxsize=64)
+def _file_digest(path, mtime_ns, size, block_size):
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def normalize_query(query):
+    # Búsqueda literal sin distinguir mayúsculas (Unicode): la usan pandas y SQLite
+    return query.strip().lower()
+
+
+def employee_filter_mask(data, dept="Todos", risk="Todos", query=""):
+    mask = np.ones(len(data), dtype=bool)
+    if dept != "Todos":
+        mask &= (data["department"] == dept).to_numpy()
+    if risk != "Todos":
+        mask &= (data["risk_level"] == risk).to_numpy()
+    if query:
+        q = normalize_query(query)
+        mask &= (
+            data["employee_name"].str.lower().str.contains(q, regex=False) |
+            data["employee_role"].str.lower().str.contains(q, regex=False)
+        ).to_numpy()
+    return mask
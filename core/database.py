@@ -0,0 +1,321 @@
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.aggregates import KPI_MEASURES, KpiStore, department_indices
+from core.data import RISK_LEVELS, normalize_query
+from core.employees import PROFILE_COLUMNS, build_profile
+from core.export import EXPORT_CHUNK_ROWS, EXPORT_COLUMNS
+from core.files import atomic_write
+from core.model import MODEL_DIR
+
+# ============================================
+# BACKEND SQL EMBEBIDO (SQLite)
+# ============================================
+
+# Con IMPULSO_SQL_BACKEND=1 la tabla de empleados se vuelca a un archivo
+# SQLite con índices por departamento, nivel de riesgo, estado y employee_id.
+# Los filtros de la pestaña Empleados, los KPIs (Dashboard, Análisis de
+# Riesgo, Factores de Riesgo) y la exportación se resuelven como consultas:
+# a Python solo vuelven las filas del resultado (50 tarjetas, un perfil, una
+# tabla de totales, bloques del archivo exportado), no el frame completo.
+#
+# El frame sigue cargándose: el modelo, las alertas, la deriva, los
+# segmentos, el explorador y el simulador trabajan fila a fila sobre él. Este
+# backend acelera filtros y agregados; no reduce por sí solo la memoria.
+
+SQL_BACKEND = os.environ.get("IMPULSO_SQL_BACKEND", "") not in ("", "0")
+SQL_PATH = Path(os.environ.get("IMPULSO_SQL_PATH", MODEL_DIR / "employees.sqlite"))
+SQL_INSERT_ROWS = 100_000
+# Sube cuando cambia el esquema: fuerza reconstruir bases ya generadas
+SQL_SCHEMA = 5
+
+# Los agregados salen de tablas calculadas al construir la base: kpi_totals
+# (las sumas de KPI_MEASURES por nivel de riesgo y departamento, la misma
+# tabla que KpiStore) y department_summary. Combinar unas pocas filas es
+# instantáneo, recorrer millones en SQLite no.
+
+# Índices compuestos: el prefijo filtra y el resto ya viene en el orden del
+# ranking (riesgo y desempeño descendentes), así LIMIT corta la lectura
+SQL_INDEXES = {
+    "idx_department_rank": "department, risk_score DESC, performance DESC",
+    "idx_department_risk_rank": "department, risk_level, risk_score DESC, performance DESC",
+    "idx_risk_level_rank": "risk_level, risk_score DESC, performance DESC",
+    "idx_status": "active_status",
+    "idx_rank": "risk_score DESC, performance DESC",
+}
+RANK_ORDER = "risk_score DESC, performance DESC, employee_id"
+# lower() de SQLite solo pliega ASCII: el texto de búsqueda se guarda ya en
+# minúsculas con str.lower de Python, igual que el filtro de pandas
+SEARCH_COLUMNS = {"name_search": "employee_name", "role_search": "employee_role"}
+PROFILE_SELECT = ", ".join(PROFILE_COLUMNS)
+
+
+def build_employee_db(data, version, path=SQL_PATH):
+    # Se reconstruye solo si cambia la huella de los datos
+    path = Path(path)
+    if path.exists():
+        with sqlite3.connect(path) as conn:
+            stored = conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+        if stored and stored[0] == f"{version}/{SQL_SCHEMA}":
+            return path
+
+    # risk_level faltante queda NULL (no el texto "nan")
+    risk_level = data["risk_level"].astype(object)
+    table = data[PROFILE_COLUMNS].assign(
+        risk_level=risk_level.where(risk_level.notna(), None),
+        **{name: data[source].str.lower() for name, source in SEARCH_COLUMNS.items()},
+    )
+    columns = PROFILE_COLUMNS + list(SEARCH_COLUMNS)
+    with atomic_write(path) as tmp_path:
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute(
+                "CREATE TABLE employees (employee_id INTEGER PRIMARY KEY, "
+                + ", ".join(f"{c} {_sql_type(table[c])}" for c in columns[1:])
+                + ")"
+            )
+            placeholders = ", ".join("?" * len(columns))
+            for start in range(0, len(table), SQL_INSERT_ROWS):
+                chunk = table.iloc[start:start + SQL_INSERT_ROWS]
+                rows = zip(*(chunk[c].tolist() for c in columns))
+                conn.executemany(f"INSERT INTO employees VALUES ({placeholders})", rows)
+            for name, index_columns in SQL_INDEXES.items():
+                conn.execute(f"CREATE INDEX {name} ON employees ({index_columns})")
+            conn.execute(
+                "CREATE TABLE department_summary AS SELECT department, COUNT(*) AS n, "
+                "SUM(performance) AS performance, SUM(risk_score) AS risk_score, SUM(workload) AS workload, "
+                "SUM(absenteeism) AS absenteeism, SUM(stress) AS stress, SUM(burnout) AS burnout, SUM(anxiety) AS anxiety, "
+                "SUM(risk_level = 'Bajo') AS low_risk, SUM(risk_level = 'Medio') AS medium_risk, SUM(risk_level = 'Alto') AS high_risk, "
+                "SUM(performance >= 85) AS compliant FROM employees GROUP BY department ORDER BY department"
+            )
+            conn.execute(*kpi_totals_sql())
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("INSERT INTO meta VALUES ('data_version', ?)", (f"{version}/{SQL_SCHEMA}",))
+            conn.execute("ANALYZE")
+            conn.commit()
+        finally:
+            conn.close()
+    return path
+
+
+def kpi_totals_sql(measures=KPI_MEASURES):
+    # Mismas medidas que KpiStore.from_data; TOTAL() da 0 (no NULL) en grupos
+    # donde la comparación es NULL
+    sums, params = [], []
+    for measure in measures:
+        if "equals" in measure:
+            sums.append(f"TOTAL({measure['column']} = ?) AS {measure['name']}")
+            params.append(measure["equals"])
+        elif "min" in measure:
+            sums.append(f"TOTAL({measure['column']} >= ?) AS {measure['name']}")
+            params.append(measure["min"])
+        else:
+            sums.append(f"TOTAL({measure['column']}) AS {measure['name']}")
+    sql = (
+        "CREATE TABLE kpi_totals AS SELECT risk_level, department, " + ", ".join(sums)
+        + ", COUNT(*) AS n FROM employees GROUP BY risk_level, department"
+    )
+    return sql, params
+
+
+def _sql_type(series):
+    if pd.api.types.is_integer_dtype(series):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(series):
+        return "REAL"
+    return "TEXT"
+
+
+def filter_clause(dept="Todos", risk="Todos", query=""):
+    # Mismo criterio que core.data.employee_filter_mask
+    conditions, params = [], []
+    if dept != "Todos":
+        conditions.append("department = ?")
+        params.append(dept)
+    if risk != "Todos":
+        conditions.append("risk_level = ?")
+        params.append(risk)
+    if query:
+        # Subcadena literal (instr): sin comodines de LIKE ni metacaracteres
+        q = normalize_query(query)
+        conditions.append("(instr(name_search, ?) > 0 OR instr(role_search, ?) > 0)")
+        params += [q, q]
+    return (" WHERE " + " AND ".join(conditions)) if conditions else "", params
+
+
+class EmployeeDB:
+    def __init__(self, path=SQL_PATH):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._dept_means = None
+        self._kpi_store = None
+
+    def _conn(self):
+        # Una conexión de solo lectura por hilo (Streamlit atiende reruns en varios hilos)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            self._local.conn = conn
+        return conn
+
+    def query(self, sql, params=()):
+        return pd.read_sql_query(sql, self._conn(), params=list(params))
+
+    def scalar(self, sql, params=()):
+        return self._conn().execute(sql, list(params)).fetchone()[0]
+
+    def status_counts(self):
+        rows = dict(self._conn().execute("SELECT active_status, COUNT(*) FROM employees GROUP BY active_status"))
+        return sum(rows.values()), rows.get("Activo", 0), rows.get("Inactivo", 0)
+
+    def departments(self):
+        return [r[0] for r in self._conn().execute("SELECT department FROM department_summary ORDER BY department")]
+
+    def count(self, dept="Todos", risk="Todos", query=""):
+        where, params = filter_clause(dept, risk, query)
+        return self.scalar(f"SELECT COUNT(*) FROM employees{where}", params)
+
+    def first_id(self, dept="Todos", risk="Todos", query=""):
+        where, params = filter_clause(dept, risk, query)
+        return self.scalar(f"SELECT MIN(employee_id) FROM employees{where}", params)
+
+    def top_k(self, k, dept="Todos", risk="Todos", query=""):
+        where, params = filter_clause(dept, risk, query)
+        return self.query(f"SELECT {PROFILE_SELECT} FROM employees{where} ORDER BY {RANK_ORDER} LIMIT ?", params + [int(k)])
+
+    def filtered_ids(self, dept="Todos", risk="Todos", query=""):
+        where, params = filter_clause(dept, risk, query)
+        return self.query(f"SELECT employee_id FROM employees{where} ORDER BY employee_id", params)["employee_id"].to_numpy()
+
+    def contains(self, emp_id, dept="Todos", risk="Todos", query=""):
+        where, params = filter_clause(dept, risk, query)
+        where = f"{where} AND employee_id = ?" if where else " WHERE employee_id = ?"
+        return self._conn().execute(f"SELECT 1 FROM employees{where}", params + [int(emp_id)]).fetchone() is not None
+
+    def row(self, emp_id):
+        cursor = self._conn().execute(f"SELECT {PROFILE_SELECT} FROM employees WHERE employee_id = ?", (int(emp_id),))
+        values = cursor.fetchone()
+        if values is None:
+            raise KeyError(emp_id)
+        return dict(zip([d[0] for d in cursor.description], values))
+
+    def profile(self, emp_id):
+        if self._dept_means is None:
+            self._dept_means = self.department_metrics().set_index("department").rename(
+                columns={"risk": "risk_score"}
+            ).to_dict("index")
+        return build_profile(self.row(emp_id), self._dept_means)
+
+    def iter_export_chunks(self, dept="Todos", risk="Todos", query="", chunk_rows=EXPORT_CHUNK_ROWS):
+        # Mismos bloques que core.export.iter_export_chunks, leídos con fetchmany
+        where, params = filter_clause(dept, risk, query)
+        cursor = self._conn().execute(
+            f"SELECT {', '.join(EXPORT_COLUMNS)} FROM employees{where} ORDER BY employee_id", params
+        )
+        while rows := cursor.fetchmany(chunk_rows):
+            yield pd.DataFrame.from_records(rows, columns=EXPORT_COLUMNS)
+
+    def kpi_store(self, levels=RISK_LEVELS, measures=KPI_MEASURES):
+        # La tabla de totales de KpiStore sin pasar por el frame
+        if self._kpi_store is None:
+            rows = self.query("SELECT * FROM kpi_totals")
+            departments = sorted(rows["department"].dropna().unique())
+            level_of = {level: i for i, level in enumerate(levels)}
+            totals = np.zeros((len(levels) + 1, len(departments), len(measures) + 1))
+            columns = [m["name"] for m in measures] + ["n"]
+            for row in rows.dropna(subset=["department"]).itertuples(index=False):
+                level = level_of.get(row.risk_level, len(levels))
+                totals[level, departments.index(row.department)] += [getattr(row, c) for c in columns]
+            self._kpi_store = KpiStore(totals, levels, departments)
+        return self._kpi_store
+
+    def dashboard_kpis(self):
+        return self.kpi_store().metrics()
+
+    def department_metrics(self):
+        return department_indices(self.query(
+            "SELECT department, performance / n AS performance, risk_score / n AS risk, "
+            "CAST(workload AS REAL) / n AS workload, CAST(absenteeism AS REAL) / n AS absenteeism "
+            "FROM department_summary ORDER BY department"
+        ))
+
+
+if __name__ == "__main__":
+    # python -m core.database [millones]: filtros de la pestaña Empleados en
+    # pandas (máscara + orden) frente a SQLite con índices
+    import sys
+    import tempfile
+    import time
+    from dataclasses import astuple
+
+    from core.aggregates import dashboard_kpis, department_metrics
+    from core.export import iter_export_chunks
+    from core.data import data_version, employee_filter_mask, generate_employees
+
+    n = int(float(sys.argv[1]) * 1_000_000) if len(sys.argv) > 1 else 2_000_000
+    df = generate_employees(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        path = build_employee_db(df, data_version(df), Path(tmp) / "employees.sqlite")
+        print(f"{n:,} empleados · base de {path.stat().st_size / 1e6:.0f} MB construida en {time.perf_counter() - start:.1f}s")
+        db = EmployeeDB(path)
+
+        cases = [("Todos", "Todos", ""), ("IT", "Todos", ""), ("Ventas", "Alto", ""), ("Todos", "Medio", "ana")]
+        # Paridad de la búsqueda: mayúsculas acentuadas, metacaracteres de
+        # regex y comodines de LIKE deben dar las mismas filas en ambos backends
+        for query in ["ANDRÉS", "ÉS", " García ", "(", "a.", ".*", "%", "_", "\\"]:
+            mask = employee_filter_mask(df, "Todos", "Todos", query)
+            assert np.array_equal(db.filtered_ids(query=query), np.sort(df["employee_id"].to_numpy()[mask])), query
+        print("  Búsqueda: mismas filas en pandas y SQLite (acentos, regex, comodines)")
+
+        for dept, risk, query in cases:
+            start = time.perf_counter()
+            mask = employee_filter_mask(df, dept, risk, query)
+            subset = df[mask]
+            expected = subset.iloc[np.lexsort((-subset["performance"], -subset["risk_score"].to_numpy()))[:50]]
+            pandas_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            result = db.top_k(50, dept, risk, query)
+            sql_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            total = db.count(dept, risk, query)
+            count_ms = (time.perf_counter() - start) * 1000
+            assert result["employee_id"].tolist() == expected["employee_id"].tolist() and total == mask.sum()
+            print(f"  {dept} / {risk} / '{query}': {total:,} filas · top 50 pandas {pandas_ms:.0f} ms · "
+                  f"SQLite {sql_ms:.1f} ms (COUNT aparte {count_ms:.0f} ms)")
+
+        start = time.perf_counter()
+        kpis = dashboard_kpis(df)
+        department_metrics(df)
+        pandas_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        sql_kpis = db.dashboard_kpis()
+        db.department_metrics()
+        sql_ms = (time.perf_counter() - start) * 1000
+        assert all(
+            a == b if isinstance(a, (str, dict)) else np.isclose(a, b)
+            for a, b in zip(astuple(kpis), astuple(sql_kpis))
+        )
+        print(f"  KPIs + métricas por departamento: pandas {pandas_ms:.0f} ms · SQLite {sql_ms:.0f} ms")
+        assert np.allclose(KpiStore.from_data(df).totals, db.kpi_store().totals)
+        positions = np.flatnonzero(employee_filter_mask(df, "IT", "Alto"))
+        pandas_rows = pd.concat(iter_export_chunks(df, positions), ignore_index=True)
+        sql_rows = pd.concat(db.iter_export_chunks("IT", "Alto"), ignore_index=True)
+        assert pandas_rows.astype(str).equals(sql_rows.astype(str))
+        print("  Totales de KPIs y exportación: mismos valores en pandas y SQLite")
+
+    # Un nivel de riesgo faltante se guarda como NULL y cuenta en "sin nivel"
+    sample = generate_employees(1_000)
+    sample["risk_level"] = sample["risk_level"].where(sample["employee_id"] % 10 > 0)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = EmployeeDB(build_employee_db(sample, data_version(sample), Path(tmp) / "employees.sqlite"))
+        assert db.scalar("SELECT COUNT(*) FROM employees WHERE risk_level IS NULL") == 100
+        assert db.scalar("SELECT COUNT(*) FROM employees WHERE risk_level = 'nan'") == 0
+        assert np.allclose(KpiStore.from_data(sample).totals, db.kpi_store().totals)
@@ -0,0 +1,233 @@
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from core.model import MODEL_DIR
+
+# ============================================
+# DATASET PARQUET PARTICIONADO (EMPLEADOS)
+# ============================================
+
+# Cada snapshot de la tabla de empleados se guarda como Parquet particionado
+# estilo Hive: period=AAAA-MM/department=IT/part-0.parquet. Al leer, los
+# filtros por periodo y departamento descartan directorios completos sin
+# abrirlos, y la proyección de columnas solo lee esas columnas de cada
+# archivo (department y period vienen de la ruta, no ocupan bytes).
+
+DATASET_DIR = Path(os.environ.get("IMPULSO_DATASET_DIR", MODEL_DIR / "employees_dataset"))
+DATASET_ROW_GROUP = 128 * 1024
+
+# Columnas que necesita cada vista
+TAB_COLUMNS = {
+    "Dashboard": ["performance", "risk_score", "workload", "absenteeism", "stress", "risk_level"],
+    "Empleados": ["employee_id", "employee_name", "employee_role", "department", "risk_level",
+                  "risk_score", "performance", "active_status"],
+    "Departamentos": ["department", "performance", "risk_score", "workload", "absenteeism"],
+}
+
+
+def _partitioning():
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(pa.schema([("period", pa.string()), ("department", pa.string())]), flavor="hive")
+
+
+def current_period():
+    return pd.Timestamp.today().strftime("%Y-%m")
+
+
+def write_employee_snapshot(data, period=None, root=DATASET_DIR):
+    # Reescribir un periodo reemplaza el directorio del periodo completo: un
+    # departamento que ya no viene en el snapshot no sobrevive de la versión
+    # anterior. Se escribe en un directorio oculto (la lectura ignora los que
+    # empiezan con ".") y se cambia por el anterior con un rename.
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    period = period or current_period()
+    root = Path(root)
+    staging = root / f".staging-{os.getpid()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    # Ordenado por riesgo dentro de cada archivo: las estadísticas de cada
+    # row group también permiten saltar bloques al filtrar por risk_score
+    table = pa.Table.from_pandas(
+        data.assign(period=period, risk_level=data["risk_level"].astype(str))
+        .sort_values("risk_score", ascending=False),
+        preserve_index=False,
+    )
+    ds.write_dataset(
+        table,
+        staging,
+        format="parquet",
+        partitioning=_partitioning(),
+        max_rows_per_group=DATASET_ROW_GROUP,
+        min_rows_per_group=min(DATASET_ROW_GROUP, 16 * 1024),
+        basename_template="part-{i}.parquet",
+    )
+
+    # Un snapshot vacío deja el periodo vacío, no el contenido anterior
+    (staging / f"period={period}").mkdir(parents=True, exist_ok=True)
+    target = root / f"period={period}"
+    retired = root / f".retired-{os.getpid()}"
+    if target.exists():
+        os.replace(target, retired)
+    os.replace(staging / f"period={period}", target)
+    shutil.rmtree(retired, ignore_errors=True)
+    shutil.rmtree(staging, ignore_errors=True)
+    return root
+
+
+def employee_dataset(root=DATASET_DIR, filesystem=None):
+    import pyarrow.dataset as ds
+
+    return ds.dataset(str(root), format="parquet", partitioning=_partitioning(), filesystem=filesystem)
+
+
+def dataset_filter(departments=None, periods=None, where=None):
+    import pyarrow.dataset as ds
+
+    expression = None
+    for column, values in [("department", departments), ("period", periods)]:
+        if values:
+            condition = ds.field(column).isin(list(values))
+            expression = condition if expression is None else expression & condition
+    if where is not None:
+        expression = where if expression is None else expression & where
+    return expression
+
+
+def read_employees(columns=None, departments=None, periods=None, where=None, root=DATASET_DIR, filesystem=None):
+    # columns: proyección; departments/periods: poda de particiones; where:
+    # expresión pyarrow adicional (p. ej. ds.field("risk_score") >= 0.66)
+    table = employee_dataset(root, filesystem).to_table(
+        columns=columns, filter=dataset_filter(departments, periods, where)
+    )
+    return table.to_pandas()
+
+
+def read_tab(tab, departments=None, periods=None, root=DATASET_DIR):
+    return read_employees(TAB_COLUMNS[tab], departments, periods, root=root)
+
+
+def latest_period(root=DATASET_DIR):
+    periods = sorted(p.name.split("=", 1)[1] for p in Path(root).glob("period=*"))
+    return periods[-1] if periods else None
+
+
+def counting_filesystem():
+    # Sistema de archivos local que cuenta los bytes leídos (para el benchmark)
+    import pyarrow as pa
+    import pyarrow.fs as pafs
+
+    class CountingReader:
+        def __init__(self, handle, handler):
+            self.handle, self.handler = handle, handler
+            self.closed = False
+
+        def read(self, n=-1):
+            data = self.handle.read(n)
+            self.handler.bytes_read += len(data)
+            return data
+
+        def seek(self, offset, whence=0):
+            return self.handle.seek(offset, whence)
+
+        def tell(self):
+            return self.handle.tell()
+
+        def close(self):
+            self.closed = True
+            self.handle.close()
+
+        def readable(self):
+            return True
+
+        def seekable(self):
+            return True
+
+        def writable(self):
+            return False
+
+    class CountingHandler(pafs.FileSystemHandler):
+        def __init__(self):
+            self.local = pafs.LocalFileSystem()
+            self.bytes_read = 0
+
+        def get_type_name(self):
+            return "counting"
+
+        def normalize_path(self, path):
+            return self.local.normalize_path(path)
+
+        def equals(self, other):
+            return self is other
+
+        def get_file_info(self, paths):
+            return self.local.get_file_info(paths)
+
+        def get_file_info_selector(self, selector):
+            return self.local.get_file_info(selector)
+
+        def open_input_file(self, path):
+            return pa.PythonFile(CountingReader(open(path, "rb"), self), mode="r")
+
+        def open_input_stream(self, path):
+            return self.open_input_file(path)
+
+        def _read_only(self, *args, **kwargs):
+            raise OSError("solo lectura")
+
+        create_dir = delete_dir = delete_dir_contents = delete_root_dir_contents = _read_only
+        delete_file = move = copy_file = _read_only
+        open_output_stream = open_append_stream = _read_only
+
+    handler = CountingHandler()
+    return pafs.PyFileSystem(handler), handler
+
+
+if __name__ == "__main__":
+    # python -m core.dataset [millones]: bytes leídos y tiempo por vista frente
+    # a leer el snapshot completo
+    import sys
+    import tempfile
+    import time
+
+    import numpy as np
+
+    from core.data import generate_employees
+
+    n = int(float(sys.argv[1]) * 1_000_000) if len(sys.argv) > 1 else 1_000_000
+    periods = ["2026-08", "2026-09", "2026-10"]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "employees"
+        for i, period in enumerate(periods):
+            write_employee_snapshot(generate_employees(n, seed=123 + i), period, root)
+        total = sum(f.stat().st_size for f in root.rglob("*.parquet"))
+        print(f"{len(periods)} snapshots × {n:,} empleados · {total / 1e6:.1f} MB en disco")
+
+        cases = [
+            ("Todo (sin proyección ni filtros)", None, None, None),
+            ("Último snapshot completo", None, None, [periods[-1]]),
+            ("Dashboard (KPIs)", TAB_COLUMNS["Dashboard"], None, [periods[-1]]),
+            ("Empleados · IT", TAB_COLUMNS["Empleados"], ["IT"], [periods[-1]]),
+            ("Departamentos", TAB_COLUMNS["Departamentos"], None, [periods[-1]]),
+        ]
+        for label, columns, departments, selected in cases:
+            filesystem, handler = counting_filesystem()
+            start = time.perf_counter()
+            frame = read_employees(columns, departments, selected, root=root, filesystem=filesystem)
+            elapsed = time.perf_counter() - start
+            print(f"  {label:34s} {len(frame):>9,} filas × {frame.shape[1]:2d} col · "
+                  f"{handler.bytes_read / 1e6:7.2f} MB leídos ({handler.bytes_read / total:6.1%}) · {elapsed * 1000:5.0f} ms")
+
+        check = read_employees(["employee_id", "risk_score"], ["IT"], [periods[-1]], root=root)
+        source = generate_employees(n, seed=125)
+        expected = source[source["department"] == "IT"].sort_values("employee_id")
+        assert np.allclose(check.sort_values("employee_id")["risk_score"], expected["risk_score"])
+
+        # Reescribir un periodo sin un departamento no deja su partición vieja
+        write_employee_snapshot(source[source["department"] != "IT"], periods[-1], root)
+        assert read_employees(["employee_id"], ["IT"], [periods[-1]], root=root).empty
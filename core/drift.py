@@ -0,0 +1,188 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from core.files import atomic_write
+from core.model import MODEL_DIR, MODEL_FEATURES, holdout_mask, model_artifact_path
+
+# ============================================
+# MONITOR DE DERIVA (PSI / KS)
+# ============================================
+
+# Al entrenar se guardan histogramas de referencia por feature (global y por
+# departamento). Cada lote nuevo se discretiza con los mismos cortes y se
+# cuenta con un único np.bincount sobre (departamento, feature, bin): PSI y
+# KS salen de esas cuentas sin recorrer los datos más de una vez.
+#
+# La referencia se guarda junto al artefacto del modelo, con las filas con
+# que se entrenó (sin el holdout), y queda atada a esa versión: el dashboard
+# compara los últimos datos leídos del origen con la referencia del modelo
+# servido, no los datos consigo mismos.
+
+EXTENDED_DRIFT_FEATURES = [
+    "stress", "burnout", "anxiety", "depression", "support_supervisor",
+    "support_coworkers", "leave_difficulty", "age", "tenure", "absenteeism",
+    "performance", "promotion", "workload", "task_completion", "error_rate",
+]
+DRIFT_BINS = 10
+DRIFT_DISCRETE_MAX = 20
+PSI_WARNING = 0.10
+PSI_ALERT = 0.25
+KS_COEFFICIENT = 1.95  # alfa = 0.001
+PSI_EPSILON = 1e-4
+
+
+def drift_bin_edges(values, bins=DRIFT_BINS):
+    # Escalas Likert y enteros cortos: un bin por valor. Continuas: cuantiles.
+    uniques = np.unique(values)
+    if len(uniques) <= DRIFT_DISCRETE_MAX:
+        return (uniques[:-1] + uniques[1:]) / 2
+    return np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1]))
+
+
+class DriftReference:
+    def __init__(self, features, edges, departments, counts):
+        self.features = list(features)
+        self.edges = [np.asarray(e, dtype=float) for e in edges]
+        self.departments = list(departments)
+        # counts: (1 + departamentos, features, bins); fila 0 = global
+        self.counts = np.asarray(counts, dtype=float)
+        self.n_bins = self.counts.shape[2]
+
+    @classmethod
+    def from_data(cls, data, features=MODEL_FEATURES, bins=DRIFT_BINS):
+        edges = [drift_bin_edges(data[f].to_numpy(dtype=float), bins) for f in features]
+        departments = sorted(data["department"].unique())
+        reference = cls(features, edges, departments, np.zeros((1, 1, max(len(e) for e in edges) + 1)))
+        reference.counts = reference.bin_counts(data)
+        return reference
+
+    def bin_counts(self, data):
+        n_feat, n_bins = len(self.features), self.n_bins
+        codes, uniques = pd.factorize(data["department"])
+        # Departamentos desconocidos solo cuentan en el global (fila extra que se descarta)
+        lookup = {d: i for i, d in enumerate(self.departments)}
+        dept_of_code = np.array([lookup.get(d, len(self.departments)) for d in uniques], dtype=np.int64)
+        dept = dept_of_code[codes]
+        keys = np.empty((len(data), n_feat), dtype=np.int64)
+        for j, (feature, edges) in enumerate(zip(self.features, self.edges)):
+            keys[:, j] = _bin_index(data[feature].to_numpy(), edges)
+        keys += (np.arange(n_feat) * n_bins)[None, :]
+        keys += (dept * n_feat * n_bins)[:, None]
+        flat = np.bincount(keys.ravel(), minlength=(len(self.departments) + 1) * n_feat * n_bins)
+        by_dept = flat.reshape(len(self.departments) + 1, n_feat, n_bins)[:len(self.departments)]
+        overall = flat.reshape(-1, n_feat, n_bins).sum(axis=0, keepdims=True)
+        return np.concatenate([overall, by_dept]).astype(float)
+
+    def compare(self, data):
+        current = self.bin_counts(data)
+        p = _proportions(self.counts)
+        q = _proportions(current)
+        psi = ((q - p) * np.log(q / p)).sum(axis=2)
+        ks = np.abs(np.cumsum(q, axis=2) - np.cumsum(p, axis=2)).max(axis=2)
+
+        scopes = ["Global"] + self.departments
+        report = pd.DataFrame({
+            "scope": np.repeat(scopes, len(self.features)),
+            "feature": np.tile(self.features, len(scopes)),
+            "psi": psi.ravel(),
+            "ks": ks.ravel(),
+            "rows": np.repeat(current.sum(axis=2)[:, 0], len(self.features)).astype(int),
+        })
+        critical = ks_critical(
+            np.repeat(self.counts.sum(axis=2)[:, 0], len(self.features)), report["rows"].to_numpy()
+        )
+        report["status"] = np.select(
+            [(report["psi"] >= PSI_ALERT) | (report["ks"] >= critical), report["psi"] >= PSI_WARNING],
+            ["Deriva", "Vigilar"],
+            "Estable",
+        )
+        return report
+
+    def to_json(self):
+        return json.dumps({
+            "features": self.features,
+            "edges": [e.tolist() for e in self.edges],
+            "departments": self.departments,
+            "counts": self.counts.tolist(),
+        })
+
+    @classmethod
+    def from_json(cls, text):
+        payload = json.loads(text)
+        return cls(payload["features"], payload["edges"], payload["departments"], payload["counts"])
+
+
+def drift_reference_path(version, model_dir=MODEL_DIR):
+    return model_artifact_path(version, model_dir).with_suffix(".drift.json")
+
+
+def save_training_reference(data, version, model_dir=MODEL_DIR):
+    reference = DriftReference.from_data(data[~holdout_mask(data["employee_id"])])
+    with atomic_write(drift_reference_path(version, model_dir)) as tmp_path:
+        tmp_path.write_text(reference.to_json(), encoding="utf-8")
+    return reference
+
+
+def load_training_reference(version, model_dir=MODEL_DIR):
+    return DriftReference.from_json(drift_reference_path(version, model_dir).read_text(encoding="utf-8"))
+
+
+def _bin_index(values, edges):
+    # Enteros en un rango corto: tabla de consulta en lugar de búsqueda binaria
+    if np.issubdtype(values.dtype, np.integer) and len(values):
+        lo, hi = int(values.min()), int(values.max())
+        if hi - lo <= 1_000_000:
+            table = np.searchsorted(edges, np.arange(lo, hi + 1, dtype=float), side="right")
+            return table[values - lo]
+    return np.searchsorted(edges, values.astype(float), side="right")
+
+
+def ks_critical(n_reference, n_current, coefficient=KS_COEFFICIENT):
+    # Valor crítico de KS para dos muestras: con pocos empleados de referencia
+    # en un departamento, una distancia grande puede ser solo ruido de muestreo
+    n_reference = np.maximum(n_reference, 1)
+    n_current = np.maximum(n_current, 1)
+    return coefficient * np.sqrt((n_reference + n_current) / (n_reference * n_current))
+
+
+def _proportions(counts):
+    totals = counts.sum(axis=2, keepdims=True)
+    props = np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0)
+    # Suavizado: un bin vacío no debe volver infinito el PSI
+    props = props + PSI_EPSILON
+    return props / props.sum(axis=2, keepdims=True)
+
+
+if __name__ == "__main__":
+    # python -m core.drift [lote.csv] [--extended]
+    # Sin archivo: se simula un lote de 1M filas con carga y estrés desplazados.
+    import argparse
+    import time
+
+    from core.data import generate_employees, generate_extended_employees
+
+    parser = argparse.ArgumentParser(description="Deriva de un lote frente a los datos de entrenamiento")
+    parser.add_argument("batch", nargs="?", help="CSV del lote nuevo")
+    parser.add_argument("--extended", action="store_true", help="features extendidas de Modelo_Python.py")
+    args = parser.parse_args()
+
+    generate = generate_extended_employees if args.extended else generate_employees
+    features = EXTENDED_DRIFT_FEATURES if args.extended else MODEL_FEATURES
+    reference = DriftReference.from_data(generate(), features)
+
+    if args.batch:
+        batch = pd.read_csv(args.batch)
+    else:
+        batch = generate(1_000_000, seed=2026)
+        batch["workload"] = np.where(batch["department"] == "Operaciones", batch["workload"] + 15, batch["workload"])
+        batch["stress"] = np.clip(batch["stress"] + (np.random.default_rng(1).random(len(batch)) < 0.5), 1, 5)
+
+    start = time.perf_counter()
+    report = reference.compare(batch)
+    elapsed = time.perf_counter() - start
+
+    flagged = report[report["status"] != "Estable"]
+    print(f"{len(batch):,} filas · {len(report)} comparaciones en {elapsed * 1000:.0f} ms")
+    print(flagged.to_string(index=False, float_format=lambda v: f"{v:.3f}") if not flagged.empty else "Sin deriva")
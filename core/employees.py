@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+# ============================================
+# ÍNDICE DE EMPLEADOS POR employee_id
+# ============================================
+
+PROFILE_COLUMNS = [
+    "employee_id", "employee_name", "employee_role", "department", "active_status",
+    "risk_level", "risk_score", "performance", "workload", "absenteeism",
+    "stress", "burnout", "anxiety",
+]
+PROFILE_CACHE_SIZE = 4096
+
+
+class EmployeeStore:
+    # Mapea employee_id -> posición de fila con un arreglo denso (o un dict si
+    # los ids son dispersos), de modo que buscar un empleado o comprobar si
+    # pasa los filtros activos es O(1) sin recorrer el frame. Los perfiles
+    # (KPIs, radar y comparación con su departamento) se arman una vez y se
+    # reutilizan entre reruns y clics en "Ver".
+
+    def __init__(self, data):
+        ids = data["employee_id"].to_numpy()
+        # Numéricas: vista sobre el buffer (mapeado con IMPULSO_SHARED_MEMORY);
+        # texto: el arreglo Arrow tal cual, to_numpy lo copiaría a objetos
+        self._cols = {
+            col: data[col].to_numpy() if pd.api.types.is_numeric_dtype(data[col]) else data[col].array
+            for col in PROFILE_COLUMNS
+        }
+        if len(ids) and ids.min() >= 0 and ids.max() < 4 * len(ids):
+            self._pos = np.full(int(ids.max()) + 1, -1, dtype=np.int64)
+            self._pos[ids] = np.arange(len(ids))
+            self._pos_map = None
+        else:
+            self._pos = None
+            self._pos_map = {int(emp_id): i for i, emp_id in enumerate(ids)}
+
+        dept_means = data.groupby("department")[["performance", "risk_score", "workload", "absenteeism"]].mean()
+        self._dept_means = dept_means.to_dict("index")
+        self._profiles = {}
+
+    def position(self, emp_id):
+        emp_id = int(emp_id)
+        if self._pos_map is not None:
+            return self._pos_map.get(emp_id, -1)
+        if 0 <= emp_id < len(self._pos):
+            return int(self._pos[emp_id])
+        return -1
+
+    def contains(self, emp_id, mask=None):
+        pos = self.position(emp_id)
+        return pos >= 0 and (mask is None or bool(mask[pos]))
+
+    def row(self, emp_id):
+        pos = self.position(emp_id)
+        if pos < 0:
+            raise KeyError(emp_id)
+        return {col: values[pos] for col, values in self._cols.items()}
+
+    def profile(self, emp_id):
+        emp_id = int(emp_id)
+        if emp_id in self._profiles:
+            return self._profiles[emp_id]
+
+        profile = build_profile(self.row(emp_id), self._dept_means)
+        if len(self._profiles) >= PROFILE_CACHE_SIZE:
+            self._profiles.clear()
+        self._profiles[emp_id] = profile
+        return profile
+
+
+def build_profile(emp, dept_means):
+    # KPIs, radar y comparación con su departamento a partir de una fila
+    dept = dept_means[emp["department"]]
+    return {
+        "employee": emp,
+        "kpis": {
+            "risk": emp["risk_score"] * 100,
+            "performance": emp["performance"],
+            "workload": emp["workload"] / 150 * 100,
+            "absenteeism": emp["absenteeism"] / 80 * 100,
+        },
+        "radar": {
+            "Estrés": emp["stress"] / 5 * 100,
+            "Burnout": emp["burnout"] / 5 * 100,
+            "Sobrecarga": emp["workload"] / 150 * 100,
+            "Ausentismo": emp["absenteeism"] / 80 * 100,
+            "Ansiedad": emp["anxiety"] / 5 * 100,
+        },
+        "comparison": {
+            "Desempeño": (emp["performance"], dept["performance"]),
+            "Riesgo": (emp["risk_score"] * 100, dept["risk_score"] * 100),
+            "Sobrecarga": (emp["workload"] / 150 * 100, dept["workload"] / 150 * 100),
+            "Ausentismo": (emp["absenteeism"] / 80 * 100, dept["absenteeism"] / 80 * 100),
+        },
+    }
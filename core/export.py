@@ -0,0 +1,197 @@
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# ============================================
+# EXPORTACIÓN DE REPORTES
+# ============================================
+
+EXPORT_DIR = Path(tempfile.gettempdir()) / "impulso_exports"
+# Los reportes se borran pasado este tiempo (segundos) al generar uno nuevo
+EXPORT_MAX_AGE = 3600
+EXPORT_CHUNK_ROWS = 50_000
+# Por encima de este tamaño la exportación no bloquea el rerun
+EXPORT_BACKGROUND_ROWS = 100_000
+EXPORT_COLUMNS = [
+    "employee_id", "employee_name", "employee_role", "department", "active_status",
+    "risk_level", "risk_score", "performance", "workload", "absenteeism",
+    "stress", "burnout", "anxiety",
+]
+# Límite de filas por hoja de Excel (incluye el encabezado): las filas que no
+# caben siguen en hojas "Empleados (2)", "Empleados (3)", ...
+XLSX_MAX_ROWS = 1_048_576
+KPI_COLUMNS = ["department", "employees", "performance", "risk_score", "workload", "absenteeism", "high_risk_pct"]
+
+# Figuras serializadas por versión de datos: {version: {nombre: html}}. Las
+# sesiones y el executor de exportación la comparten: se accede bajo lock
+_FIGURE_HTML = {}
+_FIGURE_LOCK = threading.Lock()
+
+
+def iter_export_chunks(data, positions, chunk_rows=EXPORT_CHUNK_ROWS):
+    # Solo se materializa un bloque de filas a la vez
+    col_idx = [data.columns.get_loc(c) for c in EXPORT_COLUMNS]
+    for start in range(0, len(positions), chunk_rows):
+        yield data.iloc[positions[start:start + chunk_rows], col_idx]
+
+
+def new_export_dir(export_dir=EXPORT_DIR, max_age=EXPORT_MAX_AGE):
+    # Directorio único por reporte (dos sesiones en el mismo segundo no se
+    # pisan); de paso se borran los reportes de más de max_age segundos
+    export_dir = Path(export_dir)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    cutoff = time.time() - max_age
+    for path in export_dir.iterdir():
+        if path.is_dir() and path.stat().st_mtime < cutoff:
+            shutil.rmtree(path, ignore_errors=True)
+    return Path(tempfile.mkdtemp(dir=export_dir, prefix=time.strftime("%Y%m%d_%H%M%S_")))
+
+
+def export_report(chunks, out_dir, summary_html=None):
+    # chunks: bloques con EXPORT_COLUMNS (iter_export_chunks o, con el backend
+    # SQL, EmployeeDB.iter_export_chunks)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    files = {
+        "CSV": out_dir / "empleados.csv",
+        "Parquet": out_dir / "empleados.parquet",
+    }
+
+    try:
+        from openpyxl import Workbook
+        workbook = Workbook(write_only=True)
+        emp_sheets = [workbook.create_sheet("Empleados")]
+        kpi_sheet = workbook.create_sheet("KPIs Departamento")
+        emp_sheets[0].append(EXPORT_COLUMNS)
+        sheet_rows = 1
+    except ImportError:
+        workbook = None
+
+    totals = None
+    parquet_writer = None
+    with open(files["CSV"], "w", newline="", encoding="utf-8") as csv_file:
+        csv_file.write(",".join(EXPORT_COLUMNS) + "\n")
+        for chunk in chunks:
+            # Texto nullable: un nivel faltante queda vacío/null, no "nan"
+            chunk = chunk.astype({"risk_level": "string"})
+            chunk.to_csv(csv_file, header=False, index=False)
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if parquet_writer is None:
+                parquet_writer = pq.ParquetWriter(files["Parquet"], table.schema)
+            parquet_writer.write_table(table.cast(parquet_writer.schema))
+
+            if workbook is not None:
+                for row in chunk.itertuples(index=False):
+                    if sheet_rows == XLSX_MAX_ROWS:
+                        emp_sheets.append(workbook.create_sheet(f"Empleados ({len(emp_sheets) + 1})", len(emp_sheets)))
+                        emp_sheets[-1].append(EXPORT_COLUMNS)
+                        sheet_rows = 1
+                    emp_sheets[-1].append([None if value is pd.NA else value for value in row])
+                    sheet_rows += 1
+
+            # KPIs por departamento acumulados como sumas parciales por bloque
+            part = (
+                chunk.assign(high_risk=chunk["risk_level"].eq("Alto").fillna(False))
+                .groupby("department")
+                .agg(
+                    employees=("employee_id", "size"),
+                    performance=("performance", "sum"),
+                    risk_score=("risk_score", "sum"),
+                    workload=("workload", "sum"),
+                    absenteeism=("absenteeism", "sum"),
+                    high_risk=("high_risk", "sum"),
+                )
+            )
+            totals = part if totals is None else totals.add(part, fill_value=0)
+
+    if parquet_writer is None:
+        pd.DataFrame(columns=EXPORT_COLUMNS).to_parquet(files["Parquet"], index=False)
+    else:
+        parquet_writer.close()
+
+    kpis = pd.DataFrame(columns=KPI_COLUMNS)
+    if totals is not None:
+        kpis = totals.div(totals["employees"], axis=0).assign(employees=totals["employees"].astype(int))
+        kpis["high_risk_pct"] = kpis.pop("high_risk") * 100
+        kpis = kpis.reset_index()[KPI_COLUMNS].round(2)
+
+    files["KPIs CSV"] = out_dir / "kpis_departamento.csv"
+    files["KPIs Parquet"] = out_dir / "kpis_departamento.parquet"
+    kpis.to_csv(files["KPIs CSV"], index=False)
+    kpis.to_parquet(files["KPIs Parquet"], index=False)
+
+    if workbook is not None:
+        kpi_sheet.append(KPI_COLUMNS)
+        for row in kpis.itertuples(index=False):
+            kpi_sheet.append(list(row))
+        files["XLSX"] = out_dir / "reporte.xlsx"
+        workbook.save(files["XLSX"])
+
+    if summary_html is not None:
+        files["HTML"] = out_dir / "resumen_dashboard.html"
+        files["HTML"].write_text(summary_html, encoding="utf-8")
+
+    return files
+
+
+def figure_html(name, fig, version):
+    # Cada figura se serializa una sola vez por versión de datos; to_html
+    # corre fuera del lock
+    with _FIGURE_LOCK:
+        html = _FIGURE_HTML.get(version, {}).get(name)
+    if html is None:
+        html = fig.to_html(full_html=False, include_plotlyjs=False)
+        with _FIGURE_LOCK:
+            if version not in _FIGURE_HTML:
+                _FIGURE_HTML.clear()
+                _FIGURE_HTML[version] = {}
+            _FIGURE_HTML[version][name] = html
+    return html
+
+
+def build_dashboard_html(kpi_cards, alerts, figures, version):
+    import plotly
+
+    cards_html = "".join(
+        f"<div class='card'><div class='title'>{title}</div><div class='value'>{value}</div></div>"
+        for title, value in kpi_cards
+    )
+    alerts_html = "".join(f"<li>{alert['message']}</li>" for alert in alerts) or "<li>Sin alertas activas</li>"
+    figures_html = "".join(
+        f"<h2>{name}</h2><div class='figure'>{figure_html(name, fig, version)}</div>"
+        for name, fig in figures.items()
+    )
+    return f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<title>Impulso — Resumen del Dashboard</title>
+<script src="https://cdn.plot.ly/plotly-{plotly.__version__}.min.js"></script>
+<style>
+    body {{ font-family: 'Montserrat', sans-serif; color: #16337b; margin: 32px; }}
+    .cards {{ display: grid; grid-template-columns: repeat(4, 1fr); gap: 12px; }}
+    .card {{ border: 1px solid #e9edf3; border-radius: 12px; padding: 12px 14px; }}
+    .title {{ font-size: 12px; color: #555; font-weight: 600; }}
+    .value {{ font-size: 22px; font-weight: 700; }}
+    .figure {{ page-break-inside: avoid; }}
+    @media print {{ body {{ margin: 0; }} }}
+</style>
+</head>
+<body>
+<h1>Impulso — Resumen del Dashboard</h1>
+<p>Generado: {pd.Timestamp.now():%d/%m/%Y %H:%M}</p>
+<div class='cards'>{cards_html}</div>
+<h2>Alertas</h2>
+<ul>{alerts_html}</ul>
+{figures_html}
+</body>
+</html>
+"""
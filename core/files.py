@@ -0,0 +1,68 @@
+import errno
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# ============================================
+# ESCRITURA ATÓMICA DE ARTEFACTOS
+# ============================================
+
+# Solo biblioteca estándar: la importan módulos que difieren sus imports
+# pesados (core.model) sin arrastrar numpy ni pandas.
+
+
+@contextmanager
+def atomic_write(path, directory=False):
+    # Se escribe en un temporal único (mkstemp/mkdtemp) junto al destino y se
+    # renombra al terminar: dos hilos o procesos que escriben el mismo destino
+    # no comparten temporal, y un lector nunca ve un archivo a medio escribir.
+    # Con directory=True el temporal es un directorio ya creado.
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    options = {"dir": path.parent, "prefix": f".{path.name}.", "suffix": ".tmp"}
+    if directory:
+        tmp_path = Path(tempfile.mkdtemp(**options))
+        os.chmod(tmp_path, 0o755)
+    else:
+        handle, tmp_name = tempfile.mkstemp(**options)
+        os.close(handle)
+        tmp_path = Path(tmp_name)
+        os.chmod(tmp_path, 0o644)
+    try:
+        yield tmp_path
+        if directory:
+            _replace_directory(tmp_path, path)
+        else:
+            os.replace(tmp_path, path)
+    finally:
+        if tmp_path.is_dir():
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        else:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _replace_directory(tmp_path, path):
+    # rename() no reemplaza un directorio con contenido: el anterior se retira
+    # primero con otro rename (nunca se ve borrado a medias) y se elimina
+    # después. Entre ambos renames el destino falta un instante; un lector
+    # ve el directorio viejo completo, el nuevo completo o ninguno.
+    retired = Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}.", suffix=".retired"))
+    try:
+        while True:
+            try:
+                os.replace(path, retired)
+            except FileNotFoundError:
+                pass
+            try:
+                os.replace(tmp_path, path)
+                return
+            except OSError as exc:
+                if exc.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                    raise
+                # Otro escritor publicó entre los dos renames: se retira el suyo
+                shutil.rmtree(retired, ignore_errors=True)
+                retired.mkdir()
+    finally:
+        shutil.rmtree(retired, ignore_errors=True)
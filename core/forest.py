@@ -0,0 +1,215 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+from core.files import atomic_write
+
+# ============================================
+# FORMATO COMPACTO DEL BOSQUE
+# ============================================
+
+# Los 600 árboles se aplanan en arrays contiguos guardados como .npy sin
+# comprimir, de modo que se cargan con np.load(mmap_mode="r") sin deserializar
+# objetos. Por nodo: feature int8/int16/int32 (según rf.n_features_in_), umbral float32, hijos int16/int32 (índices
+# locales al árbol) y conteos de clase por hoja uint16 (uint32 si no caben).
+# Con muchos empleados hay vectores repetidos con etiquetas distintas y las
+# hojas no son puras: los conteos (muestras bootstrap por clase) reproducen
+# exacta la fracción que guarda sklearn, cualquiera sea la mezcla.
+#
+# sklearn compara float32(x) <= umbral float64. El umbral se redondea hacia
+# abajo al float32 anterior, que es la única conversión que conserva el
+# resultado de esa comparación para cualquier x float32. Las fracciones se
+# suman árbol por árbol como en rf.predict_proba: las etiquetas son idénticas
+# a las de rf.predict.
+
+FOREST_ARRAYS = ["tree_offsets", "feature", "threshold", "left", "right", "value"]
+SCORE_CHUNK_ROWS = 2048
+
+
+def _feature_dtype(n_features):
+    # feature >= 0 marca los nodos internos: el índice más alto no puede
+    # desbordar a negativo
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_features - 1 <= np.iinfo(dtype).max:
+            return dtype
+    raise ValueError(f"Demasiadas variables para el formato compacto: {n_features}")
+
+
+def _threshold_float32(threshold):
+    t32 = threshold.astype(np.float32)
+    above = t32.astype(np.float64) > threshold
+    t32[above] = np.nextafter(t32[above], np.float32(-np.inf))
+    return t32
+
+
+def export_compact_forest(rf, path):
+    trees = [est.tree_ for est in rf.estimators_]
+    counts = np.array([t.node_count for t in trees])
+    child_dtype = np.int16 if counts.max() < np.iinfo(np.int16).max else np.int32
+
+    leaf = np.concatenate([t.children_left == -1 for t in trees])
+    values = np.concatenate([t.value[:, 0, :] for t in trees])
+    weights = np.concatenate([t.weighted_n_node_samples for t in trees])
+    # sklearn >= 1.4 guarda fracciones; × muestras ponderadas de la hoja = conteos.
+    # Los nodos internos no se consultan al puntuar y quedan en cero
+    values = values / values.sum(axis=1, keepdims=True) * weights[:, None]
+    counts_per_class = np.where(leaf[:, None], np.rint(values), 0)
+    if not np.allclose(counts_per_class[leaf], values[leaf], rtol=0, atol=1e-6):
+        raise ValueError("Conteos de hoja no enteros (¿sample_weight o class_weight?)")
+    feature_dtype = _feature_dtype(int(rf.n_features_in_))
+    value_dtype = np.uint16 if counts_per_class.max() <= np.iinfo(np.uint16).max else np.uint32
+
+    arrays = {
+        "tree_offsets": np.concatenate([[0], np.cumsum(counts)]).astype(np.int32),
+        "feature": np.concatenate([np.where(t.children_left == -1, -1, t.feature) for t in trees]).astype(feature_dtype),
+        "threshold": _threshold_float32(np.concatenate([t.threshold for t in trees])),
+        "left": np.concatenate([t.children_left for t in trees]).astype(child_dtype),
+        "right": np.concatenate([t.children_right for t in trees]).astype(child_dtype),
+        "value": counts_per_class.astype(value_dtype),
+    }
+    meta = {
+        "classes": [str(c) for c in rf.classes_],
+        "n_features": int(rf.n_features_in_),
+        "max_depth": int(max(t.max_depth for t in trees)),
+        "feature_importances": rf.feature_importances_.tolist(),
+    }
+
+    # Directorio temporal + rename: nunca queda un artefacto a medias
+    path = Path(path)
+    with atomic_write(path, directory=True) as tmp_path:
+        for name, array in arrays.items():
+            np.save(tmp_path / f"{name}.npy", array)
+        (tmp_path / "meta.json").write_text(json.dumps(meta))
+    return path
+
+
+class CompactForest:
+    def __init__(self, arrays, meta):
+        self.arrays = arrays
+        self.classes_ = np.array(meta["classes"], dtype=object)
+        self.n_features_in_ = meta["n_features"]
+        self.max_depth = meta["max_depth"]
+        self.feature_importances_ = np.array(meta.get("feature_importances", []))
+        # Pickle sklearn del mismo modelo, si existe (core.model.sklearn_forest)
+        self.source = None
+        self.n_trees = len(arrays["tree_offsets"]) - 1
+
+    def leaf_fraction_sums(self, X):
+        a = {name: np.asarray(array) for name, array in self.arrays.items()}
+        offsets = a["tree_offsets"][:-1].astype(np.int64)
+        X = np.asarray(X, dtype=np.float32)
+        n_features = X.shape[1]
+        out = np.empty((len(X), len(self.classes_)))
+        for start in range(0, len(X), SCORE_CHUNK_ROWS):
+            chunk = X[start:start + SCORE_CHUNK_ROWS].ravel()
+            n_rows = len(chunk) // n_features
+            # Un camino (empleado, árbol) por posición; cada paso baja un nivel
+            # solo en los caminos que aún no llegaron a una hoja
+            node = np.tile(offsets, n_rows)
+            active = np.arange(node.size)
+            while active.size:
+                current = node[active]
+                feature = a["feature"][current]
+                inner = feature >= 0
+                active, current, feature = active[inner], current[inner], feature[inner]
+                x = chunk[active // self.n_trees * n_features + feature]
+                child = np.where(x <= a["threshold"][current], a["left"][current], a["right"][current])
+                node[active] = offsets[active % self.n_trees] + child
+            counts = a["value"][node].astype(np.float64)
+            fractions = (counts / counts.sum(axis=1, keepdims=True)).reshape(n_rows, self.n_trees, -1)
+            # Suma árbol a árbol, en el mismo orden que rf.predict_proba
+            total = np.zeros((n_rows, fractions.shape[2]))
+            for tree in range(self.n_trees):
+                total += fractions[:, tree]
+            out[start:start + n_rows] = total
+        return out
+
+    def predict_proba(self, X):
+        return self.leaf_fraction_sums(X) / self.n_trees
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+def load_compact_forest(path, mmap_mode="r"):
+    path = Path(path)
+    arrays = {name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode) for name in FOREST_ARRAYS}
+    return CompactForest(arrays, json.loads((path / "meta.json").read_text()))
+
+
+def directory_size(path):
+    return sum(f.stat().st_size for f in Path(path).iterdir())
+
+
+if __name__ == "__main__":
+    # python -m core.forest [empleados]: tamaño y tiempo de carga del formato
+    # compacto frente al pickle de joblib, y verificación de etiquetas
+    # idénticas. Con 20.000 empleados (por defecto) hay hojas impuras.
+    import subprocess
+    import sys
+    import time
+
+    import joblib
+
+    from core.data import data_version, generate_employees
+    from core.model import compact_artifact_path, load_or_train_risk_model, model_artifact_path, sklearn_forest
+    from core.surrogate import synthetic_sample
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    df = generate_employees(n)
+    version = data_version(df)
+    preprocess, X_processed, rf = load_or_train_risk_model(df, version)
+    rf = sklearn_forest(rf)
+    pickle_path = model_artifact_path(version)
+    compact_path = export_compact_forest(rf, compact_artifact_path(version))
+
+    def cold_load(statement):
+        # Proceso nuevo: incluye los imports que cada formato necesita
+        code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        return float(result.stdout.strip())
+
+    pickle_cold = cold_load(f"import joblib; joblib.load({str(pickle_path)!r})")
+    compact_cold = cold_load(f"from core.forest import load_compact_forest; load_compact_forest({str(compact_path)!r})")
+
+    start = time.perf_counter()
+    joblib.load(pickle_path)
+    pickle_load = time.perf_counter() - start
+    start = time.perf_counter()
+    forest = load_compact_forest(compact_path)
+    compact_load = time.perf_counter() - start
+
+    X_check = np.vstack([np.asarray(X_processed, dtype=float), synthetic_sample(X_processed, 100_000)])
+    start = time.perf_counter()
+    rf_labels = rf.predict(X_check)
+    rf_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    compact_labels = forest.predict(X_check)
+    compact_seconds = time.perf_counter() - start
+    impure = int((np.count_nonzero(np.asarray(forest.arrays["value"]), axis=1) > 1).sum())
+
+    print(f"Pickle (joblib):  {pickle_path.stat().st_size / 1e6:7.2f} MB · carga {pickle_load * 1000:7.1f} ms "
+          f"(proceso nuevo {pickle_cold * 1000:.0f} ms)")
+    print(f"Formato compacto: {directory_size(compact_path) / 1e6:7.2f} MB · carga {compact_load * 1000:7.1f} ms "
+          f"(proceso nuevo {compact_cold * 1000:.0f} ms)")
+    print(f"Etiquetas idénticas: {int((rf_labels == compact_labels).sum()):,}/{len(X_check):,} filas "
+          f"({impure:,} hojas impuras)")
+    print(f"Puntuación de {len(X_check):,} filas: rf {rf_seconds:.2f}s · compacto {compact_seconds:.2f}s")
+    assert (rf_labels == compact_labels).all()
+    assert np.allclose(rf.predict_proba(X_check[:5_000]), forest.predict_proba(X_check[:5_000]), rtol=0, atol=1e-12)
+
+    # Más de 127 variables (la encuesta one-hot tiene ~158): los índices de
+    # feature no caben en int8 y deben seguir marcando nodos internos
+    from sklearn.ensemble import RandomForestClassifier
+
+    rng = np.random.default_rng(7)
+    X_wide = rng.random((3_000, 300))
+    y_wide = np.where(X_wide[:, 250] + X_wide[:, 180] > 1, "Alto", "Bajo")
+    rf_wide = RandomForestClassifier(n_estimators=20, random_state=123).fit(X_wide, y_wide)
+    wide_path = export_compact_forest(rf_wide, pickle_path.with_name("risk_model_wide.forest"))
+    wide = load_compact_forest(wide_path)
+    assert np.asarray(wide.arrays["feature"]).dtype == np.int16
+    assert (wide.predict(X_wide) == rf_wide.predict(X_wide)).all()
+    assert np.allclose(wide.predict_proba(X_wide), rf_wide.predict_proba(X_wide), rtol=0, atol=1e-12)
+    print(f"Bosque de {X_wide.shape[1]} variables: etiquetas idénticas en {len(X_wide):,} filas")
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+from core.data import RISK_LEVELS
+
+# ============================================
+# HISTOGRAMAS PRECALCULADOS
+# ============================================
+
+# px.histogram serializa cada fila en el JSON de la figura. Aquí los conteos
+# se calculan en el servidor con un único np.bincount sobre
+# (nivel de riesgo, departamento, bin) y la figura solo lleva barras: el
+# tamaño del payload depende del número de bins, no de empleados.
+
+HIST_BINS = 20
+# Filas sin nivel de riesgo (NaN o fuera de `levels`) o sin departamento: se
+# cuentan aparte para que los totales coincidan con el número de filas
+HIST_MISSING = "Sin dato"
+
+
+class BinnedHistogram:
+    def __init__(self, column, edges, levels, departments, counts):
+        self.column = column
+        self.edges = np.asarray(edges, dtype=float)
+        self.levels = list(levels)
+        self.departments = list(departments)
+        # counts: (niveles, departamentos, bins)
+        self.counts = np.asarray(counts, dtype=np.int64)
+
+    @classmethod
+    def from_data(cls, data, column="risk_score", bins=HIST_BINS, value_range=None,
+                  level_column="risk_level", levels=RISK_LEVELS):
+        values = data[column].to_numpy(dtype=float)
+        lo, hi = value_range if value_range is not None else (np.nanmin(values), np.nanmax(values))
+        edges = np.linspace(lo, hi, bins + 1)
+
+        # Mismo criterio que np.histogram: el borde derecho cae en el último bin
+        scaled = (values - lo) / ((hi - lo) or 1.0) * bins
+        valid = (values >= lo) & (values <= hi)
+        bin_index = np.minimum(scaled[valid].astype(np.int64), bins - 1)
+
+        levels = list(levels) + [HIST_MISSING]
+        level_lookup = {level: i for i, level in enumerate(levels[:-1])}
+        level_codes, level_uniques = pd.factorize(data[level_column])
+        missing_level = len(levels) - 1
+        level_of_code = np.array([level_lookup.get(u, missing_level) for u in level_uniques] + [missing_level], dtype=np.int64)
+        level = level_of_code[level_codes][valid]
+        dept_codes, departments = pd.factorize(data["department"], sort=True)
+        departments = list(departments)
+        if (dept_codes < 0).any():
+            departments.append(HIST_MISSING)
+            dept_codes = np.where(dept_codes < 0, len(departments) - 1, dept_codes)
+        dept = dept_codes[valid]
+
+        keys = (level * len(departments) + dept) * bins + bin_index
+        counts = np.bincount(keys, minlength=len(levels) * len(departments) * bins)
+        return cls(column, edges, levels, departments, counts.reshape(len(levels), len(departments), bins))
+
+    def totals(self, departments=None):
+        # (niveles, bins) sumando los departamentos elegidos
+        if departments is None:
+            return self.counts.sum(axis=1)
+        selected = [self.departments.index(d) for d in departments if d in self.departments]
+        return self.counts[:, selected, :].sum(axis=1)
+
+    def figure(self, departments=None, by_level=True):
+        import plotly.graph_objects as go
+
+        totals = self.totals(departments)
+        centers = (self.edges[:-1] + self.edges[1:]) / 2
+        width = float(self.edges[1] - self.edges[0])
+        series = zip(self.levels, totals) if by_level else [("Total", totals.sum(axis=0))]
+        fig = go.Figure([
+            go.Bar(x=centers, y=counts, width=width, name=name, hovertemplate=f"{self.column}=%{{x:.2f}}<br>count=%{{y}}<extra>{name}</extra>")
+            for name, counts in series
+            if counts.any()
+        ])
+        fig.update_layout(
+            barmode="stack",
+            bargap=0,
+            xaxis_title=self.column,
+            yaxis_title="count",
+            legend_title_text="risk_level" if by_level else None,
+            showlegend=by_level,
+        )
+        return fig
+
+
+if __name__ == "__main__":
+    # python -m core.histograms: tamaño del JSON de la figura con filas crudas
+    # (px.histogram) frente a bins precalculados, con 800 y 1M empleados
+    import time
+
+    import plotly.express as px
+
+    from core.data import generate_employees
+
+    for n in [800, 1_000_000]:
+        df = generate_employees(n)
+        start = time.perf_counter()
+        raw_json = px.histogram(df, x="risk_score", nbins=HIST_BINS, color="risk_level").to_json()
+        raw_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        histogram = BinnedHistogram.from_data(df, value_range=(0, 1))
+        binned_json = histogram.figure().to_json()
+        binned_seconds = time.perf_counter() - start
+        assert histogram.counts.sum() == n
+        # Niveles faltantes o desconocidos quedan en "Sin dato", no se pierden
+        holes = df.assign(risk_level=df["risk_level"].astype(object).where(df.index % 7 != 0, None))
+        holes.loc[holes.index % 11 == 0, "risk_level"] = "Crítico"
+        patched = BinnedHistogram.from_data(holes, value_range=(0, 1))
+        assert patched.counts.sum() == n and patched.totals()[-1].sum() == (~holes["risk_level"].isin(RISK_LEVELS)).sum()
+        print(f"{n:>9,} filas · px.histogram {len(raw_json) / 1e3:10,.1f} KB ({raw_seconds:.2f}s) · "
+              f"bins precalculados {len(binned_json) / 1e3:5.1f} KB ({binned_seconds:.3f}s)")
@@ -0,0 +1,277 @@
+import fcntl
+import hashlib
+import io
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.absenteeism import (
+    ABSENTEEISM_SEP,
+    absence_features_from_state,
+    absence_state,
+    clean_column_names,
+    merge_absence_state,
+)
+from core.files import atomic_write
+from core.model import MODEL_DIR
+from core.quality import PROFILE_RANGES, merge_profiles, profile_chunk
+
+# ============================================
+# INGESTA INCREMENTAL (CARPETA DE ENTRADA)
+# ============================================
+
+# El HRIS deja extractos CSV con el formato de Absenteeism_at_work.csv en una
+# carpeta. Por archivo se recuerda hasta qué byte se ingirió y un hash de los
+# últimos bytes antes de ese punto: en cada pasada solo se lee lo nuevo
+# (archivos nuevos o filas agregadas al final), se valida y se guarda como
+# una parte Parquet más. El estado por empleado y el perfil de calidad se
+# combinan con el delta, así que el costo depende del lote y no del histórico.
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+INGEST_DIR = Path(os.environ.get("IMPULSO_INGEST_DIR", ROOT_DIR / "ingest"))
+STORE_DIR = Path(os.environ.get("IMPULSO_STORE_DIR", MODEL_DIR / "absence_store"))
+INGEST_PATTERN = "*.csv"
+INGEST_TAIL_BYTES = 64 * 1024
+INGEST_INTERVAL = 60
+
+ABSENTEEISM_COLUMNS = [
+    "id", "reason_for_absence", "month_of_absence", "day_of_the_week", "seasons",
+    "transportation_expense", "distance_from_residence_to_work", "service_time", "age",
+    "work_load_average_day", "hit_target", "disciplinary_failure", "education", "son",
+    "social_drinker", "social_smoker", "pet", "weight", "height", "body_mass_index",
+    "absenteeism_time_in_hours",
+]
+INGEST_RANGES = dict(zip(clean_column_names(PROFILE_RANGES), PROFILE_RANGES.values()))
+
+
+def _tail_hash(handle, offset):
+    start = max(0, offset - INGEST_TAIL_BYTES)
+    handle.seek(start)
+    return hashlib.sha256(handle.read(offset - start)).hexdigest()
+
+
+def validate_events(raw):
+    # Filas con campos faltantes, no numéricos o fuera de rango se rechazan
+    events = raw.set_axis(clean_column_names(raw.columns), axis=1)[ABSENTEEISM_COLUMNS]
+    events = events.apply(pd.to_numeric, errors="coerce")
+    valid = events.notna().all(axis=1).to_numpy().copy()
+    for column, (low, high) in INGEST_RANGES.items():
+        valid &= events[column].between(low, high).to_numpy()
+    accepted = events[valid]
+    integer = [c for c in ABSENTEEISM_COLUMNS if c != "work_load_average_day"]
+    return accepted.astype({c: np.int64 for c in integer}).reset_index(drop=True), raw[~valid]
+
+
+class AbsenceStore:
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = Path(store_dir)
+        self.manifest_path = self.store_dir / "manifest.json"
+        self.manifest = {"generation": 0, "rows": 0, "files": {}, "parts": []}
+        if self.manifest_path.exists():
+            self.manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+
+    @property
+    def generation(self):
+        return self.manifest["generation"]
+
+    def _path(self, kind, generation=None):
+        generation = self.generation if generation is None else generation
+        suffix = "json" if kind == "profile" else "parquet"
+        return self.store_dir / f"{kind}-{generation:06d}.{suffix}"
+
+    def state(self):
+        # Sin estado mientras no se haya aceptado ninguna fila
+        path = self._path("state")
+        return pd.read_parquet(path) if self.generation and path.exists() else None
+
+    def profile(self):
+        if not self.generation:
+            return None
+        return json.loads(self._path("profile").read_text(encoding="utf-8"))
+
+    def features(self):
+        state = self.state()
+        return None if state is None else absence_features_from_state(state)
+
+    def read(self, columns=None):
+        # Solo las partes registradas en el manifiesto: una parte huérfana de
+        # una pasada interrumpida nunca se lee
+        parts = [self.store_dir / "parts" / name for name in self.manifest["parts"]]
+        if not parts:
+            return pd.DataFrame(columns=columns or ABSENTEEISM_COLUMNS)
+        return pd.concat([pd.read_parquet(p, columns=columns) for p in parts], ignore_index=True)
+
+    def _read_delta(self, path, entry):
+        # Devuelve (encabezado + filas nuevas completas, nuevo offset, hash) o un estado
+        size = path.stat().st_size
+        with open(path, "rb") as handle:
+            if entry is not None:
+                if size < entry["offset"] or _tail_hash(handle, entry["offset"]) != entry["tail_hash"]:
+                    return "modificado", None
+                if size == entry["offset"]:
+                    return "sin cambios", None
+                header = entry["header"].encode("utf-8")
+                handle.seek(entry["offset"])
+                offset = entry["offset"]
+            else:
+                header = handle.readline()
+                offset = len(header)
+            data = handle.read()
+            # Una última línea sin salto puede estar a medio escribir: espera a la siguiente pasada
+            cut = data.rfind(b"\n") + 1
+            if not cut:
+                return "sin cambios", None
+            offset += cut
+            return "nuevo" if entry is None else "agregado", (header, data[:cut], offset, _tail_hash(handle, offset))
+
+    def ingest(self, drop_dir=INGEST_DIR, pattern=INGEST_PATTERN):
+        start = time.perf_counter()
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.store_dir / "ingest.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if self.manifest_path.exists():
+                self.manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            return self._ingest(Path(drop_dir), pattern, start)
+
+    def _ingest(self, drop_dir, pattern, start):
+        files = dict(self.manifest["files"])
+        report = {"files": {}, "rows": 0, "rejected": 0, "employees": np.array([], dtype=np.int64)}
+        accepted_parts, rejected_parts, profile = [], [], None
+
+        for path in sorted(drop_dir.glob(pattern)):
+            status, delta = self._read_delta(path, files.get(path.name))
+            if delta is None:
+                if status != "sin cambios":
+                    report["files"][path.name] = {"status": status}
+                continue
+            header, body, offset, tail_hash = delta
+            if sorted(clean_column_names(header.decode("utf-8").strip().split(ABSENTEEISM_SEP))) != sorted(ABSENTEEISM_COLUMNS):
+                report["files"][path.name] = {"status": "encabezado inválido"}
+                continue
+
+            raw = pd.read_csv(io.BytesIO(header + body), sep=ABSENTEEISM_SEP, dtype=object)
+            profile = merge_profiles(profile, profile_chunk(raw))
+            accepted, rejected = validate_events(raw)
+            accepted_parts.append(accepted)
+            rejected_parts.append(rejected)
+            previous = files.get(path.name, {"rows": 0, "rejected": 0})
+            files[path.name] = {
+                "offset": offset,
+                "tail_hash": tail_hash,
+                "header": header.decode("utf-8"),
+                "rows": previous["rows"] + len(accepted),
+                "rejected": previous["rejected"] + len(rejected),
+            }
+            report["files"][path.name] = {"status": status, "rows": len(accepted), "rejected": len(rejected)}
+
+        if not accepted_parts:
+            report["seconds"] = time.perf_counter() - start
+            return report
+
+        delta = pd.concat(accepted_parts, ignore_index=True)
+        generation = self.generation + 1
+        parts = list(self.manifest["parts"])
+        if len(delta):
+            parts.append(f"part-{generation:06d}.parquet")
+            (self.store_dir / "parts").mkdir(exist_ok=True)
+            delta.to_parquet(self.store_dir / "parts" / parts[-1], index=False)
+        rejected = pd.concat(rejected_parts)
+        if len(rejected):
+            rejected.to_csv(self.store_dir / f"rejected-{generation:06d}.csv", sep=ABSENTEEISM_SEP, index=False)
+
+        # Agregados incrementales: estado por empleado y perfil de calidad
+        state = merge_absence_state(self.state(), absence_state(delta)) if len(delta) else self.state()
+        if state is not None:
+            state.to_parquet(self._path("state", generation), index=False)
+        self._path("profile", generation).write_text(
+            json.dumps(merge_profiles(self.profile(), profile), ensure_ascii=False), encoding="utf-8"
+        )
+
+        # El manifiesto se reemplaza al final y en un paso: es el punto de confirmación
+        previous_generation = self.generation
+        manifest = {
+            "generation": generation,
+            "rows": self.manifest["rows"] + len(delta),
+            "files": files,
+            "parts": parts,
+        }
+        with atomic_write(self.manifest_path) as tmp_path:
+            tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding="utf-8")
+        self.manifest = manifest
+        for kind in ["state", "profile"]:
+            if previous_generation:
+                self._path(kind, previous_generation).unlink(missing_ok=True)
+
+        report.update(
+            rows=len(delta),
+            rejected=len(rejected),
+            employees=np.unique(delta["id"].to_numpy()),
+            seconds=time.perf_counter() - start,
+        )
+        return report
+
+
+def watch(store, drop_dir=INGEST_DIR, interval=INGEST_INTERVAL, on_ingest=None):
+    # Sondeo simple de la carpeta; on_ingest recibe el reporte de cada pasada
+    # con filas nuevas (p. ej. para recalcular solo los empleados afectados)
+    while True:
+        report = store.ingest(drop_dir)
+        if report["rows"] and on_ingest is not None:
+            on_ingest(report)
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    # python -m core.ingest [--watch SEG]: ingiere la carpeta de entrada
+    # python -m core.ingest --bench [millones]: tiempo del delta nocturno
+    # frente al tamaño del histórico
+    import argparse
+    import tempfile
+
+    from core.absenteeism import ABSENTEEISM_PATH
+
+    parser = argparse.ArgumentParser(description="Ingesta incremental de extractos de ausentismo")
+    parser.add_argument("--dir", default=str(INGEST_DIR), help="carpeta de entrada")
+    parser.add_argument("--watch", type=float, help="repetir cada SEG segundos")
+    parser.add_argument("--bench", type=float, nargs="?", const=2.0, help="millones de filas de histórico")
+    args = parser.parse_args()
+
+    def show(report):
+        for name, info in report["files"].items():
+            print(f"  {name}: {info}")
+        print(f"  {report['rows']:,} filas nuevas · {report['rejected']:,} rechazadas · "
+              f"{len(report['employees']):,} empleados afectados · {report['seconds']:.2f}s")
+
+    if args.bench is None:
+        store = AbsenceStore()
+        if args.watch:
+            watch(store, args.dir, args.watch, show)
+        show(store.ingest(args.dir))
+    else:
+        raw = pd.read_csv(ABSENTEEISM_PATH, sep=ABSENTEEISM_SEP)
+        rng = np.random.default_rng(123)
+        with tempfile.TemporaryDirectory() as tmp:
+            drop_dir, store = Path(tmp) / "entrada", AbsenceStore(Path(tmp) / "store")
+            drop_dir.mkdir()
+            history = raw.iloc[rng.integers(0, len(raw), int(args.bench * 1_000_000))]
+            history.to_csv(drop_dir / "historico.csv", sep=ABSENTEEISM_SEP, index=False)
+            print(f"Histórico de {len(history):,} filas:")
+            show(store.ingest(drop_dir))
+
+            # Noche siguiente: filas agregadas al histórico y un extracto nuevo
+            nightly = raw.sample(frac=1, random_state=1)
+            nightly.to_csv(drop_dir / "historico.csv", sep=ABSENTEEISM_SEP, index=False, header=False, mode="a")
+            nightly.to_csv(drop_dir / "extracto_2026_10_20.csv", sep=ABSENTEEISM_SEP, index=False)
+            print("Delta nocturno:")
+            show(store.ingest(drop_dir))
+            print("Sin cambios:")
+            show(store.ingest(drop_dir))
+
+            features = store.features()
+            direct = absence_features_from_state(absence_state(store.read()))
+            pd.testing.assert_frame_equal(features, direct, check_exact=False, rtol=1e-9)
+            print(f"Features incrementales = recalculadas desde cero ({len(features):,} empleados)")
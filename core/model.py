@@ -0,0 +1,181 @@
+import os
+from pathlib import Path
+
+from core.files import atomic_write
+from core.startup import startup_report
+
+# ============================================
+# MODELO DE RIESGO
+# ============================================
+
+MODEL_FEATURES = ["stress", "burnout", "workload", "absenteeism", "anxiety"]
+# Sube cuando cambia cómo se entrena (partición, features): un artefacto
+# viejo no se reutiliza
+MODEL_SCHEMA = 2
+MODEL_DIR = Path(os.environ.get("IMPULSO_MODEL_DIR", Path(__file__).resolve().parent.parent / "artifacts"))
+
+
+HOLDOUT_PERCENT = 30
+
+
+def holdout_mask(keys):
+    # El holdout se decide por hash del employee_id, no por posición: un
+    # empleado queda en validación en todos los datasets y modelos, así que
+    # ningún modelo (actual, candidato o crecido) entrena con esas filas.
+    import numpy as np
+    import pandas as pd
+
+    return pd.util.hash_array(np.asarray(keys)) % 100 < HOLDOUT_PERCENT
+
+
+def split_holdout(X_processed, y, keys):
+    test = holdout_mask(keys)
+    y = y.to_numpy() if hasattr(y, "to_numpy") else y
+    return X_processed[~test], X_processed[test], y[~test], y[test]
+
+
+def train_risk_model(X, y, keys):
+    # sklearn se importa solo cuando hay que entrenar: cargar un artefacto
+    # persistido no necesita model_selection ni el coste del ajuste.
+    from sklearn.compose import ColumnTransformer
+    from sklearn.ensemble import RandomForestClassifier
+
+    preprocess = ColumnTransformer([
+        ("num", "passthrough", X.columns)
+    ])
+
+    X_processed = preprocess.fit_transform(X)
+
+    X_train, X_test, y_train, y_test = split_holdout(X_processed, y, keys)
+
+    rf = RandomForestClassifier(n_estimators=600, random_state=123)
+    rf.fit(X_train, y_train)
+    return preprocess, X_processed, rf
+
+
+def grow_risk_model(bundle, new_data, n_new_trees=60, max_trees=600):
+    # Crecimiento incremental: el preprocesamiento queda congelado y se
+    # añaden árboles ajustados solo sobre el lote nuevo (warm_start). Los
+    # árboles más antiguos se retiran para que el ensamble no pase de
+    # max_trees. Se trabaja sobre una copia: el modelo servido no cambia.
+    # Los empleados del holdout fijo se excluyen también del lote.
+    import copy
+
+    import numpy as np
+
+    preprocess, X_processed, rf = bundle
+    rf = sklearn_forest(rf)
+    new_data = new_data[~holdout_mask(new_data["employee_id"])]
+    y_new = np.asarray(new_data["risk_level"])
+    missing = set(rf.classes_) - set(y_new)
+    if missing:
+        raise ValueError(f"El lote nuevo no contiene las clases {sorted(missing)}")
+
+    grown = copy.deepcopy(rf)
+    grown.set_params(warm_start=True, n_estimators=len(grown.estimators_) + n_new_trees)
+    grown.fit(preprocess.transform(new_data[MODEL_FEATURES]), y_new)
+    grown.estimators_ = grown.estimators_[-max_trees:]
+    grown.set_params(warm_start=False, n_estimators=len(grown.estimators_))
+    return preprocess, X_processed, grown
+
+
+class PassthroughFeatures:
+    # Mismo resultado que el ColumnTransformer "passthrough" de
+    # train_risk_model, sin sklearn: es el preprocesamiento del bosque compacto
+    def __init__(self, columns):
+        self.columns = list(columns)
+
+    def transform(self, X):
+        return X[self.columns].to_numpy()
+
+    def get_feature_names_out(self):
+        import numpy as np
+
+        return np.array([f"num__{column}" for column in self.columns], dtype=object)
+
+
+def sklearn_forest(rf):
+    # El bosque compacto recuerda su pickle: crecer con warm_start o destilar
+    # en lote (donde sklearn es más rápido) usan el RandomForestClassifier
+    source = getattr(rf, "source", None)
+    if source is None:
+        return rf
+    import joblib
+
+    return joblib.load(source)[2]
+
+
+def model_artifact_path(version, model_dir=MODEL_DIR):
+    return Path(model_dir) / f"risk_model_{version}_m{MODEL_SCHEMA}.joblib"
+
+
+def compact_artifact_path(version, model_dir=MODEL_DIR):
+    return model_artifact_path(version, model_dir).with_suffix(".forest")
+
+
+def features_artifact_path(version, model_dir=MODEL_DIR):
+    return model_artifact_path(version, model_dir).with_suffix(".features.npy")
+
+
+def save_risk_model(bundle, path):
+    import joblib
+
+    path = Path(path)
+    with atomic_write(path) as tmp_path:
+        joblib.dump(bundle, tmp_path)
+    return path
+
+
+def save_compact_model(bundle, version, model_dir=MODEL_DIR):
+    # Junto al pickle: bosque compacto y X_processed en .npy. El directorio
+    # .forest se escribe al final; si existe, el resto también
+    import numpy as np
+
+    from core.forest import export_compact_forest
+
+    _, X_processed, rf = bundle
+    with atomic_write(features_artifact_path(version, model_dir)) as tmp_path:
+        with open(tmp_path, "wb") as handle:
+            np.save(handle, np.asarray(X_processed))
+    return export_compact_forest(rf, compact_artifact_path(version, model_dir))
+
+
+def load_compact_model(version, model_dir=MODEL_DIR, mmap_mode=None):
+    import numpy as np
+
+    from core.forest import load_compact_forest
+
+    forest = load_compact_forest(compact_artifact_path(version, model_dir))
+    forest.source = model_artifact_path(version, model_dir)
+    X_processed = np.load(features_artifact_path(version, model_dir), mmap_mode=mmap_mode)
+    return PassthroughFeatures(MODEL_FEATURES), X_processed, forest
+
+
+def load_or_train_risk_model(data, version, model_dir=MODEL_DIR, mmap_mode=None):
+    # El arranque en frío sirve el bosque compacto (numpy, sin importar
+    # sklearn). mmap_mode="r" mapea sus arrays y X_processed en lugar de
+    # copiarlos: los procesos que cargan los mismos archivos comparten esas
+    # páginas a través de la caché del sistema operativo.
+    from core.drift import drift_reference_path, save_training_reference
+
+    # Referencia de deriva del entrenamiento (data es la versión del modelo)
+    if not drift_reference_path(version, model_dir).exists():
+        save_training_reference(data, version, model_dir)
+    if compact_artifact_path(version, model_dir).exists():
+        startup_report.note("modelo", "artefacto compacto")
+        return load_compact_model(version, model_dir, mmap_mode)
+
+    import joblib
+
+    path = model_artifact_path(version, model_dir)
+    if path.exists():
+        startup_report.note("modelo", "artefacto")
+        bundle = joblib.load(path, mmap_mode=mmap_mode)
+    else:
+        startup_report.note("modelo", "entrenado")
+        bundle = train_risk_model(data[MODEL_FEATURES], data["risk_level"], data["employee_id"])
+        save_risk_model(bundle, path)
+        if mmap_mode:
+            bundle = joblib.load(path, mmap_mode=mmap_mode)
+    save_compact_model(bundle, version, model_dir)
+    return bundle
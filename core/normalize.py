@@ -0,0 +1,186 @@
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.files import atomic_write
+from core.model import MODEL_DIR
+
+# ============================================
+# NORMALIZACIÓN DE TEXTO LIBRE (ENCUESTA)
+# ============================================
+
+# Cada columna se factoriza una vez y solo sus valores únicos pasan por la
+# normalización (minúsculas, sin acentos, tablas de sinónimos). El resultado
+# se reparte a todas las filas con los códigos enteros, y el mapeo valor
+# crudo -> canónico se memoriza en disco para las siguientes ejecuciones.
+
+NORMALIZATION_VERSION = 1
+NORMALIZATION_MEMO_PATH = MODEL_DIR / "normalization_memo.json"
+
+# Mismas tres categorías que el case_when del Rmd (male / female / nonbinary).
+# El Rmd evalúa "male" antes que "female" y su regex también encuentra "male"
+# dentro de "female": aquí cada grafía se resuelve por tabla y no hay ese cruce.
+GENDER_SYNONYMS = {
+    "male": [
+        "male", "m", "man", "cis male", "male cis", "cis man", "make", "mal", "maile", "msle", "mail",
+        "malr", "male ish", "guy ish", "something kinda male", "ostensibly male unsure what that really means",
+    ],
+    "female": [
+        "female", "f", "woman", "cis female", "female cis", "femake", "femail", "cis female femme",
+        "female trans", "trans female", "trans woman",
+    ],
+}
+GENDER_DEFAULT = "nonbinary"
+
+COUNTRY_SYNONYMS = {
+    "United States": ["us", "usa", "united states of america", "estados unidos"],
+    "United Kingdom": ["uk", "england", "great britain", "reino unido"],
+    "Bahamas": ["bahamas the", "the bahamas"],
+    "Czech Republic": ["czechia"],
+}
+
+US_STATES = {
+    "AL": "alabama", "AK": "alaska", "AZ": "arizona", "AR": "arkansas", "CA": "california",
+    "CO": "colorado", "CT": "connecticut", "DE": "delaware", "DC": "district of columbia",
+    "FL": "florida", "GA": "georgia", "HI": "hawaii", "ID": "idaho", "IL": "illinois",
+    "IN": "indiana", "IA": "iowa", "KS": "kansas", "KY": "kentucky", "LA": "louisiana",
+    "ME": "maine", "MD": "maryland", "MA": "massachusetts", "MI": "michigan", "MN": "minnesota",
+    "MS": "mississippi", "MO": "missouri", "MT": "montana", "NE": "nebraska", "NV": "nevada",
+    "NH": "new hampshire", "NJ": "new jersey", "NM": "new mexico", "NY": "new york",
+    "NC": "north carolina", "ND": "north dakota", "OH": "ohio", "OK": "oklahoma", "OR": "oregon",
+    "PA": "pennsylvania", "RI": "rhode island", "SC": "south carolina", "SD": "south dakota",
+    "TN": "tennessee", "TX": "texas", "UT": "utah", "VT": "vermont", "VA": "virginia",
+    "WA": "washington", "WV": "west virginia", "WI": "wisconsin", "WY": "wyoming",
+}
+
+
+def _invert(synonyms):
+    return {variant: canonical for canonical, variants in synonyms.items() for variant in variants}
+
+
+GENDER_LOOKUP = _invert(GENDER_SYNONYMS)
+COUNTRY_LOOKUP = _invert(COUNTRY_SYNONYMS)
+STATE_LOOKUP = {name: code for code, name in US_STATES.items()}
+
+
+def normalize_token(value):
+    # "  Cis-Female (femme) " -> "cis female femme"; "México" -> "mexico"
+    text = unicodedata.normalize("NFKD", str(value))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    return re.sub(r"[^0-9a-z]+", " ", text).strip()
+
+
+def normalize_gender(value):
+    return GENDER_LOOKUP.get(normalize_token(value), GENDER_DEFAULT)
+
+
+def normalize_country(value):
+    token = normalize_token(value)
+    if token in COUNTRY_LOOKUP:
+        return COUNTRY_LOOKUP[token]
+    text = unicodedata.normalize("NFKD", str(value).strip())
+    text = re.sub(r"\s+", " ", "".join(ch for ch in text if not unicodedata.combining(ch)))
+    return text.title() if text.islower() else text
+
+
+def normalize_state(value):
+    token = normalize_token(value)
+    if token.upper() in US_STATES:
+        return token.upper()
+    return STATE_LOOKUP.get(token, token.upper())
+
+
+SURVEY_NORMALIZERS = {
+    "Gender": normalize_gender,
+    "Country": normalize_country,
+    "state": normalize_state,
+}
+
+
+class NormalizationMemo:
+    # Mapeos valor crudo -> canónico por columna, persistidos entre ejecuciones.
+    # Si cambian las reglas (NORMALIZATION_VERSION) el memo anterior se descarta.
+
+    def __init__(self, path=NORMALIZATION_MEMO_PATH):
+        self.path = Path(path) if path else None
+        self.columns = {}
+        self.dirty = False
+        if self.path and self.path.exists():
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            if payload.get("version") == NORMALIZATION_VERSION:
+                self.columns = payload["columns"]
+
+    def mapping(self, column):
+        return self.columns.setdefault(column, {})
+
+    def save(self):
+        if not (self.path and self.dirty):
+            return
+        payload = {"version": NORMALIZATION_VERSION, "columns": self.columns}
+        with atomic_write(self.path) as tmp_path:
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        self.dirty = False
+
+
+def normalize_column(values, normalizer, mapping=None):
+    # Devuelve un Categorical: los códigos se reasignan a las categorías
+    # canónicas sin volver a construir millones de strings
+    codes, uniques = pd.factorize(values)
+    mapping = {} if mapping is None else mapping
+    canonical = []
+    for raw in uniques:
+        key = str(raw)
+        if key not in mapping:
+            mapping[key] = normalizer(raw)
+        canonical.append(mapping[key])
+    categories, remap = np.unique(np.array(canonical, dtype=object), return_inverse=True)
+    # Los faltantes (código -1) siguen faltando
+    new_codes = np.where(codes >= 0, remap.reshape(-1)[codes], -1) if len(canonical) else codes
+    categorical = pd.Categorical.from_codes(new_codes, categories=pd.Index(categories, dtype="str"))
+    return pd.Series(categorical, index=getattr(values, "index", None))
+
+
+def normalize_survey(survey, normalizers=SURVEY_NORMALIZERS, memo=None):
+    memo = NormalizationMemo() if memo is None else memo
+    survey = survey.copy()
+    for column, normalizer in normalizers.items():
+        mapping = memo.mapping(column)
+        known = len(mapping)
+        survey[column] = normalize_column(survey[column], normalizer, mapping)
+        memo.dirty |= len(mapping) != known
+    memo.save()
+    return survey
+
+
+if __name__ == "__main__":
+    # python -m core.normalize [millones]: por valor único frente a fila por fila
+    import sys
+    import time
+
+    from core.survey import SURVEY_PATH
+
+    raw = pd.read_csv(SURVEY_PATH)
+    n_rows = int(float(sys.argv[1]) * 1_000_000) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(123)
+    sample = raw[list(SURVEY_NORMALIZERS)].iloc[rng.integers(0, len(raw), n_rows)].reset_index(drop=True)
+
+    start = time.perf_counter()
+    fast = normalize_survey(sample, memo=NormalizationMemo(path=None))
+    unique_seconds = time.perf_counter() - start
+
+    rowwise_rows = min(n_rows, 200_000)
+    start = time.perf_counter()
+    for column, normalizer in SURVEY_NORMALIZERS.items():
+        slow = sample[column].iloc[:rowwise_rows].map(normalizer, na_action="ignore")
+        assert slow.equals(fast[column].iloc[:rowwise_rows].astype(slow.dtype).rename(slow.name))
+    rowwise_seconds = (time.perf_counter() - start) * n_rows / rowwise_rows
+
+    print(f"{n_rows:,} filas × {len(SURVEY_NORMALIZERS)} columnas")
+    print(f"Por valor único: {unique_seconds:.3f}s · fila por fila (extrapolado de {rowwise_rows:,}): "
+          f"{rowwise_seconds:.1f}s · {rowwise_seconds / unique_seconds:.0f}x")
+    for column in SURVEY_NORMALIZERS:
+        print(f"  {column}: {raw[column].nunique()} valores crudos -> {fast[column].nunique()} canónicos")
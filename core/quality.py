@@ -0,0 +1,224 @@
+import json
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.data import file_version
+from core.files import atomic_write
+from core.model import MODEL_DIR
+
+# ============================================
+# PERFIL DE CALIDAD DE DATOS
+# ============================================
+
+# El archivo se lee una sola vez por bloques y todo como texto, para poder
+# detectar valores que no coinciden con el tipo de la columna. Cada columna
+# de cada bloque se factoriza una vez y las estadísticas salen de los valores
+# únicos y sus conteos. Los resultados parciales se combinan con
+# merge_profiles (sumas, mín/máx, conteos y un boceto KMV para la
+# cardinalidad), así que los bloques pueden repartirse entre procesos.
+
+PROFILE_VERSION = 1
+PROFILE_CHUNK_ROWS = 100_000
+# Bloques en vuelo por proceso con workers > 1 (acota la memoria)
+PROFILE_IN_FLIGHT = 2
+PROFILE_DIR = MODEL_DIR
+PROFILE_SKETCH_SIZE = 1024
+PROFILE_TOP_MAX = 30
+PROFILE_NUMERIC_SHARE = 0.9
+PROFILE_NULL_WARNING = 0.2
+
+# Rangos válidos por columna (nombres tal como vienen en el archivo)
+PROFILE_RANGES = {
+    "Age": (15, 80),
+    "Reason for absence": (0, 28),
+    "Month of absence": (0, 12),
+    "Day of the week": (2, 6),
+    "Seasons": (1, 4),
+    "Absenteeism time in hours": (0, 24 * 7),
+}
+
+
+def detect_sep(path):
+    with open(path, encoding="utf-8", errors="replace") as handle:
+        header = handle.readline()
+    return ";" if header.count(";") > header.count(",") else ","
+
+
+def profile_chunk(chunk, ranges=PROFILE_RANGES):
+    columns = {}
+    for name in chunk.columns:
+        codes, uniques = pd.factorize(chunk[name])
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        text = pd.Series(uniques, dtype="str")
+        numbers = pd.to_numeric(text, errors="coerce").to_numpy(dtype=float)
+        parsed = ~np.isnan(numbers)
+        values, weights = numbers[parsed], counts[parsed]
+
+        low, high = ranges.get(name, (-np.inf, np.inf))
+        outside = (values < low) | (values > high)
+        hashes = np.unique(pd.util.hash_array(text.to_numpy(dtype=object)))[:PROFILE_SKETCH_SIZE]
+        columns[name] = {
+            "rows": len(chunk),
+            "nulls": int((codes < 0).sum()),
+            "numeric": int(weights.sum()),
+            "min": float(values.min()) if len(values) else None,
+            "max": float(values.max()) if len(values) else None,
+            "sum": float((values * weights).sum()),
+            "sumsq": float((values ** 2 * weights).sum()),
+            "out_of_range": int(weights[outside].sum()),
+            "max_length": int(text.str.len().max()) if len(text) else 0,
+            "sketch": [int(h) for h in hashes],
+            "top": dict(zip(text, counts.tolist())) if len(uniques) <= PROFILE_TOP_MAX else None,
+        }
+    return {"rows": len(chunk), "columns": columns}
+
+
+def _merge_column(a, b):
+    def pick(f, x, y):
+        return y if x is None else x if y is None else f(x, y)
+
+    top = None
+    if a["top"] is not None and b["top"] is not None:
+        top = dict(a["top"])
+        for value, count in b["top"].items():
+            top[value] = top.get(value, 0) + count
+        top = top if len(top) <= PROFILE_TOP_MAX else None
+    sketch = np.unique(np.array(a["sketch"] + b["sketch"], dtype=np.uint64))[:PROFILE_SKETCH_SIZE]
+    return {
+        "rows": a["rows"] + b["rows"],
+        "nulls": a["nulls"] + b["nulls"],
+        "numeric": a["numeric"] + b["numeric"],
+        "min": pick(min, a["min"], b["min"]),
+        "max": pick(max, a["max"], b["max"]),
+        "sum": a["sum"] + b["sum"],
+        "sumsq": a["sumsq"] + b["sumsq"],
+        "out_of_range": a["out_of_range"] + b["out_of_range"],
+        "max_length": max(a["max_length"], b["max_length"]),
+        "sketch": [int(h) for h in sketch],
+        "top": top,
+    }
+
+
+def merge_profiles(a, b):
+    # Asociativa: el orden en que llegan los bloques no cambia el resultado
+    if a is None:
+        return b
+    columns = dict(a["columns"])
+    for name, column in b["columns"].items():
+        columns[name] = _merge_column(columns[name], column) if name in columns else column
+    return {"rows": a["rows"] + b["rows"], "columns": columns}
+
+
+def estimate_distinct(sketch):
+    # KMV: con menos de k hashes distintos el conteo es exacto
+    if len(sketch) < PROFILE_SKETCH_SIZE:
+        return len(sketch)
+    return int(round((PROFILE_SKETCH_SIZE - 1) / (sketch[-1] / 2.0 ** 64)))
+
+
+def profile_file(path, sep=None, chunksize=PROFILE_CHUNK_ROWS, workers=1, ranges=PROFILE_RANGES):
+    reader = pd.read_csv(path, sep=sep or detect_sep(path), dtype=object, chunksize=chunksize)
+    profile = None
+    if workers > 1:
+        # Ventana acotada de bloques en vuelo: executor.map leería todo el
+        # archivo de entrada antes de devolver el primer resultado
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            pending = deque()
+            for chunk in reader:
+                pending.append(executor.submit(profile_chunk, chunk, ranges))
+                if len(pending) >= PROFILE_IN_FLIGHT * workers:
+                    profile = merge_profiles(profile, pending.popleft().result())
+            while pending:
+                profile = merge_profiles(profile, pending.popleft().result())
+    else:
+        for chunk in reader:
+            profile = merge_profiles(profile, profile_chunk(chunk, ranges))
+    return profile or {"rows": 0, "columns": {}}
+
+
+def load_profile(path, sep=None, profile_dir=PROFILE_DIR, workers=1):
+    # Un perfil por huella del archivo: solo se recalcula si cambia el contenido
+    path = Path(path)
+    cache_path = Path(profile_dir) / f"profile_{path.stem}_{file_version(path)}_v{PROFILE_VERSION}.json"
+    if cache_path.exists():
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    profile = profile_file(path, sep, workers=workers)
+    with atomic_write(cache_path) as tmp_path:
+        tmp_path.write_text(json.dumps(profile, ensure_ascii=False), encoding="utf-8")
+    return profile
+
+
+def profile_report(profile, name="", ranges=PROFILE_RANGES):
+    columns = []
+    issues = []
+    for column, stats in profile["columns"].items():
+        present = stats["rows"] - stats["nulls"]
+        numeric = present > 0 and stats["numeric"] >= PROFILE_NUMERIC_SHARE * present
+        null_rate = stats["nulls"] / max(stats["rows"], 1)
+        mismatches = present - stats["numeric"] if numeric else 0
+        mean = stats["sum"] / stats["numeric"] if numeric else None
+        std = np.sqrt(max(stats["sumsq"] / stats["numeric"] - mean ** 2, 0.0)) if numeric else None
+        entry = {
+            "column": column,
+            "type": "numérica" if numeric else "texto",
+            "null_rate": null_rate,
+            "distinct": estimate_distinct(stats["sketch"]),
+            "out_of_range": stats["out_of_range"] if numeric else 0,
+            "type_mismatches": mismatches,
+            "min": stats["min"] if numeric else None,
+            "max": stats["max"] if numeric else None,
+            "mean": mean,
+            "std": None if std is None else float(std),
+            "max_length": stats["max_length"],
+            "top": dict(sorted(stats["top"].items(), key=lambda kv: -kv[1])[:5]) if stats["top"] else None,
+        }
+        columns.append(entry)
+
+        if null_rate >= PROFILE_NULL_WARNING:
+            issues.append(f"{column}: {null_rate:.0%} de valores faltantes")
+        if entry["out_of_range"]:
+            low, high = ranges[column]
+            issues.append(f"{column}: {entry['out_of_range']} valores fuera de [{low:g}, {high:g}]")
+        if mismatches:
+            issues.append(f"{column}: {mismatches} valores no numéricos en una columna numérica")
+    return {"file": name, "rows": profile["rows"], "columns": columns, "issues": issues}
+
+
+def profile_table(report):
+    table = pd.DataFrame(report["columns"])
+    return table[["column", "type", "null_rate", "distinct", "out_of_range", "type_mismatches", "min", "max"]]
+
+
+if __name__ == "__main__":
+    # python -m core.quality [archivo.csv ...] [--json salida.json] [--workers N]
+    # Sin archivos perfila survey.csv y Absenteeism_at_work.csv.
+    import argparse
+    import time
+
+    from core.absenteeism import ABSENTEEISM_PATH
+    from core.survey import SURVEY_PATH
+
+    parser = argparse.ArgumentParser(description="Perfil de calidad de archivos de RRHH")
+    parser.add_argument("files", nargs="*", default=[str(SURVEY_PATH), str(ABSENTEEISM_PATH)])
+    parser.add_argument("--json", help="guardar el reporte en este archivo")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    reports = []
+    for file in args.files:
+        start = time.perf_counter()
+        profile = profile_file(file, workers=args.workers)
+        elapsed = time.perf_counter() - start
+        report = profile_report(profile, Path(file).name)
+        reports.append(report)
+        print(f"{report['file']}: {report['rows']:,} filas · {len(report['columns'])} columnas en {elapsed:.2f}s")
+        for issue in report["issues"]:
+            print(f"  - {issue}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(reports, ensure_ascii=False, indent=2), encoding="utf-8")
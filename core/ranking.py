@@ -0,0 +1,84 @@
+import heapq
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# RANKING DE RIESGO POR DEPARTAMENTO (TOP-K)
+# ============================================
+
+
+class RiskRanking:
+    # Mantiene, por departamento, las posiciones de fila ordenadas por
+    # (risk_score desc, performance desc, fila asc). La lista de empleados
+    # toma los primeros K de cada departamento que pasan el filtro y los
+    # mezcla con un heap: O(K log D) en lugar de ordenar todo el frame en
+    # cada rerun. Cambios de score se aplican moviendo solo la fila afectada.
+
+    def __init__(self, data):
+        self.risk = data["risk_score"].to_numpy(dtype=float).copy()
+        self.perf = data["performance"].to_numpy(dtype=float).copy()
+        self.departments = data["department"].to_numpy()
+        # lexsort es estable: los empates conservan el orden original de filas
+        order = np.lexsort((-self.perf, -self.risk))
+        codes, uniques = pd.factorize(self.departments[order])
+        split = np.argsort(codes, kind="stable")
+        bounds = np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1]
+        self.runs = dict(zip(uniques, np.split(order[split], bounds)))
+
+    def _key(self, pos):
+        return (-self.risk[pos], -self.perf[pos], pos)
+
+    def _filtered_head(self, run, mask, k, chunk=1024):
+        # Primeros k de la corrida que pasan la máscara, recorriendo por bloques
+        found = []
+        total = 0
+        for start in range(0, len(run), chunk):
+            block = run[start:start + chunk]
+            if mask is not None:
+                block = block[mask[block]]
+            found.append(block)
+            total += len(block)
+            if total >= k:
+                break
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(found)[:k]
+
+    def top_k(self, k=50, mask=None, departments=None):
+        depts = self.runs if departments is None else [d for d in departments if d in self.runs]
+        heads = [self._filtered_head(self.runs[d], mask, k) for d in depts]
+        heads = [h for h in heads if len(h)]
+        if len(heads) == 1:
+            return heads[0]
+        merged = heapq.merge(*[[self._key(p) for p in h] for h in heads])
+        return np.array([key[2] for _, key in zip(range(k), merged)], dtype=np.int64)
+
+    def update(self, pos, risk_score=None, performance=None):
+        pos = int(pos)
+        run = self.runs[self.departments[pos]]
+        idx = self._locate(run, pos)
+        run = np.delete(run, idx)
+        if risk_score is not None:
+            self.risk[pos] = risk_score
+        if performance is not None:
+            self.perf[pos] = performance
+        self.runs[self.departments[pos]] = np.insert(run, self._insertion_point(run, pos), pos)
+
+    def _insertion_point(self, run, pos):
+        # Búsqueda binaria sobre la clave compuesta de la corrida ordenada
+        key = self._key(pos)
+        lo, hi = 0, len(run)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(run[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _locate(self, run, pos):
+        idx = self._insertion_point(run, pos)
+        if idx < len(run) and run[idx] == pos:
+            return idx
+        return int(np.flatnonzero(run == pos)[0])
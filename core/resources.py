@@ -0,0 +1,157 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import streamlit as st
+
+from core.aggregates import KpiStore, department_metrics
+from core.alerts import ALERT_RULES, AlertEngine
+from core.data import data_version, generate_employees
+from core.database import SQL_BACKEND, EmployeeDB, build_employee_db
+from core.drift import load_training_reference
+from core.employees import EmployeeStore
+from core.histograms import BinnedHistogram
+from core.model import MODEL_FEATURES, load_or_train_risk_model, sklearn_forest
+from core.quality import load_profile, profile_report
+from core.ranking import RiskRanking
+from core.retraining import RETRAIN_INTERVAL, ModelServer
+from core.scatter import ScatterIndex
+from core.segmentation import compute_segments, segment_silhouettes
+from core.shared import SHARED_MEMORY, load_shared_employees
+from core.simulation import WhatIfSimulator
+from core.surrogate import distill_risk_model, fidelity_report
+
+# ============================================
+# RECURSOS COMPARTIDOS ENTRE PÁGINAS Y SESIONES
+# ============================================
+
+# st.cache_resource guarda un único objeto por proceso: app.py y app2.py
+# servidos juntos comparten el mismo dataset y el mismo modelo. Los objetos
+# devueltos son de solo lectura para quien los consume. Con
+# IMPULSO_SHARED_MEMORY=1 los datos y X_processed además se mapean desde
+# archivos compartidos entre procesos (ver core/shared.py).
+
+
+# Cada generación nueva del modelo crea un bosque destilado y simuladores
+# nuevos: se conservan los de la actual y la anterior (reruns en curso)
+MODEL_CACHE_ENTRIES = 2
+
+
+def read_employees(n=800, seed=123):
+    # Lectura del origen sin caché: la usan la carga inicial y el
+    # reentrenamiento, que necesita ver los datos actuales
+    if SHARED_MEMORY:
+        return load_shared_employees(n, seed)
+    df = generate_employees(n, seed)
+    return df, data_version(df)
+
+
+@st.cache_resource(show_spinner="Cargando datos...")
+def load_employees(n=800, seed=123):
+    return read_employees(n, seed)
+
+
+@st.cache_resource(show_spinner="Entrenando modelo...")
+def load_risk_model(_data, version):
+    return load_or_train_risk_model(_data, version, mmap_mode="r" if SHARED_MEMORY else None)
+
+
+@st.cache_resource(show_spinner=False)
+def get_model_server(_data, version):
+    # Envuelve el modelo cacheado para poder reentrenarlo y reemplazarlo sin
+    # reiniciar la app; con IMPULSO_RETRAIN_INTERVAL (segundos) se programa
+    # y cada vuelta relee el origen.
+    server = ModelServer(load_risk_model(_data, version), version)
+    if RETRAIN_INTERVAL:
+        server.schedule(read_employees)
+    return server
+
+
+@st.cache_resource(show_spinner="Preparando base SQL...")
+def get_employee_db(_data, version):
+    # Solo con IMPULSO_SQL_BACKEND=1 (ver core/database.py)
+    return EmployeeDB(build_employee_db(_data, version))
+
+
+@st.cache_resource(show_spinner=False)
+def get_kpi_store(_data, version):
+    if SQL_BACKEND:
+        return get_employee_db(_data, version).kpi_store()
+    return KpiStore.from_data(_data)
+
+
+@st.cache_resource(show_spinner=False)
+def get_dashboard_kpis(_data, version):
+    return get_kpi_store(_data, version).metrics()
+
+
+@st.cache_resource(show_spinner=False)
+def get_department_metrics(_data, version):
+    if SQL_BACKEND:
+        return get_employee_db(_data, version).department_metrics()
+    return department_metrics(_data)
+
+
+@st.cache_resource(show_spinner=False)
+def get_risk_histogram(_data, version):
+    return BinnedHistogram.from_data(_data, "risk_score", value_range=(0, 1))
+
+
+@st.cache_resource(show_spinner=False)
+def get_scatter_index(_data, version):
+    return ScatterIndex(_data, "workload", "risk_score", "performance")
+
+
+@st.cache_resource(show_spinner=False)
+def get_employee_store(_data, version):
+    return EmployeeStore(_data)
+
+
+@st.cache_resource(show_spinner=False)
+def get_risk_ranking(_data, version):
+    return RiskRanking(_data)
+
+
+@st.cache_resource(show_spinner="Destilando puntuador rápido...", max_entries=MODEL_CACHE_ENTRIES)
+def get_fast_scorer(_model, _X_processed, version):
+    # La destilación puntúa 100.000 filas: con el RandomForestClassifier, no
+    # con el bosque compacto del arranque
+    model = sklearn_forest(_model)
+    scorer = distill_risk_model(model, _X_processed)
+    return scorer, fidelity_report(model, scorer, _X_processed)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2 * MODEL_CACHE_ENTRIES)
+def get_simulator(_model, _X_processed, _departments, version):
+    return WhatIfSimulator(_model, _X_processed, MODEL_FEATURES, _departments)
+
+
+@st.cache_resource(show_spinner=False)
+def get_alert_engine(_data, version):
+    return AlertEngine(_data, ALERT_RULES)
+
+
+@st.cache_resource(show_spinner=False, max_entries=MODEL_CACHE_ENTRIES)
+def get_drift_report(_data, version, model_version):
+    # model_version = versión de datos con que se entrenó el modelo servido
+    return load_training_reference(model_version).compare(_data)
+
+
+@st.cache_data(show_spinner="Perfilando archivos...")
+def get_quality_report(path, version):
+    # version = huella del archivo (core.data.file_version)
+    return profile_report(load_profile(path), Path(path).name)
+
+
+@st.cache_resource(show_spinner=False)
+def get_export_executor():
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="impulso-export")
+
+
+@st.cache_data(show_spinner="Estimando número de segmentos...")
+def get_segment_silhouettes(_data, version):
+    return segment_silhouettes(_data)
+
+
+@st.cache_data(show_spinner="Calculando segmentos...")
+def get_segments(_data, version, k):
+    return compute_segments(_data, k)
@@ -0,0 +1,219 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from core.drift import save_training_reference
+from core.model import (
+    MODEL_DIR,
+    MODEL_FEATURES,
+    grow_risk_model,
+    model_artifact_path,
+    save_compact_model,
+    save_risk_model,
+    split_holdout,
+    train_risk_model,
+)
+
+# ============================================
+# REENTRENAMIENTO EN SEGUNDO PLANO
+# ============================================
+
+# El ajuste del bosque corre en un subproceso (con prioridad baja) para no
+# competir por el GIL ni por la CPU con los reruns que sirven el dashboard.
+# El candidato se valida contra el modelo actual sobre el mismo holdout y,
+# si no empeora, se publica (modelo, generación) en una única asignación: los
+# reruns en curso siguen usando la instantánea que ya tenían, y la generación
+# que forma las claves de caché siempre corresponde a ese modelo.
+#
+# El holdout es fijo por employee_id (core.model.holdout_mask): ni el modelo
+# actual ni el candidato vieron esas filas, aunque cambien los datos. Cada
+# generación nueva invalida el bosque, el simulador y el puntuador destilado
+# cacheados, así que no se reentrena si los datos no cambiaron y no se publica
+# un candidato que predice exactamente lo mismo que el modelo actual.
+
+RETRAIN_TOLERANCE = 0.01
+RETRAIN_INTERVAL = float(os.environ.get("IMPULSO_RETRAIN_INTERVAL", 0))
+
+
+def holdout_accuracy(bundle, data):
+    preprocess, _, rf = bundle
+    X_processed = preprocess.transform(data[MODEL_FEATURES])
+    _, X_test, _, y_test = split_holdout(X_processed, data["risk_level"], data["employee_id"])
+    return float((rf.predict(X_test) == np.asarray(y_test)).mean())
+
+
+def same_predictions(bundle, candidate, data):
+    X = bundle[0].transform(data[MODEL_FEATURES])
+    # El bosque compacto normaliza sus conteos por su cuenta: puede diferir de
+    # sklearn en el último bit para el mismo modelo
+    return np.allclose(bundle[2].predict_proba(X), candidate[2].predict_proba(X), rtol=0, atol=1e-12)
+
+
+def train_candidate(data, version, model_dir=MODEL_DIR):
+    bundle = train_risk_model(data[MODEL_FEATURES], data["risk_level"], data["employee_id"])
+    path = Path(model_dir) / f"risk_model_{version}.candidate-{os.getpid()}-{time.time_ns()}.joblib"
+    save_risk_model(bundle, path)
+    return str(path), holdout_accuracy(bundle, data)
+
+
+class ModelServer:
+    def __init__(self, bundle, version, model_dir=MODEL_DIR):
+        self._published = (bundle, 1)
+        self.version = version
+        self.model_dir = model_dir
+        # Últimos (datos, versión) leídos del origen; el monitor de deriva los
+        # compara con la referencia del modelo servido (self.version)
+        self.latest_data = None
+        self.history = []
+        self._lock = threading.Lock()
+        self._running = None
+        self._executor = None
+        self._stop = threading.Event()
+
+    def snapshot(self):
+        # Una sola lectura de atributo: modelo y generación siempre coinciden
+        return self._published
+
+    def current(self):
+        return self._published[0]
+
+    @property
+    def generation(self):
+        return self._published[1]
+
+    def is_running(self):
+        return self._running is not None and self._running.is_alive()
+
+    def _start(self, target, *args):
+        with self._lock:
+            if self.is_running():
+                return False
+            self._running = threading.Thread(target=target, args=args, name="impulso-retrain", daemon=True)
+            self._running.start()
+            return True
+
+    def retrain(self, data, version=None):
+        version = version or self.version
+        self.latest_data = (data, version)
+        return self._start(self._retrain, data, version)
+
+    def grow(self, new_data, n_new_trees=60, max_trees=600):
+        # Lote pequeño de empleados nuevos: unos pocos árboles se ajustan en
+        # segundos y liberan el GIL, así que no hace falta un subproceso.
+        return self._start(self._grow, new_data, n_new_trees, max_trees)
+
+    def schedule(self, loader, interval=RETRAIN_INTERVAL):
+        # loader relee el origen en cada vuelta y devuelve (datos, versión)
+        def loop():
+            while not self._stop.wait(interval):
+                self.retrain(*loader())
+
+        threading.Thread(target=loop, name="impulso-retrain-schedule", daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _retrain(self, data, version):
+        import joblib
+
+        started = time.time()
+        if version == self.version:
+            self._record({"accepted": False, "reason": "datos sin cambios"}, started)
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=os.nice,
+                initargs=(10,),
+            )
+        try:
+            path, candidate_acc = self._executor.submit(train_candidate, data, version, self.model_dir).result()
+            bundle, generation = self.snapshot()
+            current_acc = holdout_accuracy(bundle, data)
+            accepted = candidate_acc >= current_acc - RETRAIN_TOLERANCE
+            result = {"current_acc": current_acc, "candidate_acc": candidate_acc}
+            candidate = joblib.load(path) if accepted else None
+            if accepted and same_predictions(bundle, candidate, data):
+                accepted = False
+                result["reason"] = "mismas predicciones que el modelo actual"
+            result["accepted"] = accepted
+            if accepted:
+                # El artefacto aceptado pasa a ser el que carga el próximo arranque
+                os.replace(path, model_artifact_path(version, self.model_dir))
+                save_compact_model(candidate, version, self.model_dir)
+                save_training_reference(data, version, self.model_dir)
+                self.version = version
+                self._published = (candidate, generation + 1)
+            else:
+                os.remove(path)
+        except Exception as exc:
+            result = {"accepted": False, "error": str(exc)}
+        self._record(result, started)
+
+    def _grow(self, new_data, n_new_trees, max_trees):
+        started = time.time()
+        try:
+            bundle, generation = self.snapshot()
+            grown = grow_risk_model(bundle, new_data, n_new_trees, max_trees)
+            self._published = (grown, generation + 1)
+            result = {"accepted": True, "grown": n_new_trees, "trees": len(grown[2].estimators_)}
+        except ValueError as exc:
+            result = {"accepted": False, "error": str(exc)}
+        self._record(result, started)
+
+    def _record(self, result, started):
+        result.update(started=started, seconds=time.time() - started, generation=self.generation)
+        self.history.append(result)
+
+    def status(self):
+        return {
+            "generation": self.generation,
+            "running": self.is_running(),
+            "last": self.history[-1] if self.history else None,
+        }
+
+
+# ============================================
+# REPORTE: CRECIMIENTO INCREMENTAL VS REAJUSTE COMPLETO
+# ============================================
+
+if __name__ == "__main__":
+    # python -m core.retraining: llega un lote de empleados nuevos y se
+    # compara coste y exactitud de reajustar los 600 árboles frente a
+    # añadir árboles sobre el lote (retirando los más antiguos).
+    import pandas as pd
+
+    from core.data import generate_employees
+
+    base = generate_employees(800, seed=123)
+    batch = generate_employees(400, seed=456)
+    holdout = generate_employees(2000, seed=789)
+    bundle = train_risk_model(base[MODEL_FEATURES], base["risk_level"], base["employee_id"])
+    X_holdout = bundle[0].transform(holdout[MODEL_FEATURES])
+
+    def accuracy(rf):
+        return float((rf.predict(X_holdout) == np.asarray(holdout["risk_level"])).mean())
+
+    rows = [{"modo": "modelo actual", "árboles": len(bundle[2].estimators_), "segundos": 0.0, "exactitud": accuracy(bundle[2])}]
+
+    start = time.perf_counter()
+    full = pd.concat([base, batch], ignore_index=True)
+    refit = train_risk_model(full[MODEL_FEATURES], full["risk_level"], full["employee_id"])
+    rows.append({"modo": "reajuste completo", "árboles": len(refit[2].estimators_),
+                 "segundos": time.perf_counter() - start, "exactitud": accuracy(refit[2])})
+
+    for n_new in (60, 150):
+        start = time.perf_counter()
+        grown = grow_risk_model(bundle, batch, n_new_trees=n_new, max_trees=600)
+        rows.append({"modo": f"incremental +{n_new} (retira {n_new})", "árboles": len(grown[2].estimators_),
+                     "segundos": time.perf_counter() - start, "exactitud": accuracy(grown[2])})
+
+    print(pd.DataFrame(rows).to_string(index=False, float_format=lambda v: f"{v:.3f}"))
@@ -0,0 +1,218 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from core.data import RISK_LEVELS
+
+# ============================================
+# EXPLORADOR DE DISPERSIÓN POR EMPLEADO
+# ============================================
+
+# Índice espacial en memoria: rejilla uniforme de GRID_CELLS × GRID_CELLS
+# sobre (x, y). Los puntos se guardan ordenados por celda, así que cada
+# columna de celdas dentro de una vista es un único tramo contiguo, y una
+# tabla de sumas acumuladas da cuántos puntos hay en la vista sin tocarlos.
+# Si la vista cabe en el presupuesto se envían todos sus puntos (WebGL); si
+# no, se envía la densidad por bins más una muestra fija del presupuesto.
+# Cada punto tiene una prioridad aleatoria fija: al acercar la vista la
+# muestra se refina sin que los puntos ya visibles salten.
+
+SCATTER_POINT_BUDGET = int(os.environ.get("IMPULSO_SCATTER_BUDGET", 20_000))
+GRID_CELLS = 256
+DENSITY_BINS = 120
+SCATTER_COLORS = {"Bajo": "#25b5e8", "Medio": "#16337b", "Alto": "#E74C3C"}
+
+
+class ScatterIndex:
+    def __init__(self, data, x="workload", y="risk_score", size="performance", seed=7):
+        self.x_name, self.y_name, self.size_name = x, y, size
+        xs = data[x].to_numpy(dtype=float)
+        ys = data[y].to_numpy(dtype=float)
+        self.bounds = (float(xs.min()), float(xs.max()), float(ys.min()), float(ys.max()))
+
+        gx, gy = self._cell(xs, ys)
+        cell = gx * GRID_CELLS + gy
+        order = np.argsort(cell, kind="stable")
+        self.cell_start = np.searchsorted(cell[order], np.arange(GRID_CELLS * GRID_CELLS + 1))
+        # Suma acumulada 2D con una fila y columna de ceros al inicio
+        counts = np.bincount(cell, minlength=GRID_CELLS * GRID_CELLS).reshape(GRID_CELLS, GRID_CELLS)
+        self.summed = np.zeros((GRID_CELLS + 1, GRID_CELLS + 1), dtype=np.int64)
+        self.summed[1:, 1:] = counts.cumsum(axis=0).cumsum(axis=1)
+
+        level_lookup = {level: i for i, level in enumerate(RISK_LEVELS)}
+        level_codes, level_uniques = pd.factorize(data["risk_level"])
+        level_of_code = np.array([level_lookup.get(u, -1) for u in level_uniques] + [-1], dtype=np.int8)
+        dept_codes, self.departments = pd.factorize(data["department"], sort=True)
+
+        # Columnas en el orden de la rejilla
+        self.position = order
+        self.x = xs[order]
+        self.y = ys[order]
+        self.size = data[size].to_numpy(dtype=float)[order]
+        self.level = level_of_code[level_codes][order]
+        self.dept = dept_codes[order].astype(np.int16)
+        self.priority = np.random.default_rng(seed).random(len(order))[order]
+
+    def _cell(self, xs, ys):
+        x0, x1, y0, y1 = self.bounds
+        gx = np.clip(((xs - x0) / ((x1 - x0) or 1.0) * GRID_CELLS).astype(np.int64), 0, GRID_CELLS - 1)
+        gy = np.clip(((ys - y0) / ((y1 - y0) or 1.0) * GRID_CELLS).astype(np.int64), 0, GRID_CELLS - 1)
+        return gx, gy
+
+    def upper_count(self, x_range=None, y_range=None):
+        # Puntos en las celdas que toca la vista (cota superior, O(1))
+        (cx0, cx1), (cy0, cy1) = self._cell_range(x_range, y_range)
+        s = self.summed
+        return int(s[cx1 + 1, cy1 + 1] - s[cx0, cy1 + 1] - s[cx1 + 1, cy0] + s[cx0, cy0])
+
+    def _cell_range(self, x_range, y_range):
+        x0, x1, y0, y1 = self.bounds
+        x_range = x_range or (x0, x1)
+        y_range = y_range or (y0, y1)
+        gx, gy = self._cell(np.array(x_range, dtype=float), np.array(y_range, dtype=float))
+        return (int(gx[0]), int(gx[1])), (int(gy[0]), int(gy[1]))
+
+    def candidates(self, x_range=None, y_range=None, departments=None, levels=None):
+        # Índices (en orden de rejilla) de los puntos dentro de la vista y los filtros
+        (cx0, cx1), (cy0, cy1) = self._cell_range(x_range, y_range)
+        columns = np.arange(cx0, cx1 + 1) * GRID_CELLS
+        starts = self.cell_start[columns + cy0]
+        ends = self.cell_start[columns + cy1 + 1]
+        lengths = ends - starts
+        # Concatenación de tramos sin bucle: offsets por tramo + arange
+        idx = np.repeat(starts - np.r_[0, np.cumsum(lengths)[:-1]], lengths) + np.arange(lengths.sum())
+
+        keep = np.ones(len(idx), dtype=bool)
+        if x_range is not None:
+            keep &= (self.x[idx] >= x_range[0]) & (self.x[idx] <= x_range[1])
+        if y_range is not None:
+            keep &= (self.y[idx] >= y_range[0]) & (self.y[idx] <= y_range[1])
+        if departments:
+            codes = [i for i, d in enumerate(self.departments) if d in departments]
+            keep &= np.isin(self.dept[idx], codes)
+        if levels:
+            keep &= np.isin(self.level[idx], [RISK_LEVELS.index(level) for level in levels])
+        return idx[keep]
+
+    def view(self, x_range=None, y_range=None, departments=None, levels=None, budget=SCATTER_POINT_BUDGET):
+        idx = self.candidates(x_range, y_range, departments, levels)
+        view = {"total": len(idx), "density": None, "x_range": x_range, "y_range": y_range}
+        if len(idx) > budget:
+            # Muestra estable: los de menor prioridad fija; al acercar entran más
+            sample = idx[np.argpartition(self.priority[idx], budget - 1)[:budget]]
+            view["density"] = self._density(idx, x_range, y_range)
+            idx = sample
+        view["points"] = pd.DataFrame({
+            "position": self.position[idx],
+            self.x_name: self.x[idx],
+            self.y_name: self.y[idx],
+            self.size_name: self.size[idx],
+            "risk_level": np.array(RISK_LEVELS + ["-"], dtype=object)[self.level[idx]],
+        })
+        return view
+
+    def _density(self, idx, x_range, y_range):
+        x0, x1, y0, y1 = self.bounds
+        x_range = x_range or (x0, x1)
+        y_range = y_range or (y0, y1)
+        counts, x_edges, y_edges = np.histogram2d(
+            self.x[idx], self.y[idx], bins=DENSITY_BINS, range=[x_range, y_range]
+        )
+        return x_edges, y_edges, counts
+
+    def figure(self, view, labels=None):
+        import plotly.graph_objects as go
+
+        labels = labels or {}
+        fig = go.Figure()
+        if view["density"] is not None:
+            x_edges, y_edges, counts = view["density"]
+            fig.add_trace(go.Heatmap(
+                x=(x_edges[:-1] + x_edges[1:]) / 2,
+                y=(y_edges[:-1] + y_edges[1:]) / 2,
+                z=np.where(counts.T > 0, np.log1p(counts.T), np.nan),
+                colorscale="Blues",
+                showscale=False,
+                hoverinfo="skip",
+                name="Densidad",
+            ))
+        points = view["points"]
+        lo, hi = (float(points[self.size_name].min()), float(points[self.size_name].max())) if len(points) else (0, 1)
+        for level in RISK_LEVELS:
+            subset = points[points["risk_level"] == level]
+            if subset.empty:
+                continue
+            fig.add_trace(go.Scattergl(
+                x=subset[self.x_name],
+                y=subset[self.y_name],
+                mode="markers",
+                name=level,
+                marker=dict(
+                    color=SCATTER_COLORS[level],
+                    size=3 + 6 * (subset[self.size_name] - lo) / ((hi - lo) or 1.0),
+                    opacity=0.55 if view["density"] is not None else 0.8,
+                ),
+                customdata=subset[[self.size_name]].to_numpy(),
+                hovertemplate=(
+                    f"{labels.get(self.x_name, self.x_name)}: %{{x:.0f}}<br>"
+                    f"{labels.get(self.y_name, self.y_name)}: %{{y:.2f}}<br>"
+                    f"{labels.get(self.size_name, self.size_name)}: %{{customdata[0]:.1f}}<extra>{level}</extra>"
+                ),
+            ))
+        fig.update_layout(
+            xaxis_title=labels.get(self.x_name, self.x_name),
+            yaxis_title=labels.get(self.y_name, self.y_name),
+            legend_title_text="Nivel de riesgo",
+            dragmode="select",
+        )
+        if view["x_range"] is not None:
+            fig.update_xaxes(range=list(view["x_range"]))
+        if view["y_range"] is not None:
+            fig.update_yaxes(range=list(view["y_range"]))
+        return fig
+
+
+if __name__ == "__main__":
+    # python -m core.scatter [miles]: construcción del índice, tiempo por vista
+    # y tamaño de la figura frente a enviar todos los puntos
+    import sys
+    import time
+
+    import plotly.graph_objects as go
+
+    from core.data import generate_employees
+
+    n = int(float(sys.argv[1]) * 1_000) if len(sys.argv) > 1 else 500_000
+    df = generate_employees(n)
+    start = time.perf_counter()
+    index = ScatterIndex(df)
+    print(f"{n:,} empleados · índice en {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    views = [
+        ("Vista completa", None, None, None),
+        ("Carga 120-150 × riesgo > 0.6", (120, 150), (0.6, 1.0), None),
+        ("Zoom fino", (140, 145), (0.70, 0.75), None),
+        ("IT completo", None, None, ["IT"]),
+    ]
+    for label, x_range, y_range, departments in views:
+        start = time.perf_counter()
+        view = index.view(x_range, y_range, departments)
+        fig_json = index.figure(view).to_json()
+        elapsed = time.perf_counter() - start
+        mode = "densidad + muestra" if view["density"] is not None else "todos los puntos"
+        print(f"  {label:30s} {view['total']:>8,} en vista → {len(view['points']):>6,} puntos ({mode}) · "
+              f"{elapsed * 1000:4.0f} ms · {len(fig_json) / 1e6:.2f} MB")
+
+        mask = np.ones(n, dtype=bool)
+        if x_range:
+            mask &= df["workload"].between(*x_range).to_numpy()
+        if y_range:
+            mask &= df["risk_score"].between(*y_range).to_numpy()
+        if departments:
+            mask &= df["department"].isin(departments).to_numpy()
+        assert view["total"] == mask.sum()
+
+    start = time.perf_counter()
+    naive = go.Figure([go.Scattergl(x=df["workload"], y=df["risk_score"], mode="markers")]).to_json()
+    print(f"  Todos los puntos sin reducir: {len(naive) / 1e6:.1f} MB · {(time.perf_counter() - start) * 1000:.0f} ms")
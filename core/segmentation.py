@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+# ============================================
+# SEGMENTACIÓN (CLUSTERING)
+# ============================================
+
+SEGMENT_FEATURES = ["stress", "burnout", "anxiety", "workload", "absenteeism", "performance"]
+SEGMENT_FEATURE_NAMES = {
+    "stress": "estrés",
+    "burnout": "burnout",
+    "anxiety": "ansiedad",
+    "workload": "carga laboral",
+    "absenteeism": "ausentismo",
+    "performance": "desempeño",
+}
+SILHOUETTE_SAMPLE = 5000
+
+
+def scaled_segment_features(data):
+    from sklearn.preprocessing import StandardScaler
+
+    return StandardScaler().fit_transform(data[SEGMENT_FEATURES].to_numpy(dtype=float))
+
+
+def segment_silhouettes(data, ks=tuple(range(2, 9))):
+    # Silueta estimada sobre una muestra: el cálculo exacto es O(n²)
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.metrics import silhouette_score
+
+    X_scaled = scaled_segment_features(data)
+    scores = {}
+    for k in ks:
+        km = MiniBatchKMeans(n_clusters=k, batch_size=2048, n_init=3, random_state=123).fit(X_scaled)
+        scores[k] = float(silhouette_score(
+            X_scaled, km.labels_, sample_size=min(SILHOUETTE_SAMPLE, len(X_scaled)), random_state=123
+        ))
+    return scores
+
+
+def compute_segments(data, k):
+    from sklearn.cluster import MiniBatchKMeans
+
+    X_scaled = scaled_segment_features(data)
+    km = MiniBatchKMeans(n_clusters=k, batch_size=2048, n_init=3, random_state=123).fit(X_scaled)
+
+    # Segmentos numerados de mayor a menor riesgo promedio
+    mean_risk = np.bincount(km.labels_, weights=data["risk_score"].to_numpy(), minlength=k) / np.maximum(
+        np.bincount(km.labels_, minlength=k), 1
+    )
+    order = np.argsort(-mean_risk)
+    rank = np.empty(k, dtype=int)
+    rank[order] = np.arange(k)
+    names = [f"Segmento {i + 1}" for i in range(k)]
+
+    descriptors = []
+    for center in km.cluster_centers_[order]:
+        top = int(np.argmax(np.abs(center)))
+        direction = "Mayor" if center[top] > 0 else "Menor"
+        descriptors.append(f"{direction} {SEGMENT_FEATURE_NAMES[SEGMENT_FEATURES[top]]}")
+
+    # Tabla base de sumas por (segmento, departamento): cualquier vista de la
+    # pestaña se deriva de ella sin volver a recorrer el frame.
+    base = (
+        data[["department"] + SEGMENT_FEATURES]
+        .assign(
+            segment=np.asarray(names)[rank[km.labels_]],
+            high_risk=(data["risk_level"] == "Alto").to_numpy(),
+            burnout_high=(data["burnout"] >= 4).to_numpy(),
+        )
+        .groupby(["segment", "department"], as_index=False)
+        .agg(
+            employees=("stress", "size"),
+            high_risk=("high_risk", "sum"),
+            burnout_high=("burnout_high", "sum"),
+            **{col: (col, "sum") for col in SEGMENT_FEATURES},
+        )
+    )
+    return {"names": names, "descriptors": dict(zip(names, descriptors)), "base": base}
+
+
+def summarize_segments(base, by, segment=None, department=None):
+    rows = base
+    if segment is not None:
+        rows = rows[rows["segment"] == segment]
+    if department is not None:
+        rows = rows[rows["department"] == department]
+    totals = rows.drop(columns=["segment", "department"]).groupby(rows[by]).sum()
+    summary = pd.DataFrame({
+        "name": totals.index,
+        "employees": totals["employees"].astype(int).to_numpy(),
+        "stress_idx": (totals["stress"] / totals["employees"] / 5 * 100).to_numpy(),
+        "burnout_idx": (totals["burnout"] / totals["employees"] / 5 * 100).to_numpy(),
+        "anxiety_idx": (totals["anxiety"] / totals["employees"] / 5 * 100).to_numpy(),
+        "workload": (totals["workload"] / totals["employees"]).to_numpy(),
+        "abs_idx": (totals["absenteeism"] / totals["employees"] / 80 * 100).to_numpy(),
+        "burnout": (totals["burnout_high"] / totals["employees"] * 100).to_numpy(),
+        "risk": (totals["high_risk"] / totals["employees"] * 100).to_numpy(),
+    })
+    return summary.round(1)
@@ -0,0 +1,81 @@
+import inspect
+import os
+import tempfile
+from pathlib import Path
+
+from core.data import data_version, file_version, generate_employees
+from core.files import atomic_write
+
+# ============================================
+# DATASET EN MEMORIA COMPARTIDA
+# ============================================
+
+# Con IMPULSO_SHARED_MEMORY=1 la tabla de empleados se publica una sola vez
+# como archivo Arrow IPC (en /dev/shm cuando existe) y cada proceso la mapea
+# en memoria. pandas 3 envuelve las columnas Arrow sin copiarlas, así que
+# todos los workers leen las mismas páginas y cada sesión solo guarda su
+# estado de filtros: la memoria no crece con el número de usuarios.
+
+SHARED_MEMORY = os.environ.get("IMPULSO_SHARED_MEMORY", "") not in ("", "0")
+SHARED_DIR = Path(os.environ.get(
+    "IMPULSO_SHARED_DIR",
+    "/dev/shm/impulso" if os.path.isdir("/dev/shm") else Path(tempfile.gettempdir()) / "impulso_shared",
+))
+# Sube cuando cambia el formato publicado (tipos, metadatos)
+SHARED_SCHEMA = 1
+
+
+def shared_table_path(name, shared_dir=SHARED_DIR):
+    return Path(shared_dir) / f"{name}.arrow"
+
+
+def publish_table(data, name, metadata=None, shared_dir=SHARED_DIR):
+    import pyarrow as pa
+
+    # El nombre ya identifica el contenido: si existe, es el mismo
+    path = shared_table_path(name, shared_dir)
+    if path.exists():
+        return path
+
+    # Un solo chunk por columna: es lo que permite a to_pandas no copiar
+    table = pa.Table.from_pandas(data, preserve_index=False).combine_chunks()
+    schema_meta = dict(table.schema.metadata or {})
+    schema_meta.update({k.encode(): str(v).encode() for k, v in (metadata or {}).items()})
+    table = table.replace_schema_metadata(schema_meta)
+
+    with atomic_write(path) as tmp_path:
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    return path
+
+
+def open_table(name, shared_dir=SHARED_DIR):
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+    source = pa.memory_map(str(shared_table_path(name, shared_dir)))
+    table = pa.ipc.open_file(source).read_all()
+    str_dtype = pd.StringDtype("pyarrow", na_value=np.nan)
+    string_types = {pa.string(): str_dtype, pa.large_string(): str_dtype}
+    data = table.to_pandas(split_blocks=True, types_mapper=string_types.get)
+    metadata = {k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items() if k != b"pandas"}
+    return data, metadata
+
+
+def load_shared_employees(n=800, seed=123, shared_dir=SHARED_DIR):
+    # La huella del generador (core/data.py) y del formato va en el nombre:
+    # si cambia el código, un archivo viejo no se reutiliza
+    prefix = f"employees_n{n}_s{seed}_"
+    name = f"{prefix}{file_version(inspect.getfile(generate_employees))}_f{SHARED_SCHEMA}"
+    if not shared_table_path(name, shared_dir).exists():
+        df = generate_employees(n, seed)
+        publish_table(df, name, {"data_version": data_version(df)}, shared_dir)
+        # Los procesos que aún mapean una versión anterior conservan sus páginas
+        legacy = shared_table_path(f"employees_n{n}_s{seed}", shared_dir)
+        for stale in [legacy, *Path(shared_dir).glob(f"{prefix}*.arrow")]:
+            if stale != shared_table_path(name, shared_dir):
+                stale.unlink(missing_ok=True)
+    df, metadata = open_table(name, shared_dir)
+    return df, metadata["data_version"]
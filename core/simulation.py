@@ -0,0 +1,95 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from core.data import RISK_LEVELS
+
+# El simulador vive en st.cache_resource durante todo el proceso: los
+# memos se acotan (LRU) para que no crezcan con cada combinación de sliders
+# y, como lo comparten las sesiones, se leen y escriben bajo un lock
+SIM_SLICE_CACHE = 64
+SIM_RESULT_CACHE = 512
+
+# ============================================
+# SIMULADOR DE INTERVENCIONES (WHAT-IF)
+# ============================================
+
+
+class WhatIfSimulator:
+    # Re-puntúa en un solo lote vectorizado únicamente a los empleados del
+    # segmento cuyas features cambian con la intervención. La matriz de
+    # features y las predicciones base se calculan una sola vez por versión
+    # de datos; los segmentos y los escenarios ya evaluados se memorizan.
+
+    def __init__(self, model, X_processed, feature_names, departments):
+        self.model = model
+        # Sin convertir el dtype: con IMPULSO_SHARED_MEMORY la matriz es un
+        # memmap int64 y un cast la copiaría entera en cada proceso
+        self.X = np.asarray(X_processed)
+        self.col = {name: i for i, name in enumerate(feature_names)}
+        self.departments = np.asarray(departments)
+        self.base_pred = model.predict(self.X)
+        self._slices = OrderedDict()
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def slice_index(self, department="Todos", workload_min=None):
+        key = (department, workload_min)
+        cached = self._recall(self._slices, key)
+        if cached is not None:
+            return cached
+        mask = np.ones(len(self.X), dtype=bool)
+        if department != "Todos":
+            mask &= self.departments == department
+        if workload_min is not None:
+            mask &= self.X[:, self.col["workload"]] > workload_min
+        return self._remember(self._slices, key, np.flatnonzero(mask), SIM_SLICE_CACHE)
+
+    def simulate(self, department="Todos", workload_min=None, workload_pct=0.0, stress_delta=0):
+        key = (department, workload_min, float(workload_pct), int(stress_delta))
+        cached = self._recall(self._results, key)
+        if cached is not None:
+            return cached
+
+        idx = self.slice_index(department, workload_min)
+        X_base = self.X[idx]
+        X_new = X_base.astype(float)
+        w, s = self.col["workload"], self.col["stress"]
+        X_new[:, w] = X_new[:, w] * (1 - workload_pct / 100)
+        X_new[:, s] = np.clip(X_new[:, s] - stress_delta, 1, 5)
+
+        before = self.base_pred[idx]
+        after = before.copy()
+        changed = np.any(X_new != X_base, axis=1)
+        if changed.any():
+            # Muchos empleados comparten el mismo vector de features: se puntúa
+            # cada combinación única una vez y se reparte con el índice inverso.
+            uniq, inverse = np.unique(X_new[changed], axis=0, return_inverse=True)
+            after[changed] = self.model.predict(uniq)[inverse.reshape(-1)]
+
+        result = {
+            "employees": int(len(idx)),
+            "rescored": int(changed.sum()),
+            "before": {lvl: int((before == lvl).sum()) for lvl in RISK_LEVELS},
+            "after": {lvl: int((after == lvl).sum()) for lvl in RISK_LEVELS},
+        }
+        result["alto_shift"] = result["after"]["Alto"] - result["before"]["Alto"]
+        return self._remember(self._results, key, result, SIM_RESULT_CACHE)
+
+    def _recall(self, cache, key):
+        # El cálculo corre fuera del lock: dos sesiones pueden calcular el
+        # mismo escenario a la vez, pero el resultado es idéntico
+        with self._lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _remember(self, cache, key, value, max_entries):
+        with self._lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > max_entries:
+                cache.popitem(last=False)
+        return value
@@ -0,0 +1,67 @@
+import sys
+import time
+from contextlib import contextmanager
+
+# ============================================
+# REPORTE DE ARRANQUE
+# ============================================
+
+# Desglose del arranque en frío del proceso: imports, carga de datos y carga
+# del modelo. Cada fase se registra solo la primera vez que se mide, de modo
+# que los reruns posteriores (ya cacheados) no pisan los tiempos en frío.
+
+
+class StartupReport:
+    def __init__(self):
+        self.phases = {}
+        self.notes = {}
+        self._logged = False
+
+    def record(self, name, seconds):
+        self.phases.setdefault(name, seconds)
+
+    def note(self, name, value):
+        self.notes.setdefault(name, value)
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        yield
+        self.record(name, time.perf_counter() - start)
+
+    def summary(self):
+        parts = [f"{name} {seconds:.2f}s" for name, seconds in self.phases.items()]
+        parts += [f"{name}: {value}" for name, value in self.notes.items()]
+        total = sum(self.phases.values())
+        return f"Arranque {total:.2f}s · " + " · ".join(parts)
+
+    def log_once(self):
+        if not self._logged:
+            self._logged = True
+            print(self.summary(), file=sys.stderr)
+
+
+startup_report = StartupReport()
+
+
+if __name__ == "__main__":
+    # Simula un arranque en frío sin servidor: python -m core.startup
+    # (se usa la instancia del módulo importado, la misma que anota core.model)
+    from core.startup import startup_report
+
+    with startup_report.phase("imports"):
+        import numpy  # noqa: F401
+        import pandas  # noqa: F401
+        import plotly.express  # noqa: F401
+        import streamlit  # noqa: F401
+        from core.data import data_version, generate_employees
+        from core.model import load_or_train_risk_model
+
+    with startup_report.phase("datos"):
+        df = generate_employees()
+        version = data_version(df)
+
+    with startup_report.phase("modelo"):
+        load_or_train_risk_model(df, version)
+
+    print(startup_report.summary())
@@ -0,0 +1,1343 @@
+import base64
+from pathlib import Path
+
+import streamlit as st
+
+# ============================================
+# CONFIG DE GRÁFICOS (VISIBILIDAD DE TEXTO)
+# ============================================
+
+def apply_plotly_style(fig, font_color="#16337b", grid_color="#e6e6e6"):
+    fig.update_layout(
+        template="plotly_white",
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(color=font_color, size=14),
+        legend=dict(font=dict(color=font_color), title_font=dict(color=font_color)),
+        transition=dict(duration=500, easing="cubic-in-out"),
+    )
+    fig.update_xaxes(
+        title_font=dict(color=font_color),
+        tickfont=dict(color=font_color),
+        showgrid=True,
+        gridcolor=grid_color,
+        zeroline=False,
+    )
+    fig.update_yaxes(
+        title_font=dict(color=font_color),
+        tickfont=dict(color=font_color),
+        showgrid=True,
+        gridcolor=grid_color,
+        zeroline=False,
+    )
+    return fig
+
+
+def render_dash_card(title, value, sub, delta, icon_text="I", icon_bg="#e8f4fb", accent="#25b5e8"):
+    st.markdown(
+        f"""
+<div class='dash-card'>
+    <div class='dash-delta' style='color:{accent};'>{delta}</div>
+    <div class='dash-icon' style='background:{icon_bg}; color:{accent};'>{icon_text}</div>
+    <div class='dash-title'>{title}</div>
+    <div class='dash-value'>{value}</div>
+    <div class='dash-sub'>{sub}</div>
+</div>
+        """,
+        unsafe_allow_html=True
+    )
+
+
+# ============================================
+# LOGO
+# ============================================
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+
+def load_logo_base64():
+    candidates = [
+        "Herramienta.png",
+        "herramienta.png",
+        "Herramienta.PNG",
+        "herramienta.PNG",
+    ]
+    for name in candidates:
+        path = APP_DIR / name
+        if path.exists():
+            return base64.b64encode(path.read_bytes()).decode("utf-8")
+
+    for path in APP_DIR.iterdir():
+        if path.is_file() and path.stem.lower() == "herramienta" and path.suffix.lower() in {".png", ".jpg", ".jpeg", ".svg"}:
+            return base64.b64encode(path.read_bytes()).decode("utf-8")
+    return ""
+
+
+def render_top_bar(logo_b64):
+    if logo_b64:
+        header_html = f"""
+<div class='top-nav'>
+    <img src="data:image/png;base64,{logo_b64}" class="logo-mark" alt="Impulso" />
+</div>
+"""
+    else:
+        header_html = """
+<div class='top-nav'>
+    <div>Impulso</div>
+</div>
+"""
+
+    st.markdown(header_html, unsafe_allow_html=True)
+
+
+TAB_NAMES = [
+    "Dashboard",
+    "Empleados",
+    "Análisis de Riesgo",
+    "Factores de Riesgo",
+    "Segmentación",
+    "Recomendaciones"
+]
+
+# ============================================
+# ESTILOS GLOBALES IMPULSO
+# ============================================
+
+IMPULSO_CSS = """
+<style>
+
+    /* FONDO TRANSPARENTE (LIMPIO) */
+    html, body, .stApp {
+        background: transparent !important;
+        font-family: 'Montserrat', sans-serif;
+    }
+
+    .stAppViewContainer, .main, .block-container {
+        background: transparent !important;
+    }
+
+    /* SUAVE GRADIENTE MUY SUTIL (casi invisible) */
+    .stApp::before {
+        content: "";
+        position: fixed;
+        inset: 0;
+        background: radial-gradient(1200px 600px at 10% 0%, rgba(37,181,232,0.06), transparent 60%),
+                    radial-gradient(900px 500px at 90% 10%, rgba(22,51,123,0.05), transparent 60%);
+        pointer-events: none;
+        z-index: 0;
+    }
+
+    .block-container { position: relative; z-index: 1; }
+
+    /* ELIMINAR TODA LA SEPARACIÓN SUPERIOR */
+    header[data-testid="stHeader"] {
+        display: none !important;
+    }
+
+    .stAppViewContainer {
+        padding-top: 0 !important;
+        margin-top: 0 !important;
+    }
+
+    .main {
+        padding-top: 0 !important;
+        margin-top: 0 !important;
+    }
+
+    .block-container {
+        padding-top: 0 !important;
+        margin-top: 0 !important;
+    }
+
+    /* FONDO GENERAL */
+
+    /* TOP BAR FULL WIDTH */
+    .top-nav {
+        background-color: #16337b;
+        padding: 24px 40px;
+        color: white;
+        font-size: 34px;
+        font-weight: 700;
+        border-radius: 0 0 16px 16px;
+        margin-bottom: 25px;
+
+        width: 100vw !important;
+        margin-left: calc(-50vw + 50%) !important;
+
+        display: flex;
+        justify-content: flex-start;
+        align-items: center;
+        gap: 14px;
+
+        box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+    }
+
+    .top-nav-right {
+        font-size: 16px;
+        font-weight: 400;
+        opacity: 0.9;
+    }
+
+    .logo-mark {
+        height: 44px;
+        width: auto;
+        display: block;
+    }
+
+    /* TABS */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+        background-color: transparent;
+        padding-left: 0;
+    }
+
+    .stTabs [data-baseweb="tab"] {
+        background-color: #16337b !important;
+        color: white !important;
+        padding: 10px 18px !important;
+        border-radius: 10px 10px 0 0 !important;
+        font-weight: 600 !important;
+        border: none !important;
+        transition: all 0.25s ease-in-out;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.12);
+    }
+
+    .stTabs [data-baseweb="tab"]:hover {
+        background-color: #1d449c !important;
+    }
+
+    .stTabs [aria-selected="true"] {
+        background-color: white !important;
+        color: #16337b !important;
+        border-bottom: 3px solid #16337b !important;
+    }
+
+    /* KPI CARDS */
+    .kpi-card {
+        background: white;
+        padding: 18px 20px;
+        border-radius: 14px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
+        border-top: 4px solid #25b5e8;
+        height: 130px;
+        transition: transform 0.25s ease, box-shadow 0.25s ease;
+    }
+
+    .kpi-card:hover {
+        transform: translateY(-4px);
+        box-shadow: 0 8px 20px rgba(0,0,0,0.15);
+    }
+
+    /* ENTRADA ANIMADA EN CARDS */
+    .kpi-card, .rec-card, .rec-summary-box, .alert-box, .dash-card, .alert-strip {
+        animation: floatIn 0.6s ease both;
+    }
+
+    .kpi-title {
+        font-size: 13px;
+        color: #555;
+        font-weight: 600;
+    }
+
+    .kpi-value {
+        font-size: 30px;
+        font-weight: 700;
+        color: #16337b;
+        margin-top: 6px;
+    }
+
+    .kpi-sub {
+        font-size: 13px;
+        color: #25b5e8;
+        font-weight: 600;
+        margin-top: 2px;
+    }
+
+    /* DASHBOARD CARDS */
+    .dash-card {
+        background: white;
+        padding: 16px 18px;
+        border-radius: 14px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
+        border: 1px solid #e9edf3;
+        min-height: 120px;
+        position: relative;
+        overflow: hidden;
+    }
+
+    .dash-icon {
+        width: 30px;
+        height: 30px;
+        border-radius: 9px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-weight: 700;
+        font-size: 12px;
+        margin-bottom: 8px;
+    }
+
+    .dash-title {
+        font-size: 12px;
+        color: #555;
+        font-weight: 600;
+        margin-bottom: 6px;
+    }
+
+    .dash-value {
+        font-size: 22px;
+        font-weight: 700;
+        color: #16337b;
+    }
+
+    .dash-sub {
+        font-size: 12px;
+        color: #7a8aa0;
+        margin-top: 2px;
+    }
+
+    .dash-delta {
+        position: absolute;
+        top: 12px;
+        right: 14px;
+        font-size: 11px;
+        font-weight: 700;
+    }
+
+    /* STATUS CARDS (EMPLEADOS) */
+    .status-card {
+        background: white;
+        padding: 16px 18px;
+        border-radius: 14px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
+        border: 1px solid #e9edf3;
+        min-height: 110px;
+    }
+
+    .status-title {
+        font-size: 12px;
+        color: #7a8aa0;
+        font-weight: 700;
+        letter-spacing: 0.04em;
+        text-transform: uppercase;
+    }
+
+    .status-pill {
+        display: inline-flex;
+        align-items: center;
+        gap: 8px;
+        font-size: 13px;
+        font-weight: 700;
+        color: #16337b;
+    }
+
+    .status-dot {
+        width: 10px;
+        height: 10px;
+        border-radius: 50%;
+        background: #2ecc71;
+        box-shadow: 0 0 0 4px rgba(46, 204, 113, 0.16);
+        display: inline-block;
+    }
+
+    .status-dot.inactive {
+        background: #b5b5b5;
+        box-shadow: 0 0 0 4px rgba(181, 181, 181, 0.18);
+    }
+
+    .status-value {
+        font-size: 28px;
+        font-weight: 700;
+        color: #16337b;
+        margin-top: 6px;
+    }
+
+    .status-sub {
+        font-size: 12px;
+        color: #7a8aa0;
+        margin-top: 2px;
+    }
+
+    /* EMPLEADOS */
+    .employee-card {
+        background: white;
+        padding: 12px 14px;
+        border-radius: 12px;
+        border: 1px solid #e9edf3;
+        box-shadow: 0 4px 10px rgba(0,0,0,0.06);
+        margin-bottom: 10px;
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+        gap: 10px;
+    }
+
+    .employee-card.selected {
+        border-color: #25b5e8;
+        box-shadow: 0 6px 14px rgba(37,181,232,0.18);
+    }
+
+    .employee-left {
+        display: flex;
+        align-items: center;
+        gap: 10px;
+        min-width: 0;
+    }
+
+    .employee-avatar {
+        width: 38px;
+        height: 38px;
+        border-radius: 50%;
+        background: #edf3ff;
+        color: #16337b;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-weight: 700;
+        font-size: 13px;
+        flex: 0 0 auto;
+        position: relative;
+    }
+
+    .presence-dot {
+        position: absolute;
+        right: -2px;
+        bottom: -2px;
+        width: 10px;
+        height: 10px;
+        border-radius: 50%;
+        background: #2ecc71;
+        border: 2px solid white;
+        box-shadow: 0 0 0 2px rgba(46, 204, 113, 0.18);
+    }
+
+    .presence-dot.inactive {
+        background: #b5b5b5;
+        box-shadow: 0 0 0 2px rgba(181, 181, 181, 0.2);
+    }
+
+    .employee-name {
+        font-size: 13px;
+        font-weight: 700;
+        color: #16337b;
+        white-space: nowrap;
+        overflow: hidden;
+        text-overflow: ellipsis;
+        max-width: 220px;
+    }
+
+    .employee-role {
+        font-size: 12px;
+        color: #7a8aa0;
+    }
+
+    .employee-list-scroll {
+        max-height: 520px;
+        overflow-y: auto;
+        padding-right: 6px;
+    }
+
+    .employee-list-scroll::-webkit-scrollbar {
+        width: 6px;
+    }
+
+    .employee-list-scroll::-webkit-scrollbar-thumb {
+        background: #cbd6e6;
+        border-radius: 999px;
+    }
+
+    .employee-list-scroll::-webkit-scrollbar-track {
+        background: transparent;
+    }
+
+    .risk-pill {
+        font-size: 11px;
+        padding: 3px 8px;
+        border-radius: 999px;
+        font-weight: 700;
+        display: inline-block;
+    }
+
+    .risk-low {
+        background: #e8f7f1;
+        color: #1f7a5c;
+    }
+
+    .risk-mid {
+        background: #fff4e8;
+        color: #8b6a00;
+    }
+
+    .risk-high {
+        background: #ffe9ee;
+        color: #a63545;
+    }
+
+    .profile-card {
+        background: white;
+        padding: 16px 18px;
+        border-radius: 14px;
+        border: 1px solid #e9edf3;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
+        margin-bottom: 12px;
+    }
+
+    .profile-title {
+        font-size: 18px;
+        font-weight: 700;
+        color: #16337b;
+    }
+
+    .profile-sub {
+        font-size: 12px;
+        color: #7a8aa0;
+        margin-top: 2px;
+        margin-bottom: 8px;
+    }
+
+    /* FORM INPUTS */
+    .stTextInput label, .stSelectbox label, .stSlider label {
+        color: #16337b !important;
+        font-weight: 600 !important;
+    }
+
+    .stTextInput input {
+        color: #16337b !important;
+        background: #f5f7fb !important;
+        border: 1px solid #dbe3eb !important;
+    }
+
+    .stTextInput input::placeholder {
+        color: #7a8aa0 !important;
+        opacity: 1 !important;
+    }
+
+    .stSelectbox [data-baseweb="select"] > div {
+        background: #f5f7fb !important;
+        border-color: #dbe3eb !important;
+        color: #16337b !important;
+    }
+
+    .stSelectbox [data-baseweb="select"] span,
+    .stSelectbox [data-baseweb="select"] input {
+        color: #16337b !important;
+    }
+
+    /* MULTISELECT (SEGMENTACIÓN) */
+    .stMultiSelect label {
+        color: #16337b !important;
+        font-weight: 600 !important;
+    }
+
+    .stMultiSelect [data-baseweb="select"] > div {
+        background: #f5f7fb !important;
+        border-color: #dbe3eb !important;
+        color: #16337b !important;
+    }
+
+    .stMultiSelect [data-baseweb="select"] span,
+    .stMultiSelect [data-baseweb="select"] input {
+        color: #16337b !important;
+    }
+
+    .stMultiSelect [data-baseweb="tag"] {
+        background: #eaf0f6 !important;
+        color: #16337b !important;
+        border: 1px solid #d6e2ef !important;
+        box-shadow: none !important;
+    }
+
+    .stMultiSelect [data-baseweb="tag"] span,
+    .stMultiSelect [data-baseweb="tag"] svg {
+        color: #16337b !important;
+    }
+
+    /* ALERTAS */
+    .alert-box {
+        background-color: #dbe3eb;
+        padding: 12px 14px;
+        border-radius: 10px;
+        margin-bottom: 8px;
+        border-left: 6px solid #16337b;
+        font-size: 13px;
+        color: #16337b;
+        transition: transform 0.25s ease;
+    }
+
+    .alert-box:hover {
+        transform: translateX(6px);
+    }
+
+    .alert-strip {
+        border-radius: 10px;
+        padding: 10px 14px;
+        margin-bottom: 10px;
+        font-size: 13px;
+        border: 1px solid transparent;
+    }
+
+    .alert-danger {
+        background: #fff3f4;
+        border-color: #ff6b81;
+        color: #a63545;
+    }
+
+    .alert-warning {
+        background: #fff9e8;
+        border-color: #f2c94c;
+        color: #8b6a00;
+    }
+
+    .alert-info {
+        background: #f0f6ff;
+        border-color: #6aa6ff;
+        color: #1f4b8f;
+    }
+
+    /* TITULOS */
+    .section-title {
+        font-size: 22px;
+        font-weight: 700;
+        color: #16337b;
+        margin-top: 25px;
+        margin-bottom: 10px;
+    }
+
+    /* RECOMENDACIONES */
+    .rec-summary-box {
+        background: white;
+        padding: 18px;
+        border-radius: 14px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
+        text-align: center;
+    }
+
+    .rec-summary-value {
+        font-size: 28px;
+        font-weight: 700;
+        color: #16337b;
+    }
+
+    .rec-summary-label {
+        font-size: 13px;
+        color: #777;
+        margin-top: -6px;
+    }
+
+    .rec-card {
+        background: white;
+        padding: 20px;
+        border-radius: 14px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
+        margin-bottom: 15px;
+        border-left: 6px solid #25b5e8;
+        transition: transform 0.25s ease, box-shadow 0.25s ease;
+    }
+
+    .rec-card:hover {
+        transform: translateY(-4px);
+        box-shadow: 0 8px 20px rgba(0,0,0,0.15);
+    }
+
+    .rec-title {
+        font-size: 18px;
+        font-weight: 700;
+        color: #16337b;
+        margin-bottom: 6px;
+    }
+
+    .rec-meta {
+        font-size: 13px;
+        color: #555;
+        margin-bottom: 10px;
+    }
+
+    .rec-description {
+        font-size: 14px;
+        color: #333;
+        margin-bottom: 12px;
+    }
+
+    .rec-tag {
+        display: inline-block;
+        background-color: #dbe3eb;
+        padding: 4px 10px;
+        border-radius: 8px;
+        font-size: 12px;
+        margin-right: 6px;
+        color: #16337b;
+        font-weight: 600;
+    }
+
+    /* SEGMENTACIÓN */
+    .seg-hero-card {
+        background: white;
+        border: 1px solid #e9edf3;
+        border-radius: 14px;
+        padding: 14px 16px;
+        min-height: 110px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.06);
+    }
+
+    .seg-hero-label {
+        font-size: 11px;
+        font-weight: 700;
+        text-transform: uppercase;
+        letter-spacing: 0.05em;
+    }
+
+    .seg-hero-title {
+        font-size: 18px;
+        font-weight: 700;
+        margin-top: 6px;
+    }
+
+    .seg-hero-sub {
+        font-size: 12px;
+        color: #6f7f96;
+        margin-top: 2px;
+    }
+
+    .seg-hero-card.seg-risk {
+        background: #fff3f4;
+        border-color: #ffd3da;
+    }
+
+    .seg-hero-card.seg-risk .seg-hero-label,
+    .seg-hero-card.seg-risk .seg-hero-title {
+        color: #a63545;
+    }
+
+    .seg-hero-card.seg-sat {
+        background: #f1fbf5;
+        border-color: #cfeedd;
+    }
+
+    .seg-hero-card.seg-sat .seg-hero-label,
+    .seg-hero-card.seg-sat .seg-hero-title {
+        color: #1f7a5c;
+    }
+
+    .seg-hero-card.seg-cap {
+        background: #fff8e7;
+        border-color: #f5e0a6;
+    }
+
+    .seg-hero-card.seg-cap .seg-hero-label,
+    .seg-hero-card.seg-cap .seg-hero-title {
+        color: #8b6a00;
+    }
+
+    .seg-card {
+        background: white;
+        border: 1px solid #e9edf3;
+        border-radius: 14px;
+        padding: 14px 16px;
+        position: relative;
+        min-height: 175px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.06);
+    }
+
+    .seg-card-top {
+        display: flex;
+        align-items: center;
+        gap: 10px;
+    }
+
+    .seg-card-icon {
+        width: 34px;
+        height: 34px;
+        border-radius: 10px;
+        background: #edf3ff;
+        color: #16337b;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-weight: 700;
+        font-size: 14px;
+    }
+
+    .seg-card-title {
+        font-size: 14px;
+        font-weight: 700;
+        color: #16337b;
+    }
+
+    .seg-card-sub {
+        font-size: 12px;
+        color: #7a8aa0;
+    }
+
+    .seg-risk-badge {
+        position: absolute;
+        top: 14px;
+        right: 16px;
+        width: 42px;
+        height: 42px;
+        border-radius: 50%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-weight: 700;
+        font-size: 12px;
+        color: white;
+    }
+
+    .seg-risk-high {
+        background: #ff6b81;
+    }
+
+    .seg-risk-mid {
+        background: #f2c94c;
+        color: #714f00;
+    }
+
+    .seg-risk-low {
+        background: #2ecc71;
+    }
+
+    .seg-metrics {
+        display: grid;
+        grid-template-columns: repeat(2, minmax(0, 1fr));
+        gap: 8px 12px;
+        margin-top: 12px;
+        font-size: 12px;
+        color: #5d6c80;
+    }
+
+    .seg-metrics b {
+        display: block;
+        font-size: 13px;
+        color: #16337b;
+    }
+
+    .seg-sub-card {
+        background: white;
+        border: 1px solid #e9edf3;
+        border-radius: 12px;
+        padding: 14px 16px;
+    }
+
+    .seg-sub-title {
+        font-size: 13px;
+        font-weight: 700;
+        color: #16337b;
+        margin-bottom: 6px;
+    }
+
+    .seg-sub-row {
+        display: flex;
+        justify-content: space-between;
+        font-size: 12px;
+        color: #5d6c80;
+        margin-bottom: 4px;
+    }
+
+    .seg-progress {
+        height: 6px;
+        background: #e9edf3;
+        border-radius: 999px;
+        overflow: hidden;
+        margin-top: 8px;
+    }
+
+    .seg-progress-bar {
+        height: 100%;
+        background: #25b5e8;
+        border-radius: 999px;
+    }
+
+    .seg-capacity-high {
+        color: #a63545;
+        font-weight: 700;
+    }
+
+    .seg-capacity-ok {
+        color: #1f7a5c;
+        font-weight: 700;
+    }
+
+    /* FACTORES DE RIESGO */
+    .fr-summary {
+        background: #eef4ff;
+        border: 1px solid #d7e3ff;
+        border-radius: 14px;
+        padding: 14px 16px;
+        margin-bottom: 14px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.06);
+    }
+
+    .fr-summary-title {
+        font-size: 14px;
+        font-weight: 700;
+        color: #16337b;
+        margin-bottom: 4px;
+    }
+
+    .fr-summary-text {
+        font-size: 12px;
+        color: #5d6c80;
+        margin-bottom: 12px;
+    }
+
+    .fr-summary-grid {
+        display: grid;
+        grid-template-columns: repeat(4, minmax(0, 1fr));
+        gap: 8px;
+    }
+
+    .fr-summary-item {
+        background: white;
+        border: 1px solid #e9edf3;
+        border-radius: 12px;
+        padding: 10px 12px;
+        text-align: center;
+    }
+
+    .fr-summary-value {
+        font-size: 18px;
+        font-weight: 700;
+        color: #16337b;
+    }
+
+    .fr-summary-label {
+        font-size: 11px;
+        color: #7a8aa0;
+    }
+
+    .fr-factor-card {
+        border-radius: 14px;
+        padding: 14px 16px;
+        border: 1px solid #e9edf3;
+        min-height: 120px;
+        position: relative;
+    }
+
+    .fr-factor-top {
+        display: flex;
+        align-items: center;
+        gap: 10px;
+        margin-bottom: 6px;
+    }
+
+    .fr-icon {
+        width: 30px;
+        height: 30px;
+        border-radius: 10px;
+        background: white;
+        border: 1px solid #e9edf3;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-size: 12px;
+        font-weight: 700;
+    }
+
+    .fr-factor-title {
+        font-size: 13px;
+        font-weight: 700;
+        color: #16337b;
+    }
+
+    .fr-factor-desc {
+        font-size: 12px;
+        color: #6f7f96;
+    }
+
+    .fr-factor-pct {
+        position: absolute;
+        right: 16px;
+        top: 14px;
+        font-weight: 700;
+        font-size: 16px;
+    }
+
+    .fr-detail-card {
+        border: 1px solid #e9edf3;
+        border-radius: 14px;
+        overflow: hidden;
+        margin-bottom: 12px;
+        background: white;
+    }
+
+    .fr-detail-header {
+        padding: 12px 16px;
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        border-left: 4px solid transparent;
+    }
+
+    .fr-detail-title {
+        font-size: 14px;
+        font-weight: 700;
+        color: #16337b;
+    }
+
+    .fr-detail-sub {
+        font-size: 12px;
+        color: #6f7f96;
+    }
+
+    .fr-detail-pct {
+        font-size: 18px;
+        font-weight: 700;
+    }
+
+    .fr-metrics {
+        display: grid;
+        grid-template-columns: repeat(3, minmax(0, 1fr));
+        gap: 10px;
+        padding: 10px 16px 8px 16px;
+    }
+
+    .fr-metric-chip {
+        background: #f7f9fc;
+        border: 1px solid #e6edf5;
+        border-radius: 10px;
+        padding: 8px 10px;
+        font-size: 12px;
+        color: #5d6c80;
+    }
+
+    .fr-progress {
+        padding: 0 16px 12px 16px;
+    }
+
+    .fr-progress-track {
+        height: 8px;
+        background: #e9edf3;
+        border-radius: 999px;
+        overflow: hidden;
+        position: relative;
+    }
+
+    .fr-progress-bar {
+        height: 100%;
+        border-radius: 999px;
+    }
+
+    .fr-progress-label {
+        font-size: 11px;
+        color: #7a8aa0;
+        margin-top: 6px;
+        display: flex;
+        justify-content: space-between;
+    }
+
+    /* ANÁLISIS DE RIESGO */
+    .risk-card {
+        background: white;
+        border: 1px solid #e9edf3;
+        border-radius: 14px;
+        padding: 14px 16px;
+        min-height: 120px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.06);
+    }
+
+    .risk-card-top {
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+        margin-bottom: 10px;
+    }
+
+    .risk-icon {
+        width: 34px;
+        height: 34px;
+        border-radius: 10px;
+        background: #edf3ff;
+        color: #16337b;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-weight: 700;
+        font-size: 14px;
+    }
+
+    .risk-tag {
+        padding: 4px 10px;
+        border-radius: 999px;
+        font-size: 11px;
+        font-weight: 700;
+    }
+
+    .risk-tag.high {
+        background: #ffe9ee;
+        color: #a63545;
+    }
+
+    .risk-tag.med {
+        background: #fff4e8;
+        color: #8b6a00;
+    }
+
+    .risk-tag.low {
+        background: #e8f7f1;
+        color: #1f7a5c;
+    }
+
+    .risk-card-value {
+        font-size: 22px;
+        font-weight: 700;
+        color: #16337b;
+    }
+
+    .risk-card-label {
+        font-size: 12px;
+        color: #5d6c80;
+        margin-top: 4px;
+    }
+
+    .risk-card-sub {
+        font-size: 11px;
+        color: #7a8aa0;
+        margin-top: 2px;
+    }
+
+    .risk-panel {
+        background: white;
+        border: 1px solid #e9edf3;
+        border-radius: 14px;
+        padding: 14px 16px;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.06);
+        margin-bottom: 16px;
+    }
+
+    .risk-panel-title {
+        font-size: 14px;
+        font-weight: 700;
+        color: #16337b;
+        margin-bottom: 10px;
+    }
+
+    .risk-table {
+        width: 100%;
+        border-collapse: separate;
+        border-spacing: 0 8px;
+    }
+
+    .risk-table th {
+        text-align: left;
+        font-size: 11px;
+        color: #7a8aa0;
+        font-weight: 700;
+        padding: 4px 10px;
+    }
+
+    .risk-table td {
+        background: #f7f9fc;
+        border: 1px solid #e6edf5;
+        padding: 10px 12px;
+        border-radius: 10px;
+        font-size: 12px;
+        color: #16337b;
+    }
+
+    .risk-chip {
+        padding: 3px 8px;
+        border-radius: 999px;
+        font-size: 11px;
+        font-weight: 700;
+        display: inline-block;
+    }
+
+    .risk-chip.high {
+        background: #ffe9ee;
+        color: #a63545;
+    }
+
+    .risk-chip.med {
+        background: #fff4e8;
+        color: #8b6a00;
+    }
+
+    .risk-chip.low {
+        background: #e8f7f1;
+        color: #1f7a5c;
+    }
+
+    .risk-anim {
+        animation: riseIn 0.65s ease both;
+    }
+
+    .risk-delay-1 { animation-delay: 0.05s; }
+    .risk-delay-2 { animation-delay: 0.12s; }
+    .risk-delay-3 { animation-delay: 0.18s; }
+    .risk-delay-4 { animation-delay: 0.24s; }
+
+    @keyframes riseIn {
+        from { opacity: 0; transform: translateY(10px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+
+    /* RECOMENDACIONES (ACORDEON) */
+    details.rec-accordion {
+        background: white;
+        border-radius: 14px;
+        border: 1px solid #e9edf3;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
+        margin-bottom: 12px;
+        overflow: hidden;
+    }
+
+    details.rec-accordion[open] {
+        box-shadow: 0 8px 18px rgba(0,0,0,0.12);
+    }
+
+    details.rec-accordion > summary {
+        list-style: none;
+        cursor: pointer;
+        padding: 14px 18px;
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+        gap: 14px;
+        font-weight: 700;
+        color: #16337b;
+    }
+
+    details.rec-accordion > summary::-webkit-details-marker {
+        display: none;
+    }
+
+    .rec-summary-left {
+        display: flex;
+        flex-direction: column;
+        gap: 4px;
+        min-width: 0;
+    }
+
+    .rec-summary-meta {
+        font-size: 12px;
+        color: #7a8aa0;
+        font-weight: 600;
+    }
+
+    .rec-priority {
+        padding: 4px 10px;
+        border-radius: 999px;
+        font-size: 11px;
+        font-weight: 700;
+        white-space: nowrap;
+    }
+
+    .priority-high {
+        background: #ffe9ee;
+        color: #a63545;
+    }
+
+    .priority-medium {
+        background: #fff4e8;
+        color: #8b6a00;
+    }
+
+    .priority-low {
+        background: #e8f7f1;
+        color: #1f7a5c;
+    }
+
+    .rec-details {
+        padding: 0 18px 16px 18px;
+        border-top: 1px solid #eef2f7;
+    }
+
+    .rec-details .rec-description {
+        margin: 10px 0 12px 0;
+        color: #333;
+        font-size: 14px;
+    }
+
+    .rec-tags {
+        margin-top: 10px;
+        margin-bottom: 6px;
+    }
+
+    .rec-meta-grid {
+        display: grid;
+        grid-template-columns: repeat(2, minmax(0, 1fr));
+        gap: 8px 18px;
+        font-size: 13px;
+        color: #555;
+    }
+
+    .rec-meta-grid b {
+        color: #16337b;
+    }
+
+    .owner-status {
+        display: inline-flex;
+        align-items: center;
+        gap: 6px;
+        font-weight: 600;
+        color: #16337b;
+    }
+
+    .owner-dot {
+        width: 10px;
+        height: 10px;
+        border-radius: 50%;
+        background: #2ecc71;
+        box-shadow: 0 0 0 3px rgba(46, 204, 113, 0.16);
+        display: inline-block;
+    }
+
+    .owner-dot.inactive {
+        background: #b5b5b5;
+        box-shadow: 0 0 0 3px rgba(181, 181, 181, 0.18);
+    }
+
+    /* TABLA EMPLEADOS */
+    .stDataFrame {
+        background-color: white !important;
+        border-radius: 14px !important;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.08) !important;
+        padding: 10px !important;
+    }
+
+    /* BOTONES */
+    .stButton>button {
+        background-color: #25b5e8;
+        color: white;
+        border-radius: 20px;
+        border: none;
+        padding: 6px 16px;
+        font-weight: 600;
+    }
+
+    /* ANIMACIÓN */
+    .fade-in {
+        animation: fadeIn 0.8s ease-in-out;
+    }
+
+    @keyframes fadeIn {
+        from { opacity: 0; transform: translateY(10px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+
+    @keyframes floatIn {
+        from { opacity: 0; transform: translateY(12px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+
+    /* ANIMACIÓN ENTRADA GRÁFICOS */
+    .stPlotlyChart {
+        animation: chartIn 0.7s ease both;
+    }
+
+    @keyframes chartIn {
+        from { opacity: 0; transform: translateY(12px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+
+    /* GRAFICOS TRANSPARENTES */
+    .js-plotly-plot .plotly .main-svg {
+        background: transparent !important;
+    }
+
+</style>
+"""
+
+
+def apply_global_styles():
+    st.markdown(IMPULSO_CSS, unsafe_allow_html=True)
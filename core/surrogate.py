@@ -0,0 +1,87 @@
+import time
+
+import numpy as np
+
+# ============================================
+# PUNTUADOR RÁPIDO (DESTILADO DEL BOSQUE)
+# ============================================
+
+# Para las rutas interactivas (simulador, re-puntuaciones por filtro) un
+# único árbol de regresión aprende las probabilidades del bosque de 600
+# árboles sobre una muestra sintética grande. Se reporta su concordancia
+# con rf en risk_level; el dashboard elige entre puntuación rápida y completa.
+
+SURROGATE_SAMPLE = 100_000
+SURROGATE_DEPTH = 14
+SURROGATE_MIN_LEAF = 5
+
+
+class DistilledScorer:
+    def __init__(self, tree, classes):
+        self.tree = tree
+        self.classes_ = classes
+
+    def predict_proba(self, X):
+        return self.tree.predict(np.asarray(X, dtype=float))
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+def synthetic_sample(X_processed, n, seed=123):
+    # Mitad uniforme en el rango observado de cada feature (cubre los
+    # escenarios what-if) y mitad filas reales con ruido (cubre la densidad real)
+    rng = np.random.default_rng(seed)
+    X = np.asarray(X_processed)
+    lo, hi = X.min(axis=0), X.max(axis=0)
+    uniform = rng.uniform(lo, hi, (n // 2, X.shape[1]))
+    rows = X[rng.integers(0, len(X), n - n // 2)]
+    jittered = np.clip(rows + rng.normal(0, 0.25, rows.shape) * X.std(axis=0), lo, hi)
+    return np.vstack([uniform, jittered])
+
+
+def distill_risk_model(rf, X_processed, n=SURROGATE_SAMPLE, seed=123):
+    from sklearn.tree import DecisionTreeRegressor
+
+    sample = synthetic_sample(X_processed, n, seed)
+    tree = DecisionTreeRegressor(max_depth=SURROGATE_DEPTH, min_samples_leaf=SURROGATE_MIN_LEAF, random_state=seed)
+    tree.fit(sample, rf.predict_proba(sample))
+    return DistilledScorer(tree, rf.classes_)
+
+
+def fidelity_report(rf, scorer, X_processed, n_eval=20_000, seed=456):
+    X = np.asarray(X_processed)
+    sample = synthetic_sample(X, n_eval, seed)
+
+    start = time.perf_counter()
+    full = rf.predict(sample)
+    full_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    fast = scorer.predict(sample)
+    fast_seconds = time.perf_counter() - start
+
+    return {
+        "agreement": float((rf.predict(X) == scorer.predict(X)).mean()),
+        "agreement_synthetic": float((full == fast).mean()),
+        "full_seconds": full_seconds,
+        "fast_seconds": fast_seconds,
+        "speedup": full_seconds / max(fast_seconds, 1e-9),
+    }
+
+
+if __name__ == "__main__":
+    # python -m core.surrogate: destila el modelo servido e imprime su fidelidad
+    from core.data import data_version, generate_employees
+    from core.model import load_or_train_risk_model, sklearn_forest
+
+    df = generate_employees()
+    preprocess, X_processed, rf = load_or_train_risk_model(df, data_version(df))
+    rf = sklearn_forest(rf)
+    start = time.perf_counter()
+    scorer = distill_risk_model(rf, X_processed)
+    report = fidelity_report(rf, scorer, X_processed)
+    print(f"Destilado en {time.perf_counter() - start:.1f}s")
+    print(f"Concordancia en risk_level: {report['agreement']:.2%} (empleados) · "
+          f"{report['agreement_synthetic']:.2%} (muestra sintética)")
+    print(f"Lote de 20.000 filas: {report['full_seconds'] * 1000:.0f} ms completo · "
+          f"{report['fast_seconds'] * 1000:.1f} ms rápido ({report['speedup']:.0f}x)")
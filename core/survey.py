@@ -0,0 +1,152 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# ENCUESTA DE SALUD MENTAL (survey.csv)
+# ============================================
+
+SURVEY_PATH = Path(__file__).resolve().parent.parent / "survey.csv"
+
+# work_interfere define el objetivo (igual que en ModeloFinal.Rmd), así que
+# no entra como predictora; Timestamp y comments tampoco.
+SURVEY_CATEGORICAL = [
+    "Gender", "Country", "state", "self_employed", "family_history", "treatment",
+    "no_employees", "remote_work", "tech_company", "benefits", "care_options",
+    "wellness_program", "seek_help", "anonymity", "leave", "mental_health_consequence",
+    "phys_health_consequence", "coworkers", "supervisor", "mental_health_interview",
+    "phys_health_interview", "mental_vs_physical", "obs_consequence",
+]
+SURVEY_NUMERIC = ["Age"]
+SURVEY_HASHED = ["Gender", "Country", "state"]
+SURVEY_HASH_FEATURES = 2 ** 10
+SURVEY_MISSING = "NA"
+AGE_RANGE = (15, 80)
+
+
+def load_survey(path=SURVEY_PATH, normalize=True, memo=None):
+    survey = pd.read_csv(path)
+    survey["risk"] = survey["work_interfere"].isin(["Often", "Sometimes"]).astype(int)
+    # Edades imposibles (negativas, 1e11...) pasan a faltantes: se imputan con la mediana
+    survey["Age"] = survey["Age"].where(survey["Age"].between(*AGE_RANGE))
+    if normalize:
+        from core.normalize import SURVEY_NORMALIZERS, normalize_survey
+
+        # Gender, Country y state quedan como categóricas con grafías canónicas
+        survey = normalize_survey(survey, memo=memo)
+        for column in SURVEY_NORMALIZERS:
+            if SURVEY_MISSING not in survey[column].cat.categories:
+                survey[column] = survey[column].cat.add_categories([SURVEY_MISSING])
+    survey[SURVEY_CATEGORICAL] = survey[SURVEY_CATEGORICAL].fillna(SURVEY_MISSING)
+    return survey
+
+
+def _hashing_encoder_class():
+    from sklearn.base import BaseEstimator, TransformerMixin
+
+    class HashingEncoder(TransformerMixin, BaseEstimator):
+        # Equivalente a FeatureHasher sobre tokens "columna=valor", pero cada
+        # valor distinto se hashea una sola vez y la matriz CSR se arma con
+        # los códigos de fila: sin bucles de Python por empleado.
+        def __init__(self, n_features=SURVEY_HASH_FEATURES):
+            self.n_features = n_features
+
+        def fit(self, X, y=None):
+            self.columns_ = list(pd.DataFrame(X).columns)
+            return self
+
+        def transform(self, X):
+            from scipy import sparse
+            from sklearn.utils import murmurhash3_32
+
+            X = pd.DataFrame(X, columns=self.columns_)
+            rows, cols, vals = [], [], []
+            for column in self.columns_:
+                codes, uniques = pd.factorize(X[column])
+                hashes = np.array([murmurhash3_32(f"{column}={u}", seed=0) for u in uniques], dtype=np.int64)
+                index = np.abs(hashes) % self.n_features
+                sign = np.where(hashes >= 0, 1.0, -1.0)
+                present = codes >= 0
+                rows.append(np.flatnonzero(present))
+                cols.append(index[codes[present]])
+                vals.append(sign[codes[present]])
+            matrix = sparse.coo_matrix(
+                (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+                shape=(len(X), self.n_features),
+                dtype=np.float32,
+            )
+            return matrix.tocsr()
+
+        def get_feature_names_out(self, input_features=None):
+            return np.array([f"hash_{i}" for i in range(self.n_features)], dtype=object)
+
+    return HashingEncoder
+
+
+def build_survey_preprocess(mode="sparse", hashed=SURVEY_HASHED, n_hash_features=SURVEY_HASH_FEATURES):
+    # mode="sparse": one-hot CSR de punta a punta (el bosque acepta CSR)
+    # mode="hash": como "sparse", pero las columnas de alta cardinalidad se hashean
+    # mode="dense": matriz densa, equivalente a dummyVars del Rmd
+    from sklearn.compose import ColumnTransformer
+    from sklearn.impute import SimpleImputer
+    from sklearn.preprocessing import OneHotEncoder
+
+    onehot_cols = [c for c in SURVEY_CATEGORICAL if mode != "hash" or c not in hashed]
+    transformers = [
+        ("cat", OneHotEncoder(handle_unknown="ignore", sparse_output=mode != "dense", dtype=np.float32), onehot_cols),
+        ("num", SimpleImputer(strategy="median"), SURVEY_NUMERIC),
+    ]
+    if mode == "hash":
+        transformers.insert(1, ("hash", _hashing_encoder_class()(n_hash_features), list(hashed)))
+    return ColumnTransformer(transformers, sparse_threshold=0.0 if mode == "dense" else 1.0)
+
+
+def train_survey_model(survey, mode="sparse", n_estimators=600):
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.model_selection import train_test_split
+
+    preprocess = build_survey_preprocess(mode)
+    X_processed = preprocess.fit_transform(survey[SURVEY_CATEGORICAL + SURVEY_NUMERIC])
+    X_train, X_test, y_train, y_test = train_test_split(
+        X_processed, survey["risk"], test_size=0.3, random_state=123, stratify=survey["risk"]
+    )
+    # mtry = floor(sqrt(p)) como en el Rmd
+    rf = RandomForestClassifier(n_estimators=n_estimators, max_features="sqrt", random_state=123, n_jobs=-1)
+    rf.fit(X_train, y_train)
+    return preprocess, X_processed, rf, float(rf.score(X_test, y_test))
+
+
+def matrix_nbytes(matrix):
+    if hasattr(matrix, "indptr"):
+        return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+    return np.asarray(matrix).nbytes
+
+
+if __name__ == "__main__":
+    # python -m core.survey [factor]: memoria y tiempo de ajuste del camino
+    # denso frente al disperso y al hasheado. factor replica la encuesta
+    # para simular un volumen mayor de respuestas.
+    import sys
+    import time
+
+    factor = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    survey = load_survey()
+    if factor > 1:
+        survey = pd.concat([survey] * factor, ignore_index=True)
+
+    rows = []
+    for mode in ["dense", "sparse", "hash"]:
+        start = time.perf_counter()
+        preprocess, X_processed, rf, accuracy = train_survey_model(survey, mode, n_estimators=600 if factor == 1 else 100)
+        rows.append({
+            "modo": mode,
+            "filas": X_processed.shape[0],
+            "columnas": X_processed.shape[1],
+            "MB matriz": matrix_nbytes(X_processed) / 1e6,
+            "segundos": time.perf_counter() - start,
+            "exactitud": accuracy,
+        })
+    print(pd.DataFrame(rows).to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+    if factor > 1:
+        print("Nota: con filas replicadas hay copias en train y test; la exactitud no es representativa.")
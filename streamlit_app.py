@@ -0,0 +1,15 @@
+import streamlit as st
+
+# ============================================
+# PUNTO DE ENTRADA ÚNICO
+# ============================================
+
+# Ambas páginas corren en el mismo proceso y comparten, vía core.resources,
+# un solo dataset y un solo modelo en memoria.
+# Uso: streamlit run streamlit_app.py
+
+pages = st.navigation([
+    st.Page("app.py", title="Impulso", default=True),
+    st.Page("app2.py", title="Impulso (versión resumida)", url_path="resumen"),
+])
+pages.run()